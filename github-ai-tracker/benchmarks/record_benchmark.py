@@ -0,0 +1,102 @@
+"""
+Benchmark: pydantic Repository vs slotted RepoRecord on the crawl hot path
+
+Builds N synthetic GitHub search items and compares construction time and
+retained memory of both representations.
+
+Usage:
+    uv run python -m benchmarks.record_benchmark [--items 10000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.models import Repository, RepoRecord
+
+
+def make_items(count: int) -> list[dict]:
+    """產生模擬的 GitHub 搜尋結果"""
+    return [
+        {
+            "name": f"repo-{i}",
+            "full_name": f"owner-{i % 500}/repo-{i}",
+            "description": f"An AI coding tool number {i}",
+            "html_url": f"https://github.com/owner-{i % 500}/repo-{i}",
+            "homepage": f"https://repo-{i}.dev" if i % 3 else "",
+            "stargazers_count": i * 7,
+            "forks_count": i,
+            "open_issues_count": i % 50,
+            "language": "Python",
+            "topics": ["mcp", "claude-code", "llm"],
+            "license": {"name": "MIT License"} if i % 2 else None,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2025-01-15T12:30:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def measure(build, items: list[dict]) -> tuple[float, int]:
+    """
+    回傳 (建立耗時秒數, 保留的記憶體 bytes)
+
+    tracemalloc 會拖慢配置，因此計時與量記憶體分兩次執行。
+    """
+    gc.collect()
+    start = time.perf_counter()
+    objects = build(items)
+    elapsed = time.perf_counter() - start
+    del objects
+
+    gc.collect()
+    tracemalloc.start()
+    objects = build(items)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return elapsed, retained
+
+
+def build_models(items: list[dict]) -> list[Repository]:
+    return [
+        Repository.from_github_response(item, "ai_coding_agents", "mcp", ["MCP"])
+        for item in items
+    ]
+
+
+def build_records(items: list[dict]) -> list[RepoRecord]:
+    return [
+        RepoRecord.from_github_item(item, "ai_coding_agents", "mcp", ["MCP"])
+        for item in items
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=10_000)
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    # 暖機（import / 驗證器初始化）
+    build_models(items[:100])
+    build_records(items[:100])
+
+    model_time, model_mem = measure(build_models, items)
+    record_time, record_mem = measure(build_records, items)
+
+    records = build_records(items)
+    start = time.perf_counter()
+    top = [record.to_repository() for record in records[:50]]
+    boundary_time = time.perf_counter() - start
+
+    print(f"{args.items} items")
+    print(f"  Repository : {model_time * 1000:8.1f} ms  {model_mem / 1024:8.0f} KiB")
+    print(f"  RepoRecord : {record_time * 1000:8.1f} ms  {record_mem / 1024:8.0f} KiB")
+    print(f"  speedup {model_time / record_time:.1f}x, memory {model_mem / record_mem:.1f}x smaller")
+    print(f"  to_repository() for top {len(top)}: {boundary_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
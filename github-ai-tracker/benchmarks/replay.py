@@ -0,0 +1,443 @@
+"""
+Offline replay harness: local stand-ins for the GitHub and Notion APIs
+
+ReplayServer serves recorded (or synthetic) GitHub search pages and a fake
+Notion database from a local HTTP server, so full tracker runs can be
+benchmarked and regression-tested without touching the real APIs.
+
+    fixtures = synthetic_fixtures()
+    with ReplayServer(FakeGitHub(fixtures), FakeNotion()) as server:
+        GitHubClient(base_url=server.github_url, ...)
+        NotionSync(api_base=server.notion_url, ...)
+"""
+
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from src.clients.query_planner import SEARCH_RESULT_CAP, plan_queries
+from src.config import CHINESE_AI_TOPICS, CHINESE_KEYWORDS, TOPICS
+
+# (status, headers, body)
+Response = tuple[int, dict[str, str], bytes]
+
+_PUSHED = re.compile(r"\s*pushed:>(\S+)")
+_FORKS = re.compile(r"\s*forks:>=(\d+)")
+_CREATED = re.compile(r"\s*created:(?:>=(\S+)|(\S+)\.\.(\S+))")
+
+_TRADITIONAL_README = "這個專案提供繁體中文說明，請點選下方連結開始使用，設計與實現都很簡單，歡迎回報問題。"
+_SIMPLIFIED_README = "这个项目提供简体中文说明，请点选下方链接开始使用，设计与实现都很简单，欢迎反馈问题。"
+
+
+def _json(status: int, payload, headers: dict[str, str] | None = None) -> Response:
+    return status, {"Content-Type": "application/json", **(headers or {})}, json.dumps(payload).encode()
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class FakeGitHub:
+    """
+    GitHub REST API 的替身
+
+    - /search/repositories：依 fixtures 回傳分頁結果，帶 ETag（If-None-Match 相同時回 304，
+      不計入額度）與 X-RateLimit-* 標頭，額度用完時回 403
+    - 增量查詢的 `pushed:>` / `forks:>=` 與分片查詢的 `created:` 限定詞會套用在 fixtures 的
+      updated_at / forks_count / created_at 上；與真實 API 一樣只能分頁取得前 1000 筆
+    - /repos/{owner}/{name}/readme：回傳 fixtures 中的 README 原始內容
+    """
+
+    def __init__(self, fixtures: dict, search_limit: int = 5000, window_seconds: float = 60.0):
+        self.search = fixtures.get("search", {})
+        self.readmes = fixtures.get("readmes", {})
+        self.search_limit = search_limit
+        self.window_seconds = window_seconds
+        self._window_start = time.time()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def _quota(self, consume: bool) -> tuple[bool, dict[str, str]]:
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= self.window_seconds:
+                self._window_start = now
+                self._used = 0
+            allowed = self._used < self.search_limit
+            if consume and allowed:
+                self._used += 1
+            headers = {
+                "X-RateLimit-Limit": str(self.search_limit),
+                "X-RateLimit-Remaining": str(self.search_limit - self._used),
+                "X-RateLimit-Reset": str(int(self._window_start + self.window_seconds)),
+            }
+        return allowed, headers
+
+    def _items(self, query: str) -> list[dict]:
+        """取得查詢的所有結果（增量查詢以 fixtures 模擬篩選）"""
+        pushed = _PUSHED.search(query)
+        forks = _FORKS.search(query)
+        created = _CREATED.search(query)
+        base = _CREATED.sub("", _FORKS.sub("", _PUSHED.sub("", query))).strip()
+        items = self.search.get(base, [])
+        if pushed:
+            since = _parse_time(pushed.group(1))
+            items = [item for item in items if _parse_time(item["updated_at"]) > since]
+        if forks:
+            floor = int(forks.group(1))
+            items = [item for item in items if item["forks_count"] >= floor]
+        if created:
+            start = created.group(1) or created.group(2)
+            end = created.group(3) or "9999-12-31"
+            items = [item for item in items if start <= item["created_at"][:10] <= end]
+        return items
+
+    def handle(self, method: str, path: str, params: dict, headers: dict, body: bytes) -> Response:
+        if path == "/rate_limit":
+            _, quota = self._quota(consume=False)
+            return _json(200, {"resources": {"search": {
+                "limit": int(quota["X-RateLimit-Limit"]),
+                "remaining": int(quota["X-RateLimit-Remaining"]),
+                "reset": int(quota["X-RateLimit-Reset"]),
+            }}})
+
+        if path == "/search/repositories":
+            query = params.get("q", "")
+            page = int(params.get("page", 1))
+            per_page = int(params.get("per_page", 30))
+            items = self._items(query)
+            payload = {
+                "total_count": len(items),
+                "items": items[:SEARCH_RESULT_CAP][(page - 1) * per_page:page * per_page],
+            }
+            raw = json.dumps(payload).encode()
+            etag = f'"{hashlib.sha1(raw).hexdigest()}"'
+
+            if headers.get("if-none-match") == etag:
+                _, quota = self._quota(consume=False)
+                return 304, {"ETag": etag, **quota}, b""
+
+            allowed, quota = self._quota(consume=True)
+            if not allowed:
+                return _json(403, {"message": "API rate limit exceeded"}, quota)
+            return 200, {"Content-Type": "application/json", "ETag": etag, **quota}, raw
+
+        match = re.fullmatch(r"/repos/([^/]+/[^/]+)/readme", path)
+        if match:
+            readme = self.readmes.get(match.group(1))
+            if readme is None:
+                return _json(404, {"message": "Not Found"})
+            return 200, {"Content-Type": "text/plain; charset=utf-8"}, readme.encode()
+
+        return _json(404, {"message": "Not Found"})
+
+
+class FakeNotion:
+    """
+    Notion API 的替身（單一資料庫）
+
+    以 token bucket 模擬 Notion 平均 3 req/s 的限制，超過時回 429 與 Retry-After；
+    throttle_every 另外讓每第 N 個請求固定回 429（真實 API 偶爾也會在額度內限流），
+    讓 429 的處理不受機器快慢影響。last_edited_time 與真實 API 一樣只精確到分鐘。
+    """
+
+    BOT_USER_ID = "00000000-0000-0000-0000-00000000b07"
+
+    def __init__(
+        self,
+        requests_per_second: float = 3.0,
+        burst: int = 5,
+        page_size: int = 100,
+        throttle_every: int | None = None,
+    ):
+        self.rate = requests_per_second
+        self.capacity = float(burst)
+        self.page_size = page_size
+        self.throttle_every = throttle_every
+        self._received = 0
+        self.pages: dict[str, dict] = {}
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _admit(self) -> float | None:
+        """取得一個 token，不足時回傳 Retry-After 秒數"""
+        with self._lock:
+            self._received += 1
+            if self.throttle_every and self._received % self.throttle_every == 0:
+                self.throttled += 1
+                return 1 / self.rate
+
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            self.throttled += 1
+            return (1 - self._tokens) / self.rate
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).replace(second=0, microsecond=0).isoformat()
+
+    @staticmethod
+    def _normalize(properties: dict) -> dict:
+        """補上 Notion 回傳時才有的 plain_text"""
+        for value in properties.values():
+            for key in ("title", "rich_text"):
+                for text in value.get(key, []):
+                    text.setdefault("plain_text", text.get("text", {}).get("content", ""))
+        return properties
+
+    def handle(self, method: str, path: str, params: dict, headers: dict, body: bytes) -> Response:
+        retry_after = self._admit()
+        if retry_after is not None:
+            return _json(
+                429,
+                {"object": "error", "code": "rate_limited"},
+                {"Retry-After": f"{retry_after:.2f}"},
+            )
+
+        payload = json.loads(body) if body else {}
+        with self._lock:
+            if method == "POST" and re.fullmatch(r"/v1/databases/[^/]+/query", path):
+                return self._query(payload)
+
+            if method == "GET" and path == "/v1/users/me":
+                return _json(200, {"object": "user", "id": self.BOT_USER_ID, "type": "bot"})
+
+            if method == "POST" and path == "/v1/pages":
+                page = {
+                    "object": "page",
+                    "id": str(uuid.uuid4()),
+                    "last_edited_time": self._now(),
+                    "last_edited_by": {"object": "user", "id": self.BOT_USER_ID},
+                    "properties": self._normalize(payload.get("properties", {})),
+                }
+                self.pages[page["id"].replace("-", "")] = page
+                return _json(200, page)
+
+            match = re.fullmatch(r"/v1/pages/([0-9a-f]+)", path)
+            if method == "PATCH" and match and match.group(1) in self.pages:
+                page = self.pages[match.group(1)]
+                page["properties"].update(self._normalize(payload.get("properties", {})))
+                page["last_edited_time"] = self._now()
+                return _json(200, page)
+
+        return _json(404, {"object": "error", "code": "object_not_found"})
+
+    def _query(self, payload: dict) -> Response:
+        pages = list(self.pages.values())
+        edited = payload.get("filter", {}).get("last_edited_time", {}).get("on_or_after")
+        if edited:
+            since = _parse_time(edited)
+            pages = [page for page in pages if _parse_time(page["last_edited_time"]) >= since]
+
+        start = int(payload.get("start_cursor") or 0)
+        end = start + self.page_size
+        return _json(200, {
+            "object": "list",
+            "results": pages[start:end],
+            "has_more": end < len(pages),
+            "next_cursor": str(end) if end < len(pages) else None,
+        })
+
+
+class ReplayServer:
+    """
+    在 127.0.0.1 的隨機埠上提供 /github 與 /notion 兩個替身 API
+
+    latency 為每個請求額外的延遲秒數，用來模擬網路往返，讓並行度的差異反映在執行時間上。
+    """
+
+    def __init__(self, github: FakeGitHub, notion: FakeNotion, latency: float = 0.0):
+        self.github = github
+        self.notion = notion
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def github_url(self) -> str:
+        return f"{self.url}/github"
+
+    @property
+    def notion_url(self) -> str:
+        return f"{self.url}/notion/v1"
+
+    def __enter__(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _record(self, name: str, status: int) -> None:
+        with self._lock:
+            self.requests[name] += 1
+            self.statuses[status] += 1
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self) -> None:
+                url = urlsplit(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                headers = {key.lower(): value for key, value in self.headers.items()}
+
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if url.path.startswith("/github/"):
+                    path = url.path.removeprefix("/github")
+                    status, response_headers, payload = server.github.handle(
+                        self.command, path, params, headers, body
+                    )
+                    name = "github " + ("/repos/*/readme" if path.endswith("/readme") else path)
+                elif url.path.startswith("/notion/"):
+                    path = url.path.removeprefix("/notion")
+                    status, response_headers, payload = server.notion.handle(
+                        self.command, path, params, headers, body
+                    )
+                    name = f"notion {self.command} " + re.sub(r"/[0-9a-f]{32}|/[0-9a-f-]{36}", "/*", path)
+                else:
+                    status, response_headers, payload = _json(404, {"message": "Not Found"})
+                    name = "unknown"
+
+                server._record(name, status)
+                self.send_response(status)
+                for key, value in response_headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PATCH = _dispatch
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+
+def synthetic_fixtures(seed: int = 0, per_query: int = 100, pool_size: int = 2000) -> dict:
+    """
+    產生可重現的模擬 fixtures
+
+    池中每個 repo 有固定的 1~3 個 topics（與真實情況相同，同一個 repo 在任何查詢中
+    內容都一樣），topic 查詢回傳帶有該 topic 的 repo，依 Fork 數排序取前 per_query 筆。
+    繁體中文搜尋計畫中的每個查詢各抽 per_query 筆，一半配上繁體 README、一半配上簡體 README。
+    """
+    rng = random.Random(seed)
+    all_topics = [topic for topics in TOPICS.values() for topic in topics]
+    pool = []
+    for i in range(pool_size):
+        forks = int(math.exp(rng.uniform(0, 9)))
+        created = datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp() + rng.uniform(0, 5 * 365 * 86400)
+        pool.append({
+            "name": f"repo-{i}",
+            "full_name": f"owner-{i % 300}/repo-{i}",
+            "description": f"Synthetic repository {i}",
+            "html_url": f"https://github.com/owner-{i % 300}/repo-{i}",
+            "homepage": None,
+            "stargazers_count": forks * rng.randint(3, 15),
+            "forks_count": forks,
+            "open_issues_count": rng.randint(0, 200),
+            "language": rng.choice(["Python", "TypeScript", "Go", "Rust", None]),
+            "topics": rng.sample(all_topics, rng.randint(1, 3)),
+            "license": {"name": "MIT License"} if rng.random() < 0.7 else None,
+            "created_at": datetime.fromtimestamp(created, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "updated_at": "2025-01-01T00:00:00Z",
+            "pushed_at": "2025-01-01T00:00:00Z",
+        })
+
+    def by_forks(items: list[dict]) -> list[dict]:
+        return sorted(items, key=lambda item: item["forks_count"], reverse=True)[:per_query]
+
+    search: dict[str, list[dict]] = {
+        f"topic:{topic}": by_forks([item for item in pool if topic in item["topics"]])
+        for topic in all_topics
+    }
+
+    readmes: dict[str, str] = {}
+    for planned in plan_queries(CHINESE_KEYWORDS, CHINESE_AI_TOPICS, qualifier="in:readme"):
+        items = by_forks(rng.sample(pool, per_query))
+        search[planned.query] = items
+        for item in items:
+            readmes.setdefault(
+                item["full_name"],
+                _TRADITIONAL_README if rng.random() < 0.5 else _SIMPLIFIED_README,
+            )
+
+    return {"search": search, "readmes": readmes}
+
+
+def load_fixtures(path: Path | str) -> dict:
+    """讀取以 record_fixtures 錄製的 fixtures"""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+async def record_fixtures(path: Path | str, token: str | None = None) -> dict:
+    """
+    以真實 GitHub API 執行一次完整搜尋，錄製所有搜尋分頁與 README
+
+    只讀取 GitHub，不會寫入 Notion。
+    """
+    from src.clients.github_client import GitHubClient
+
+    pages: dict[str, dict[int, list[dict]]] = {}
+    readmes: dict[str, str] = {}
+
+    async def capture(response) -> None:
+        await response.aread()
+        url = response.request.url
+        if response.status_code != 200:
+            return
+        if url.path == "/search/repositories":
+            page = int(url.params.get("page", 1))
+            pages.setdefault(url.params["q"], {})[page] = response.json()["items"]
+        elif url.path.endswith("/readme"):
+            full_name = url.path.removeprefix("/repos/").removesuffix("/readme")
+            readmes[full_name] = response.text
+
+    async with GitHubClient(token=token, fetch_mode="rest", incremental=False) as client:
+        client._get_client().event_hooks["response"].append(capture)
+        await client.fetch_all_repositories()
+
+    fixtures = {
+        "search": {
+            query: [item for page in sorted(by_page) for item in by_page[page]]
+            for query, by_page in pages.items()
+        },
+        "readmes": readmes,
+    }
+    Path(path).write_text(json.dumps(fixtures, ensure_ascii=False), encoding="utf-8")
+    return fixtures
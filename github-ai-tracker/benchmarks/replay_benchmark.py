@@ -0,0 +1,129 @@
+"""
+Benchmark: full tracker runs against the offline replay harness
+
+Runs the search -> Notion pipeline end to end against ReplayServer and reports
+wall-clock time, request counts per endpoint, 429s and peak memory. Later runs
+reuse the same local database, so they show the effect of the ETag cache,
+the snapshot and the Notion mirror.
+
+Usage:
+    uv run python -m benchmarks.replay_benchmark [--runs 2] [--latency 0.05]
+    uv run python -m benchmarks.replay_benchmark --fixtures data/fixtures.json
+    uv run python -m benchmarks.replay_benchmark --record data/fixtures.json
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.replay import (
+    FakeGitHub,
+    FakeNotion,
+    ReplayServer,
+    load_fixtures,
+    record_fixtures,
+    synthetic_fixtures,
+)
+from src.clients.github_client import GitHubClient
+from src.clients.notion_sync import NotionSync
+from src.pipeline import fetch_and_sync
+from src.storage import NotionMirror, RepositorySnapshot, ResponseCache
+from src.utils.logger import logger
+
+
+async def run_once(
+    server: ReplayServer,
+    db_path: Path,
+    incremental: bool = False,
+    notion_rps: float | None = None,
+) -> dict:
+    """
+    以替身伺服器執行一次完整的搜尋與 Notion 同步
+
+    Returns:
+        本次執行的統計（耗時、各端點請求數、狀態碼、記憶體峰值、同步結果）
+    """
+    requests_before = server.requests.copy()
+    statuses_before = server.statuses.copy()
+
+    cache = ResponseCache(db_path)
+    snapshot = RepositorySnapshot(db_path)
+    mirror = NotionMirror(db_path)
+    notion = NotionSync(
+        token="replay", database_id="replay", mirror=mirror, api_base=server.notion_url
+    )
+    if notion_rps:
+        notion.bucket.rate = notion_rps
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        async with GitHubClient(
+            token="replay",
+            fetch_mode="rest",
+            response_cache=cache,
+            snapshot=snapshot,
+            incremental=incremental,
+            base_url=server.github_url,
+        ) as github:
+            await github.check_rate_limit()
+            repositories, stats = await fetch_and_sync(github, notion)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        cache.close()
+        snapshot.close()
+        mirror.close()
+
+    return {
+        "wall_seconds": round(elapsed, 3),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2),
+        "repositories": len(repositories),
+        "sync": stats,
+        "cache_hits": cache.hits,
+        "cache_misses": cache.misses,
+        "requests": dict(sorted((server.requests - requests_before).items())),
+        "statuses": dict(sorted((server.statuses - statuses_before).items())),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=2, help="連續執行次數（共用同一個資料庫）")
+    parser.add_argument("--latency", type=float, default=0.05, help="每個請求的模擬延遲秒數")
+    parser.add_argument("--incremental", action="store_true", help="第二次之後以增量模式執行")
+    parser.add_argument("--fixtures", type=Path, help="錄製的 fixtures（預設使用模擬資料）")
+    parser.add_argument("--record", type=Path, help="以真實 GitHub API 錄製 fixtures 後結束")
+    parser.add_argument("--search-limit", type=int, default=5000, help="替身 Search API 每分鐘額度")
+    parser.add_argument("--notion-rps", type=float, default=3.0, help="替身 Notion API 的 req/s")
+    args = parser.parse_args()
+
+    if args.record:
+        fixtures = await record_fixtures(args.record)
+        logger.info(f"Recorded {len(fixtures['search'])} queries to {args.record}")
+        return
+
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else synthetic_fixtures()
+    github = FakeGitHub(fixtures, search_limit=args.search_limit)
+    notion = FakeNotion(requests_per_second=args.notion_rps)
+
+    with tempfile.TemporaryDirectory() as tmp, ReplayServer(github, notion, args.latency) as server:
+        db_path = Path(tmp) / "tracker.db"
+        for run in range(1, args.runs + 1):
+            report = await run_once(
+                server,
+                db_path,
+                incremental=args.incremental and run > 1,
+                notion_rps=args.notion_rps,
+            )
+            print(f"--- run {run} ---")
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""Tool-category classification of repositories by their topics"""
+
+import re
+from fnmatch import translate
+from typing import Iterable
+
+from src.config import TOOL_CATEGORY_ALIASES, TOOL_CATEGORY_MAPPING, TOOL_CATEGORY_PATTERNS
+
+_SEPARATORS = re.compile(r"[\s_]+")
+
+
+def normalize_topic(topic: str) -> str:
+    """topic 正規化：小寫、空白與底線轉為連字號"""
+    return _SEPARATORS.sub("-", topic.strip().lower())
+
+
+class ToolClassifier:
+    """
+    依 Topics 判斷工具分類（可多選）
+
+    規則在建立時預先編譯：
+    - 精確對照（TOOL_CATEGORY_MAPPING）與別名（TOOL_CATEGORY_ALIASES）合併成單一 dict
+    - 萬用字元規則（TOOL_CATEGORY_PATTERNS，例如 `*-mcp`）編譯成 regex
+
+    每個不同的 topic 只比對一次規則，結果快取起來；同一個 topic 在數千筆搜尋結果中
+    重複出現時只是一次 dict 查詢，規則再多也只影響第一次遇到該 topic 的成本。
+    """
+
+    def __init__(
+        self,
+        mapping: dict[str, str] | None = None,
+        aliases: dict[str, str] | None = None,
+        patterns: dict[str, str] | None = None,
+    ):
+        mapping = TOOL_CATEGORY_MAPPING if mapping is None else mapping
+        aliases = TOOL_CATEGORY_ALIASES if aliases is None else aliases
+        patterns = TOOL_CATEGORY_PATTERNS if patterns is None else patterns
+
+        self._exact: dict[str, str] = {normalize_topic(topic): cat for topic, cat in mapping.items()}
+        for alias, topic in aliases.items():
+            category = self._exact.get(normalize_topic(topic))
+            if category is None:
+                raise ValueError(f"Alias {alias!r} points to unknown topic {topic!r}")
+            self._exact.setdefault(normalize_topic(alias), category)
+
+        self._patterns = [
+            (re.compile(translate(normalize_topic(pattern))), category)
+            for pattern, category in patterns.items()
+        ]
+        self._cache: dict[str, frozenset[str]] = {}
+
+    def _topic_categories(self, topic: str) -> frozenset[str]:
+        """單一 topic 對應的分類（快取）"""
+        cached = self._cache.get(topic)
+        if cached is not None:
+            return cached
+
+        normalized = normalize_topic(topic)
+        categories = {category for regex, category in self._patterns if regex.match(normalized)}
+        exact = self._exact.get(normalized)
+        if exact:
+            categories.add(exact)
+
+        result = frozenset(categories)
+        self._cache[topic] = result
+        return result
+
+    def categories(self, topics: Iterable[str]) -> set[str]:
+        """一組 topics 的分類集合（供合併時直接做集合運算）"""
+        result: set[str] = set()
+        for topic in topics:
+            result |= self._topic_categories(topic)
+        return result
+
+    def classify(self, topics: Iterable[str]) -> list[str]:
+        """一組 topics 的分類（排序後的列表）"""
+        return sorted(self.categories(topics))
+
+    def classify_batch(self, batch: Iterable[Iterable[str]]) -> list[list[str]]:
+        """
+        一次分類整批搜尋結果
+
+        先解析整批中所有不同的 topic，再組合每筆結果的分類；
+        同一頁結果中重複的 topic 組合（例如都只有 ["mcp"]）共用同一個結果。
+        """
+        by_topics: dict[frozenset[str], list[str]] = {}
+        results = []
+        for topics in batch:
+            key = frozenset(topics)
+            categories = by_topics.get(key)
+            if categories is None:
+                categories = by_topics[key] = self.classify(key)
+            results.append(list(categories))
+        return results
+
+
+# 整個程式共用的分類器（規則來自 src/config.py）
+default_classifier = ToolClassifier()
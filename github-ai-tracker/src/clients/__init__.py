@@ -2,5 +2,6 @@
 
 from .github_client import GitHubClient
 from .notion_sync import NotionSync
+from .notion_transport import NotionTransport, AsyncNotionTransport
 
-__all__ = ["GitHubClient", "NotionSync"]
+__all__ = ["GitHubClient", "NotionSync", "NotionTransport", "AsyncNotionTransport"]
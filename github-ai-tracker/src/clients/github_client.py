@@ -1,7 +1,10 @@
 """GitHub API Client for searching repositories"""
 
 import asyncio
-from typing import AsyncGenerator
+import time
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Awaitable, Callable
 
 import httpx
 
@@ -11,21 +14,68 @@ from src.config import (
     GITHUB_API_VERSION,
     TOPICS,
     MAX_REPOS_PER_ECOSYSTEM,
+    TOPIC_MAX_RESULTS,
     REQUEST_TIMEOUT,
     SEARCH_DELAY_SECONDS,
-    get_tool_categories,
+    SEARCH_CONCURRENCY,
+    GITHUB_MAX_RETRIES,
+    GITHUB_FETCH_MODE,
+    CRAWL_MODE,
+    CHINESE_KEYWORDS,
+    CHINESE_AI_TOPICS,
     EcosystemType,
 )
+from src.classifier import ToolClassifier, default_classifier
+from src.clients.github_graphql import (
+    SEARCH_IDS_QUERY,
+    REPOSITORY_NODES_QUERY,
+    MAX_NODES_PER_QUERY,
+    SORT_QUALIFIERS,
+    node_to_rest_item,
+)
+from src.clients.query_planner import (
+    SEARCH_RESULT_CAP,
+    CreatedRange,
+    PlannedQuery,
+    plan_queries,
+)
+from src.clients.rate_limit import RateLimitGovernor, rate_limit_delay
+from src.models.record import RepoRecord
 from src.models.repository import Repository
+from src.ranking import RankingEngine
+from src.storage.checkpoint import CrawlCheckpoint
+from src.storage.http_cache import ResponseCache
+from src.storage.snapshot import RepositorySnapshot
+from src.utils.chinese import ChineseScript, detect_chinese_script
 from src.utils.logger import logger
+from src.utils.metrics import metrics
+
+# 分片查詢合併後依搜尋的排序方式重新排序
+SORT_KEYS = {
+    "forks": attrgetter("forks_count"),
+    "stars": attrgetter("stargazers_count"),
+    "updated": attrgetter("updated_at"),
+}
 
 
 class GitHubClient:
     """GitHub API 客戶端"""
 
-    def __init__(self, token: str | None = None):
+    def __init__(
+        self,
+        token: str | None = None,
+        fetch_mode: str | None = None,
+        response_cache: ResponseCache | None = None,
+        snapshot: RepositorySnapshot | None = None,
+        incremental: bool | None = None,
+        ranker: RankingEngine | None = None,
+        base_url: str | None = None,
+        classifier: ToolClassifier | None = None,
+        checkpoint: CrawlCheckpoint | None = None,
+        resume: bool = False,
+    ):
         self.token = token or GITHUB_TOKEN
-        self.base_url = GITHUB_API_BASE_URL
+        self.base_url = base_url or GITHUB_API_BASE_URL  # 可指向本地的替身伺服器
         self.headers = {
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": GITHUB_API_VERSION,
@@ -33,89 +83,570 @@ class GitHubClient:
         if self.token:
             self.headers["Authorization"] = f"Bearer {self.token}"
 
+        # 長連線池：所有請求共用同一個 HTTP/2 連線，避免每次搜尋重新握手
+        self._client: httpx.AsyncClient | None = None
+
+        # 所有搜尋請求共用同一個限流器（Search API 額度是整個 token 共用的）
+        self.search_governor = RateLimitGovernor(
+            name="search",
+            max_concurrency=SEARCH_CONCURRENCY,
+            min_interval=SEARCH_DELAY_SECONDS,
+        )
+
+        # GraphQL 模式：搜尋只取 node ID，再以 nodes(ids:) 批次取欄位；
+        # 同一個 repo 在多個 topic 出現時只取一次：每個 node ID 對應取回它的批次 task，
+        # 並行的 topic 搜尋等待同一個 task，不會在對方取回前重複請求
+        self.fetch_mode = fetch_mode or GITHUB_FETCH_MODE
+        if self.fetch_mode == "graphql" and not self.token:
+            logger.warning("GraphQL fetch mode requires a token, falling back to REST")
+            self.fetch_mode = "rest"
+        self.graphql_governor = RateLimitGovernor(
+            name="graphql",
+            max_concurrency=SEARCH_CONCURRENCY,
+        )
+        self._node_fetches: dict[str, asyncio.Task[dict[str, dict]]] = {}
+
+        # README 讀取走 core API 額度（與 Search API 分開計算）；
+        # 同一個 repo 出現在多個查詢時只讀取、判斷一次，判斷結果以 pushed_at 為版本存在快照中
+        self.core_governor = RateLimitGovernor(
+            name="core",
+            max_concurrency=SEARCH_CONCURRENCY,
+        )
+        self._readme_scripts: dict[str, asyncio.Task] = {}
+        self._known_readme_scripts: dict[str, tuple[str, ChineseScript | None]] | None = None
+
+        # REST 搜尋回應的 ETag 快取（None 表示停用）
+        self.response_cache = response_cache
+
+        # 本地 repo 快照：每次搜尋結果都合併進快照；增量模式只查詢
+        # 上次執行後有 push 的 repo，前 N 名改由快照在本地重新計算
+        self.snapshot = snapshot
+        if incremental is None:
+            incremental = CRAWL_MODE == "incremental"
+        if incremental and snapshot is None:
+            logger.warning("Incremental crawl requires a snapshot, falling back to full crawl")
+            incremental = False
+        self.incremental = incremental
+
+        # 前 N 名的排名方式：None 依 Fork 數，否則依 RankingEngine 的動能分數
+        self.ranker = ranker
+
+        # 工具分類：每頁搜尋結果一次分類，topic 的比對結果跨頁快取
+        self.classifier = classifier or default_classifier
+
+        # 爬取檢查點：每個搜尋完成後記錄結果；resume 時已完成的搜尋直接讀回
+        self.checkpoint = checkpoint
+        if resume and checkpoint is None:
+            logger.warning("Resume requires a checkpoint store, crawling from scratch")
+            resume = False
+        self.resume = resume
+
+        # 本次執行由搜尋取得（或由檢查點讀回）的 repo；增量模式下快照補上的其餘 repo
+        # 數據是舊的，寫入歷史時以此區分（不能比較 fetched_at：檢查點保留的是上次執行的時間）
+        self.crawled: set[str] = set()
+        self.failed_searches: list[str] = []
+
+    async def __aenter__(self) -> "GitHubClient":
+        self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """取得共用的 HTTP client（第一次使用時建立）"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=REQUEST_TIMEOUT,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=SEARCH_CONCURRENCY * 2,
+                    max_keepalive_connections=SEARCH_CONCURRENCY * 2,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """關閉連線池"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _send(
+        self,
+        governor: RateLimitGovernor,
+        method: str,
+        path: str,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        經過限流器發送請求；被 rate limit 擋下（403 / 429）時等到額度重置後重試
+
+        等待以 block_until 套用在整個限流器上，並行中的其他請求也會一起暫停，
+        不會在限制解除前繼續撞牆。重試 GITHUB_MAX_RETRIES 次後回傳最後的回應。
+        """
+        client = self._get_client()
+        for attempt in range(GITHUB_MAX_RETRIES + 1):
+            async with governor.slot():
+                response = await client.request(method, path, **kwargs)
+            governor.update(response.headers)
+
+            delay = rate_limit_delay(response, attempt)
+            if delay is None or attempt == GITHUB_MAX_RETRIES:
+                return response
+
+            metrics.incr(f"github.{governor.name}.rate_limited")
+            logger.warning(
+                f"[{governor.name}] Rate limited ({response.status_code}), "
+                f"retrying in {delay:.0f}s"
+            )
+            governor.block_until(time.time() + delay)
+        return response
+
     async def _search_repos(
         self,
         query: str,
         ecosystem: EcosystemType,
         matched_topic: str,
         sort_by: str = "forks",
-        max_results: int = 100,
-    ) -> list[Repository]:
+        max_results: int | None = 100,
+        allow_partial: bool = True,
+    ) -> list[RepoRecord]:
         """
         執行 GitHub 搜尋
 
+        GitHub 單一查詢最多只回傳 1000 筆；需要更多結果（或全部結果）時，
+        結果超過上限的查詢會依建立日期分片（見 _search_sharded）。
+
         Args:
             query: 搜尋查詢字串
             ecosystem: 所屬生態系分類
             matched_topic: 匹配的 topic 名稱
             sort_by: 排序方式 (forks, stars, updated)
-            max_results: 最大回傳數量
+            max_results: 最大回傳數量（None 表示全部）
+            allow_partial: 遇到 422 時回傳已取得的部分結果；
+                False 時改為拋出例外（增量模式不能漏掉差異）
+
+        Returns:
+            RepoRecord 列表（尚未經過 pydantic 驗證）
+        """
+        if max_results is not None and max_results <= SEARCH_RESULT_CAP:
+            repos, _ = await self._search_query(
+                query, ecosystem, matched_topic, sort_by, max_results, allow_partial
+            )
+            return repos
+
+        repos = await self._search_sharded(query, ecosystem, matched_topic, sort_by, allow_partial)
+        if max_results is not None and len(repos) > max_results:
+            repos = sorted(repos, key=SORT_KEYS[sort_by], reverse=True)[:max_results]
+        return repos
+
+    async def _search_sharded(
+        self,
+        query: str,
+        ecosystem: EcosystemType,
+        matched_topic: str,
+        sort_by: str,
+        allow_partial: bool,
+        created: CreatedRange | None = None,
+    ) -> list[RepoRecord]:
+        """
+        取得查詢的全部結果，超過 1000 筆時依建立日期遞迴分片
+
+        每個分片先取第一頁：total_count 在上限內就繼續分頁取完，否則把日期區間
+        切成兩半再各自查詢。兩半並行執行，請求節奏仍由共用的 search_governor 控制；
+        只有被切開的分片會多花一個請求（第一頁）。
+
+        Args:
+            created: 目前的日期分片（None 表示原始查詢，不加 created: 限定詞）
+
+        Returns:
+            所有分片的 RepoRecord（各分片依 sort_by 排序，合併後不保證順序）
+        """
+        shard_query = f"{query} {created.qualifier()}" if created else query
+        halves = (created or CreatedRange()).split()
+        # 無法再切的分片（同一天建立的 repo）直接照常分頁，沿用已取得的第一頁，
+        # 不必先停在第一頁再重新查詢一次
+        repos, total_count = await self._search_query(
+            shard_query,
+            ecosystem,
+            matched_topic,
+            sort_by,
+            SEARCH_RESULT_CAP,
+            allow_partial,
+            truncate=halves is None and allow_partial,
+        )
+        if total_count <= SEARCH_RESULT_CAP:
+            return repos
+
+        if halves is None:
+            if not allow_partial:
+                raise RuntimeError(f"Search shard exceeds {SEARCH_RESULT_CAP} results: {shard_query}")
+            logger.warning(
+                f"Shard '{shard_query}' has {total_count} results, keeping the first {SEARCH_RESULT_CAP}"
+            )
+            return repos
+
+        logger.debug(f"Sharding '{shard_query}' ({total_count} results) by creation date")
+        metrics.incr("github.search.shards", len(halves))
+        results = await asyncio.gather(
+            *(
+                self._search_sharded(query, ecosystem, matched_topic, sort_by, allow_partial, half)
+                for half in halves
+            )
+        )
+        return [repo for shard in results for repo in shard]
+
+    async def _search_query(
+        self,
+        query: str,
+        ecosystem: EcosystemType,
+        matched_topic: str,
+        sort_by: str,
+        max_results: int,
+        allow_partial: bool,
+        truncate: bool = True,
+    ) -> tuple[list[RepoRecord], int]:
+        """
+        執行單一搜尋查詢（最多 1000 筆）
+
+        Args:
+            truncate: False 時若 total_count 超過 max_results，取完第一頁就停止，
+                由呼叫端改用分片查詢
 
         Returns:
-            Repository 列表
+            (RepoRecord 列表, total_count)
         """
-        repos: list[Repository] = []
+        if self.fetch_mode == "graphql":
+            return await self._search_repos_graphql(
+                query, ecosystem, matched_topic, sort_by, max_results, truncate
+            )
+
+        repos: list[RepoRecord] = []
+        total_count = 0
         page = 1
         per_page = min(100, max_results)
 
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            while len(repos) < max_results:
-                url = f"{self.base_url}/search/repositories"
-                params = {
-                    "q": query,
-                    "sort": sort_by,
-                    "order": "desc",
-                    "per_page": per_page,
-                    "page": page,
-                }
-
-                try:
-                    response = await client.get(url, headers=self.headers, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-
-                    items = data.get("items", [])
-                    if not items:
-                        break
-
-                    for item in items:
-                        if len(repos) >= max_results:
-                            break
-
-                        repo_topics = item.get("topics", [])
-                        tool_categories = get_tool_categories(repo_topics)
-
-                        repo = Repository.from_github_response(
-                            data=item,
-                            ecosystem=ecosystem,
-                            matched_topic=matched_topic,
-                            tool_categories=tool_categories,
-                        )
-                        repos.append(repo)
-
-                    total_count = data.get("total_count", 0)
-                    if page * per_page >= total_count:
-                        break
-
-                    page += 1
-                    await asyncio.sleep(SEARCH_DELAY_SECONDS)
-
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 403:
-                        logger.warning(f"Rate limit exceeded, stopping search")
-                        break
-                    elif e.response.status_code == 422:
-                        logger.warning(f"Search validation failed: {e}")
-                        break
-                    else:
-                        logger.error(f"HTTP error: {e}")
+        while len(repos) < max_results:
+            params = {
+                "q": query,
+                "sort": sort_by,
+                "order": "desc",
+                "per_page": per_page,
+                "page": page,
+            }
+
+            try:
+                data = await self._get_search_page(params)
+
+                total_count = data.get("total_count", 0)
+                if not truncate and total_count > max_results:
+                    break
+
+                items = data.get("items", [])[:max_results - len(repos)]
+                if not items:
+                    break
+
+                categories = self.classifier.classify_batch(
+                    item.get("topics", []) for item in items
+                )
+                repos.extend(
+                    RepoRecord.from_github_item(
+                        data=item,
+                        ecosystem=ecosystem,
+                        matched_topic=matched_topic,
+                        tool_categories=tool_categories,
+                    )
+                    for item, tool_categories in zip(items, categories)
+                )
+
+                if page * per_page >= total_count:
+                    break
+
+                page += 1
+
+            except httpx.HTTPStatusError as e:
+                # rate limit 已在 _send 等待重試；仍失敗時拋出，
+                # 不把不完整的結果當成完成（檢查點才能在 --resume 時重試這個搜尋）
+                if e.response.status_code == 422:
+                    if not allow_partial:
                         raise
-                except httpx.RequestError as e:
-                    logger.error(f"Request error: {e}")
+                    logger.warning(f"Search validation failed: {e}")
+                    break
+                else:
+                    logger.error(f"HTTP error: {e}")
                     raise
+            except httpx.RequestError as e:
+                logger.error(f"Request error: {e}")
+                raise
+
+        return repos, total_count
 
+    async def _get_search_page(self, params: dict) -> dict:
+        """
+        取得一頁搜尋結果（有快取時帶 If-None-Match，304 直接使用快取內容）
+        """
+        path = "/search/repositories"
+        cache_key = ResponseCache.make_key(path, params) if self.response_cache else None
+        cached = self.response_cache.get(cache_key) if self.response_cache else None
+        headers = {"If-None-Match": cached.etag} if cached else None
+
+        with metrics.span("github.search_page", query=params["q"], page=params["page"]):
+            response = await self._send(
+                self.search_governor, "GET", path, params=params, headers=headers
+            )
+        metrics.incr(f"github.search.{response.status_code}")
+
+        if response.status_code == 304 and cached:
+            # 304 不計入額度
+            self.search_governor.refund()
+            self.response_cache.hits += 1
+            return cached.body
+
+        response.raise_for_status()
+        data = response.json()
+
+        if self.response_cache:
+            self.response_cache.misses += 1
+            etag = response.headers.get("etag")
+            if etag:
+                self.response_cache.put(cache_key, path, etag, data)
+
+        return data
+
+    async def _graphql(self, query: str, variables: dict) -> dict:
+        """發送 GraphQL 請求，回傳 data 欄位"""
+        with metrics.span("github.graphql"):
+            response = await self._send(
+                self.graphql_governor,
+                "POST",
+                "/graphql",
+                json={"query": query, "variables": variables},
+            )
+        response.raise_for_status()
+        payload = response.json()
+
+        if payload.get("errors"):
+            messages = "; ".join(err.get("message", "") for err in payload["errors"])
+            if payload.get("data") is None:
+                raise RuntimeError(f"GraphQL error: {messages}")
+            # 部分 node 失敗（例如已刪除的 repo）時仍使用其餘資料
+            logger.warning(f"GraphQL partial error: {messages}")
+
+        return payload["data"]
+
+    async def _search_node_ids(
+        self,
+        query: str,
+        sort_by: str,
+        max_results: int,
+        truncate: bool = True,
+    ) -> tuple[list[str], int]:
+        """
+        以 GraphQL search 只取回 repository node ID
+
+        Returns:
+            (node ID 列表, repositoryCount)；truncate 為 False 且結果超過 max_results 時
+            不取回 ID
+        """
+        search_query = f"{query} {SORT_QUALIFIERS.get(sort_by, '')}".strip()
+        node_ids: list[str] = []
+        total_count = 0
+        cursor = None
+
+        while len(node_ids) < max_results:
+            data = await self._graphql(
+                SEARCH_IDS_QUERY,
+                {
+                    "q": search_query,
+                    "first": min(100, max_results - len(node_ids)),
+                    "after": cursor,
+                },
+            )
+            search = data["search"]
+            total_count = search.get("repositoryCount", 0)
+            if not truncate and total_count > max_results:
+                return [], total_count
+            node_ids.extend(node["id"] for node in search["nodes"] if node)
+
+            if not search["pageInfo"]["hasNextPage"]:
+                break
+            cursor = search["pageInfo"]["endCursor"]
+
+        return node_ids[:max_results], total_count
+
+    async def _fetch_node_batch(self, batch: list[str]) -> dict[str, dict]:
+        """取回一批 node 的欄位（失敗時移除登記，之後的搜尋可以重試）"""
+        try:
+            data = await self._graphql(REPOSITORY_NODES_QUERY, {"ids": batch})
+        except BaseException:
+            for node_id in batch:
+                self._node_fetches.pop(node_id, None)
+            raise
+        return {node["id"]: node_to_rest_item(node) for node in data["nodes"] if node}
+
+    async def _fetch_nodes(self, node_ids: list[str]) -> list[dict]:
+        """
+        批次取回 repository 欄位（已取過或正在取的 node 不重複請求）
+
+        Returns:
+            REST item 格式的 dict 列表，順序與 node_ids 相同
+        """
+        missing = [node_id for node_id in dict.fromkeys(node_ids) if node_id not in self._node_fetches]
+        for i in range(0, len(missing), MAX_NODES_PER_QUERY):
+            batch = missing[i:i + MAX_NODES_PER_QUERY]
+            task = asyncio.ensure_future(self._fetch_node_batch(batch))
+            for node_id in batch:
+                self._node_fetches[node_id] = task
+
+        # shield：這個搜尋被取消時不取消其他搜尋也在等待的批次
+        tasks = list(dict.fromkeys(self._node_fetches[node_id] for node_id in node_ids))
+        results = await asyncio.gather(
+            *(asyncio.shield(task) for task in tasks), return_exceptions=True
+        )
+        items: dict[str, dict] = {}
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            items.update(result)
+        return [items[node_id] for node_id in node_ids if node_id in items]
+
+    async def _search_repos_graphql(
+        self,
+        query: str,
+        ecosystem: EcosystemType,
+        matched_topic: str,
+        sort_by: str,
+        max_results: int,
+        truncate: bool = True,
+    ) -> tuple[list[RepoRecord], int]:
+        """GraphQL 版的 _search_query：先搜尋 ID，再批次取欄位"""
+        node_ids, total_count = await self._search_node_ids(query, sort_by, max_results, truncate)
+        items = await self._fetch_nodes(node_ids)
+
+        categories = self.classifier.classify_batch(item.get("topics", []) for item in items)
+        repos = [
+            RepoRecord.from_github_item(
+                data=item,
+                ecosystem=ecosystem,
+                matched_topic=matched_topic,
+                tool_categories=tool_categories,
+            )
+            for item, tool_categories in zip(items, categories)
+        ]
+        return repos, total_count
+
+    async def _search_tracked(
+        self,
+        query: str,
+        ecosystem: EcosystemType,
+        matched_topic: str,
+        max_results: int | None,
+        fork_floor: int = 0,
+        accept: Callable[[list[RepoRecord]], Awaitable[list[RepoRecord]]] | None = None,
+    ) -> list[RepoRecord]:
+        """
+        執行一組搜尋並合併進快照
+
+        增量模式下若此查詢曾成功執行過，只查詢之後有 push 的 repo（取回全部差異，
+        超過 1000 筆時自動分片）；
+        fork_floor 為快照中目前第 N 名的 Fork 數，低於此數的 repo 不可能進榜，
+        直接在查詢中排除以減少分頁。accept 在寫入快照前篩選搜尋結果。
+        完成後記錄檢查點；resume 時已完成的搜尋直接讀回檢查點中的結果。
+
+        Returns:
+            本次搜尋取得的 RepoRecord 列表（增量模式下只有差異）
+        """
+        scope = f"{ecosystem}:{query}"
+        if self.resume:
+            completed = self.checkpoint.load(scope)
+            if completed is not None:
+                logger.info(f"Resuming: '{scope}' already completed ({len(completed)} repositories)")
+                metrics.incr("github.checkpoint.resumed")
+                self.crawled.update(repo.full_name for repo in completed)
+                return completed
+
+        started_at = datetime.now(timezone.utc)
+        last_run = self.snapshot.get_last_run(scope) if self.incremental else None
+
+        if last_run:
+            query = f"{query} pushed:>{last_run:%Y-%m-%dT%H:%M:%SZ}"
+            if fork_floor > 0:
+                query = f"{query} forks:>={fork_floor}"
+            max_results = None
+
+        repos = await self._search_repos(
+            query=query,
+            ecosystem=ecosystem,
+            matched_topic=matched_topic,
+            sort_by="forks",
+            max_results=max_results,
+            allow_partial=not self.incremental,
+        )
+        if accept:
+            repos = await accept(repos)
+
+        # 成功完成才推進 last_run，失敗時下次仍從上次的時間點查起
+        if self.snapshot:
+            self.snapshot.upsert(ecosystem, repos)
+            self.snapshot.set_last_run(scope, started_at)
+        if self.checkpoint:
+            self.checkpoint.save(scope, repos)
+        self.crawled.update(repo.full_name for repo in repos)
         return repos
 
+    def _fork_floor(self, ecosystem: str, max_results: int) -> int:
+        """
+        快照中目前第 N 名的 Fork 數（快照不足 N 筆時為 0）
+
+        依動能分數排名時 Fork 少的新專案也可能進榜，因此不設下限。
+        """
+        if not self.incremental or self.ranker:
+            return 0
+        top = self.snapshot.top(ecosystem, max_results)
+        return top[-1].forks_count if len(top) >= max_results else 0
+
+    def _select_top(self, repos, limit: int | None = None) -> list:
+        """
+        依排名方式排序並取前 N 名（未設定 ranker 時依 Fork 數）
+
+        只讀取欄位，Repository 與 RepoRecord 都適用。
+        """
+        if self.ranker:
+            return self.ranker.rank(list(repos), limit)
+        return sorted(repos, key=lambda r: r.forks_count, reverse=True)[:limit]
+
+    def _snapshot_top(self, ecosystem: str, limit: int) -> list[Repository]:
+        """由快照重新計算某生態系的前 N 名"""
+        if self.ranker:
+            return self.ranker.rank(self.snapshot.top(ecosystem), limit)
+        return self.snapshot.top(ecosystem, limit)
+
+    async def _search_topic(
+        self,
+        ecosystem: EcosystemType,
+        topic: str,
+        fork_floor: int = 0,
+    ) -> list[RepoRecord]:
+        """搜尋單一 topic（錯誤只記錄，不中斷其他 topic）"""
+        logger.info(f"[{ecosystem}] Searching topic: {topic}")
+
+        try:
+            with metrics.span("github.search_topic", ecosystem=ecosystem, topic=topic):
+                return await self._search_tracked(
+                    query=f"topic:{topic}",
+                    ecosystem=ecosystem,
+                    matched_topic=topic,
+                    max_results=TOPIC_MAX_RESULTS or None,
+                    fork_floor=fork_floor,
+                )
+        except Exception as e:
+            logger.error(f"Error searching topic '{topic}': {e}")
+            self.failed_searches.append(f"{ecosystem}:{topic}")
+            return []
+
     async def search_ecosystem(
         self,
         ecosystem: EcosystemType,
@@ -125,6 +656,8 @@ class GitHubClient:
         """
         搜尋單一生態系，合併所有 topics 後取 Fork 數前 N 名
 
+        各 topic 並行搜尋，請求節奏由共用的 search_governor 控制。
+
         Args:
             ecosystem: 生態系名稱
             topics: 該生態系的 topics 列表
@@ -133,46 +666,109 @@ class GitHubClient:
         Returns:
             該生態系 Fork 數前 N 名的 Repository 列表
         """
-        all_repos: dict[str, Repository] = {}
-
-        for topic in topics:
-            logger.info(f"[{ecosystem}] Searching topic: {topic}")
+        all_repos: dict[str, RepoRecord] = {}
 
-            try:
-                repos = await self._search_repos(
-                    query=f"topic:{topic}",
-                    ecosystem=ecosystem,
-                    matched_topic=topic,
-                    sort_by="forks",
-                    max_results=100,  # 每個 topic 先抓 100 個
-                )
+        logger.info(f"{'='*20} {ecosystem} ({len(topics)} topics) {'='*20}")
+        fork_floor = self._fork_floor(ecosystem, max_results)
+        results = await asyncio.gather(
+            *(self._search_topic(ecosystem, topic, fork_floor) for topic in topics)
+        )
 
-                for repo in repos:
-                    if repo.full_name not in all_repos:
-                        all_repos[repo.full_name] = repo
-                    else:
-                        # 合併 tool_categories
-                        existing = all_repos[repo.full_name]
-                        existing.tool_categories = list(
-                            set(existing.tool_categories + repo.tool_categories)
-                        )
+        if self.incremental:
+            # 差異已合併進快照，由快照重新計算前 N 名
+            top_repos = self._snapshot_top(ecosystem, max_results)
+            delta = sum(len(repos) for repos in results)
+            logger.info(
+                f"[{ecosystem}] Merged {delta} changed repositories, "
+                f"top {len(top_repos)} from snapshot"
+            )
+            return top_repos
 
-                await asyncio.sleep(SEARCH_DELAY_SECONDS)
+        # 依 topics 原本的順序合併，結果與執行完成順序無關；
+        # tool_categories 以集合合併，最後才轉回排序後的列表
+        categories: dict[str, set[str]] = {}
+        for repos in results:
+            for repo in repos:
+                if repo.full_name not in all_repos:
+                    all_repos[repo.full_name] = repo
+                    categories[repo.full_name] = set(repo.tool_categories)
+                else:
+                    categories[repo.full_name].update(repo.tool_categories)
 
-            except Exception as e:
-                logger.error(f"Error searching topic '{topic}': {e}")
-                continue
+        for full_name, repo in all_repos.items():
+            if len(categories[full_name]) != len(repo.tool_categories):
+                repo.tool_categories = sorted(categories[full_name])
 
-        # 依 Fork 數排序，取前 N 名
-        sorted_repos = sorted(
-            all_repos.values(),
-            key=lambda r: r.forks_count,
-            reverse=True,
-        )[:max_results]
+        # 依 Fork 數（或動能分數）排序，取前 N 名；只有進榜的才做完整驗證
+        sorted_repos = [
+            record.to_repository()
+            for record in self._select_top(all_repos.values(), max_results)
+        ]
 
-        logger.info(f"[{ecosystem}] Top {len(sorted_repos)} repositories by forks")
+        logger.info(f"[{ecosystem}] Top {len(sorted_repos)} repositories")
         return sorted_repos
 
+    async def _fetch_readme(self, full_name: str) -> str | None:
+        """取得 README 原始內容（沒有 README 時回傳 None）"""
+        with metrics.span("github.readme"):
+            response = await self._send(
+                self.core_governor,
+                "GET",
+                f"/repos/{full_name}/readme",
+                headers={"Accept": "application/vnd.github.raw+json"},
+            )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.text
+
+    async def _detect_readme_script(
+        self,
+        full_name: str,
+        pushed_at: str | None = None,
+    ) -> ChineseScript | None:
+        try:
+            script = detect_chinese_script(await self._fetch_readme(full_name))
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to read README of {full_name}: {e}")
+            return None
+        # 讀取失敗不記錄，下次執行重試
+        if self.snapshot and pushed_at:
+            self.snapshot.record_readme_script(full_name, pushed_at, script)
+        return script
+
+    def _cached_readme_script(
+        self,
+        full_name: str,
+        pushed_at: str | None,
+    ) -> tuple[bool, ChineseScript | None]:
+        """查詢快照中的 README 判斷結果（pushed_at 相同才沿用）"""
+        if not self.snapshot or not pushed_at:
+            return False, None
+        if self._known_readme_scripts is None:
+            self._known_readme_scripts = self.snapshot.load_readme_scripts()
+        known = self._known_readme_scripts.get(full_name)
+        if known is None or known[0] != pushed_at:
+            return False, None
+        return True, known[1]
+
+    async def readme_script(self, full_name: str, pushed_at: str | None = None) -> ChineseScript | None:
+        """
+        判斷 repo 的 README 是繁體或簡體中文
+
+        同一個 repo 只讀取一次；上次執行判斷過且之後沒有新的 push（pushed_at 相同）時
+        直接沿用快照中的結果，不再讀取 README。
+        """
+        task = self._readme_scripts.get(full_name)
+        if task is None:
+            cached, script = self._cached_readme_script(full_name, pushed_at)
+            if cached:
+                metrics.incr("github.readme_cached")
+                return script
+            task = asyncio.ensure_future(self._detect_readme_script(full_name, pushed_at))
+            self._readme_scripts[full_name] = task
+        return await task
+
     async def search_chinese_projects(
         self,
         max_results: int = MAX_REPOS_PER_ECOSYSTEM,
@@ -180,106 +776,161 @@ class GitHubClient:
         """
         搜尋 README 含有繁體中文的 AI 相關專案
 
+        CHINESE_KEYWORDS x CHINESE_AI_TOPICS 的矩陣先由 plan_queries 合併成
+        少數幾個 OR 查詢並行執行；關鍵字命中不代表是繁體中文（例如簡體文件提到「台灣」），
+        因此每個結果再讀取 README，在本地判斷字形後只保留繁體中文專案。
+
         Returns:
             繁體中文專案列表（依 Fork 數排序）
         """
         logger.info("[chinese_traditional] Searching for Traditional Chinese projects...")
 
-        # 搜尋關鍵字：繁體中文常見詞彙 + AI 相關
-        chinese_keywords = [
-            "繁體中文",
-            "台灣",
-            "中文說明",
-            "Chinese README",
-        ]
-
-        ai_topics = ["llm", "ai", "chatgpt", "gpt", "langchain", "ollama"]
+        plan = plan_queries(CHINESE_KEYWORDS, CHINESE_AI_TOPICS, qualifier="in:readme")
+        all_repos: dict[str, RepoRecord] = {}
+        fork_floor = self._fork_floor("chinese_traditional", max_results)
 
-        all_repos: dict[str, Repository] = {}
+        async def search(planned: PlannedQuery) -> list[RepoRecord]:
+            logger.info(f"[chinese_traditional] Searching: {planned.query}")
 
-        for keyword in chinese_keywords:
-            for ai_topic in ai_topics[:3]:  # 限制組合數量
-                query = f"{keyword} {ai_topic} in:readme"
-                logger.info(f"[chinese_traditional] Searching: {keyword} + {ai_topic}")
+            async def accept(records: list[RepoRecord]) -> list[RepoRecord]:
+                scripts = await asyncio.gather(
+                    *(self.readme_script(record.full_name, record.pushed_at) for record in records)
+                )
+                kept = []
+                for record, script in zip(records, scripts):
+                    if script != "traditional":
+                        continue
+                    # 以 repo 本身的 topics 判斷命中哪個 AI topic
+                    topic = next((t for t in planned.topics if t in record.topics), planned.topics[0])
+                    record.matched_topic = f"chinese-{topic}"
+                    kept.append(record)
+                return kept
 
-                try:
-                    repos = await self._search_repos(
-                        query=query,
+            try:
+                with metrics.span("github.search_chinese", query=planned.query):
+                    return await self._search_tracked(
+                        query=planned.query,
                         ecosystem="chinese_traditional",  # type: ignore
-                        matched_topic=f"chinese-{ai_topic}",
-                        sort_by="forks",
-                        max_results=30,
+                        matched_topic=f"chinese-{planned.topics[0]}",
+                        max_results=100,
+                        fork_floor=fork_floor,
+                        accept=accept,
                     )
+            except Exception as e:
+                logger.error(f"Error searching Chinese projects: {e}")
+                self.failed_searches.append(f"chinese_traditional:{planned.query}")
+                return []
 
-                    for repo in repos:
-                        if repo.full_name not in all_repos:
-                            all_repos[repo.full_name] = repo
+        results = await asyncio.gather(*(search(planned) for planned in plan))
 
-                    await asyncio.sleep(SEARCH_DELAY_SECONDS)
+        if self.incremental:
+            top_repos = self._snapshot_top("chinese_traditional", max_results)
+            logger.info(f"[chinese_traditional] Top {len(top_repos)} projects from snapshot")
+            return top_repos
 
-                except Exception as e:
-                    logger.error(f"Error searching Chinese projects: {e}")
-                    continue
+        for repos in results:
+            for repo in repos:
+                if repo.full_name not in all_repos:
+                    all_repos[repo.full_name] = repo
 
-        # 依 Fork 數排序
-        sorted_repos = sorted(
-            all_repos.values(),
-            key=lambda r: r.forks_count,
-            reverse=True,
-        )[:max_results]
+        # 依 Fork 數（或動能分數）排序；只有進榜的才做完整驗證
+        sorted_repos = [
+            record.to_repository()
+            for record in self._select_top(all_repos.values(), max_results)
+        ]
 
-        logger.info(f"[chinese_traditional] Found {len(sorted_repos)} Traditional Chinese projects")
+        logger.info(
+            f"[chinese_traditional] Found {len(sorted_repos)} Traditional Chinese projects "
+            f"({len(plan)} queries, {len(self._readme_scripts)} READMEs checked)"
+        )
         return sorted_repos
 
-    async def fetch_all_repositories(self) -> list[Repository]:
+    async def fetch_all_repositories(
+        self,
+        on_batch: Callable[[list[Repository]], Awaitable[None]] | None = None,
+    ) -> list[Repository]:
         """
         爬取所有生態系的 repositories
 
+        所有生態系與繁體中文專案同時搜尋，但依 TOPICS 順序逐一合併：
+        先完成的生態系如果排在後面，會等前面的生態系合併後才處理，
+        因此去重結果與搜尋完成的先後無關。
+
+        Args:
+            on_batch: 每合併完一個生態系就以「新加入或分類有變動」的 repos 呼叫，
+                讓呼叫端在其他生態系仍在搜尋時就開始處理（例如寫入 Notion）
+
         Returns:
-            去重後的 Repository 列表，依 Fork 數排序
+            去重後的 Repository 列表，依 Fork 數（或動能分數）排序
         """
         all_repos: dict[str, Repository] = {}
+        categories: dict[str, set[str]] = {}
+
+        # 1. 各生態系與繁體中文專案同時搜尋，共用 search_governor 的額度
+        ecosystem_tasks = [
+            asyncio.create_task(
+                self.search_ecosystem(
+                    ecosystem=ecosystem,  # type: ignore
+                    topics=topics,
+                )
+            )
+            for ecosystem, topics in TOPICS.items()
+        ]
+        chinese_task = asyncio.create_task(self.search_chinese_projects())
 
-        # 1. 爬取各生態系
-        for ecosystem, topics in TOPICS.items():
-            logger.info(f"{'='*20} {ecosystem} {'='*20}")
+        try:
+            # 2. 依 TOPICS 順序合併（先出現的生態系優先）
+            for task in ecosystem_tasks:
+                changed = []
+                for repo in await task:
+                    if repo.full_name not in all_repos:
+                        all_repos[repo.full_name] = repo
+                        categories[repo.full_name] = set(repo.tool_categories)
+                        changed.append(repo)
+                        continue
 
-            repos = await self.search_ecosystem(
-                ecosystem=ecosystem,  # type: ignore
-                topics=topics,
-            )
+                    merged = categories[repo.full_name]
+                    if not merged.issuperset(repo.tool_categories):
+                        merged.update(repo.tool_categories)
+                        existing = all_repos[repo.full_name]
+                        existing.tool_categories = sorted(merged)
+                        changed.append(existing)
 
-            for repo in repos:
+                if on_batch and changed:
+                    await on_batch(changed)
+
+            # 3. 繁體中文專案（已在其他生態系出現的不重複加入）
+            changed = []
+            for repo in await chinese_task:
                 if repo.full_name not in all_repos:
                     all_repos[repo.full_name] = repo
-                else:
-                    existing = all_repos[repo.full_name]
-                    existing.tool_categories = list(
-                        set(existing.tool_categories + repo.tool_categories)
-                    )
+                    changed.append(repo)
 
-        # 2. 爬取繁體中文專案
-        logger.info(f"{'='*20} chinese_traditional {'='*20}")
-        chinese_repos = await self.search_chinese_projects()
+            if on_batch and changed:
+                await on_batch(changed)
+        finally:
+            for task in [*ecosystem_tasks, chinese_task]:
+                task.cancel()
 
-        for repo in chinese_repos:
-            if repo.full_name not in all_repos:
-                all_repos[repo.full_name] = repo
-
-        # 依 Fork 數排序
-        sorted_repos = sorted(
-            all_repos.values(),
-            key=lambda r: r.forks_count,
-            reverse=True,
-        )
+        # 依 Fork 數（或動能分數）排序
+        sorted_repos = self._select_top(all_repos.values())
 
         logger.info(f"Total unique repositories: {len(sorted_repos)}")
         return sorted_repos
 
     async def check_rate_limit(self) -> dict:
         """檢查目前的 API rate limit 狀態"""
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            url = f"{self.base_url}/rate_limit"
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().get("/rate_limit")
+        response.raise_for_status()
+        data = response.json()
+
+        # 以目前的 Search API 額度初始化限流器（/rate_limit 本身不計入額度）
+        search = data.get("resources", {}).get("search", {})
+        if "remaining" in search and "reset" in search:
+            self.search_governor.update({
+                "x-ratelimit-remaining": str(search["remaining"]),
+                "x-ratelimit-reset": str(search["reset"]),
+                "x-ratelimit-limit": str(search.get("limit", "")),
+            })
+
+        return data
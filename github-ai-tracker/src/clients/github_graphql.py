@@ -0,0 +1,84 @@
+"""GraphQL queries for batch-fetching repository metadata"""
+
+# 搜尋階段只取 node ID，回應非常小
+SEARCH_IDS_QUERY = """
+query($q: String!, $first: Int!, $after: String) {
+  search(query: $q, type: REPOSITORY, first: $first, after: $after) {
+    repositoryCount
+    pageInfo { hasNextPage endCursor }
+    nodes { ... on Repository { id } }
+  }
+}
+"""
+
+# 批次取回 Repository.from_github_response 需要的欄位（每次最多 100 個 node）
+REPOSITORY_NODES_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on Repository {
+      id
+      name
+      nameWithOwner
+      description
+      url
+      homepageUrl
+      stargazerCount
+      forkCount
+      issues(states: OPEN) { totalCount }
+      pullRequests(states: OPEN) { totalCount }
+      primaryLanguage { name }
+      repositoryTopics(first: 20) { nodes { topic { name } } }
+      licenseInfo { name }
+      createdAt
+      updatedAt
+      pushedAt
+    }
+  }
+}
+"""
+
+# GraphQL nodes(ids:) 的上限
+MAX_NODES_PER_QUERY = 100
+
+# 搜尋排序方式對應的 GraphQL 查詢限定詞
+SORT_QUALIFIERS = {
+    "forks": "sort:forks-desc",
+    "stars": "sort:stars-desc",
+    "updated": "sort:updated-desc",
+}
+
+
+def node_to_rest_item(node: dict) -> dict:
+    """
+    將 GraphQL Repository node 轉為 REST search API 的 item 格式
+
+    REST 的 open_issues_count 包含 open PR，這裡一併加總以維持相同語意。
+    """
+    license_info = node.get("licenseInfo")
+    language = node.get("primaryLanguage")
+    topics = [
+        topic_node["topic"]["name"]
+        for topic_node in (node.get("repositoryTopics") or {}).get("nodes", [])
+        if topic_node and topic_node.get("topic")
+    ]
+
+    return {
+        "node_id": node["id"],
+        "name": node["name"],
+        "full_name": node["nameWithOwner"],
+        "description": node.get("description"),
+        "html_url": node["url"],
+        "homepage": node.get("homepageUrl"),
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        "open_issues_count": (
+            (node.get("issues") or {}).get("totalCount", 0)
+            + (node.get("pullRequests") or {}).get("totalCount", 0)
+        ),
+        "language": language["name"] if language else None,
+        "topics": topics,
+        "license": {"name": license_info["name"]} if license_info else None,
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "pushed_at": node.get("pushedAt"),
+    }
@@ -1,18 +1,53 @@
 """Notion API Client for syncing repository data"""
 
+import asyncio
 import time
-from datetime import datetime
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import httpx
 
-from src.config import NOTION_TOKEN, NOTION_DATABASE_ID, ECOSYSTEM_DISPLAY_NAMES, NOTION_RATE_LIMIT_DELAY
+from src.config import (
+    NOTION_TOKEN,
+    NOTION_DATABASE_ID,
+    ECOSYSTEM_DISPLAY_NAMES,
+    NOTION_RATE_LIMIT_DELAY,
+    NOTION_REQUESTS_PER_SECOND,
+    NOTION_BURST,
+    NOTION_CONCURRENCY,
+)
+from src.clients.notion_transport import (
+    NOTION_API_BASE,
+    NOTION_VERSION,
+    NotionTransport,
+    AsyncNotionTransport,
+)
+from src.clients.rate_limit import TokenBucket
 from src.models.repository import Repository
+from src.storage.notion_mirror import NotionMirror, hash_property
 from src.utils.logger import logger
+from src.utils.metrics import metrics
 
-# Notion API 設定
-NOTION_API_BASE = "https://api.notion.com/v1"
-NOTION_VERSION = "2022-06-28"
+# (method, endpoint, body)
+NotionRequest = tuple[str, str, dict]
+
+# Notion 的 last_edited_time 只精確到分鐘，增量查詢往前多涵蓋一點
+MIRROR_REFRESH_OVERLAP = timedelta(minutes=2)
+
+# 每次同步（或每次 push）都會變的屬性：不參與比對，只在有實際變更時一起送出
+VOLATILE_PROPERTIES = frozenset({"Fetched At", "Previous Stars", "Updated At"})
+
+
+@dataclass
+class UpsertPlan:
+    """單一專案的同步決策"""
+
+    result: str  # "created" | "updated" | "skipped"
+    request: NotionRequest | None = None
+    page_id: str | None = None
+    property_hashes: dict[str, str] = field(default_factory=dict)  # 寫入後頁面的屬性雜湊
 
 
 class NotionSync:
@@ -22,6 +57,8 @@ class NotionSync:
         self,
         token: str | None = None,
         database_id: str | None = None,
+        mirror: NotionMirror | None = None,
+        api_base: str | None = None,
     ):
         self.token = token or NOTION_TOKEN
         self.database_id = (database_id or NOTION_DATABASE_ID).replace("-", "")
@@ -32,21 +69,54 @@ class NotionSync:
         }
         self.existing_pages: dict[str, dict[str, Any]] = {}
 
+        # 上次寫入的屬性雜湊（None 表示停用差異同步，只依 Updated At 判斷）
+        self.mirror = mirror
+
+        # 非同步同步引擎共用的限流器（平均 3 req/s，允許短暫突發）
+        self.bucket = TokenBucket(
+            rate=NOTION_REQUESTS_PER_SECOND, burst=NOTION_BURST, name="notion"
+        )
+
+        # 同一個 repo 在一次同步中可能出現兩次（例如稍後的生態系合併了新的分類），
+        # 以每個 repo 一個 lock 確保第二次會看到第一次建立的頁面
+        self._repo_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # 共用連線池的 transport（同步 / 非同步各一個）；api_base 可指向本地的替身伺服器
+        api_base = api_base or NOTION_API_BASE
+        self.transport = NotionTransport(self.headers, base_url=api_base)
+        self.async_transport = AsyncNotionTransport(
+            self.headers, bucket=self.bucket, base_url=api_base
+        )
+
     def _request(self, method: str, endpoint: str, json: dict | None = None) -> dict:
         """發送 Notion API 請求"""
-        url = f"{NOTION_API_BASE}/{endpoint}"
-        with httpx.Client(timeout=30) as client:
-            response = client.request(method, url, headers=self.headers, json=json)
-            response.raise_for_status()
-            return response.json()
+        return self.transport.request(method, endpoint, json=json)
 
-    def _query_database(self, start_cursor: str | None = None) -> dict:
-        """查詢 Notion 資料庫"""
+    async def _arequest(self, method: str, endpoint: str, json: dict | None = None) -> dict:
+        """發送非同步 Notion API 請求（經過 token bucket）"""
+        return await self.async_transport.request(method, endpoint, json=json)
+
+    def _query_body(
+        self,
+        start_cursor: str | None = None,
+        edited_since: datetime | None = None,
+    ) -> dict:
+        """資料庫查詢的 request body（分頁游標、last_edited_time 篩選）"""
         body: dict[str, Any] = {}
         if start_cursor:
             body["start_cursor"] = start_cursor
+        if edited_since:
+            body["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": edited_since.isoformat()},
+            }
+        return body
 
-        return self._request("POST", f"databases/{self.database_id}/query", json=body)
+    def _query_database(self, start_cursor: str | None = None) -> dict:
+        """查詢 Notion 資料庫"""
+        return self._request(
+            "POST", f"databases/{self.database_id}/query", json=self._query_body(start_cursor)
+        )
 
     def load_existing_pages(self) -> None:
         """載入 Notion 資料庫中現有的所有專案"""
@@ -62,87 +132,312 @@ class NotionSync:
             has_more = response["has_more"]
             start_cursor = response.get("next_cursor")
 
-        # 建立對照表
-        for page in results:
-            props = page["properties"]
-
-            # 取得 Full Name
-            full_name_prop = props.get("Full Name", {})
-            rich_text = full_name_prop.get("rich_text", [])
-            if not rich_text:
-                continue
-            full_name = rich_text[0].get("plain_text", "")
-
-            # 取得 Updated At
-            updated_at_prop = props.get("Updated At", {})
-            date_value = updated_at_prop.get("date")
-            updated_at = None
-            if date_value and date_value.get("start"):
-                try:
-                    updated_at = datetime.fromisoformat(date_value["start"].replace("Z", "+00:00"))
-                except (ValueError, TypeError):
-                    pass
-
-            # 取得目前星星數（用於計算成長）
-            stars_prop = props.get("Stars", {})
-            current_stars = stars_prop.get("number", 0)
-
-            self.existing_pages[full_name] = {
-                "page_id": page["id"],
-                "updated_at": updated_at,
-                "stars": current_stars,
-            }
+        self._index_pages(results)
+
+    async def _aquery_all(
+        self,
+        edited_since: datetime | None = None,
+    ) -> list[dict]:
+        """分頁取回資料庫查詢的所有結果"""
+        results = []
+        has_more = True
+        start_cursor = None
+
+        while has_more:
+            response = await self._arequest(
+                "POST",
+                f"databases/{self.database_id}/query",
+                json=self._query_body(start_cursor, edited_since),
+            )
+            results.extend(response["results"])
+            has_more = response["has_more"]
+            start_cursor = response.get("next_cursor")
+
+        return results
+
+    async def aload_existing_pages(
+        self,
+        full_reload: bool = False,
+    ) -> None:
+        """
+        非同步版的 load_existing_pages
+
+        有本地鏡像時只查詢上次更新之後被編輯過的頁面並合併進鏡像；
+        鏡像是空的或 full_reload 時才完整查詢整個資料庫。
+        """
+        if self.mirror is None:
+            logger.info("Loading existing pages from Notion...")
+            self._index_pages(await self._aquery_all())
+            return
+
+        started_at = datetime.now(timezone.utc)
+        refreshed_at = None if full_reload else self.mirror.get_refreshed_at()
+
+        if refreshed_at is None:
+            logger.info("Loading existing pages from Notion (full reload)...")
+            self.mirror.clear_index()
+            pages = await self._aquery_all()
+        else:
+            logger.info(f"Refreshing Notion mirror with pages edited since {refreshed_at:%Y-%m-%d %H:%M}...")
+            pages = await self._aquery_all(edited_since=refreshed_at - MIRROR_REFRESH_OVERLAP)
+
+        entries = [entry for entry in map(self._parse_page, pages) if entry]
+        self.mirror.upsert_index(entries)
+        self.mirror.set_refreshed_at(started_at)
+        await self._ainvalidate_external_edits(entries)
+
+        self.existing_pages = self.mirror.load_index()
+        logger.info(
+            f"Loaded {len(self.existing_pages)} existing pages "
+            f"({len(entries)} fetched from Notion)"
+        )
+
+    async def _aget_bot_user_id(self) -> str | None:
+        """取得整合（bot）本身的 user id（第一次查詢 users/me 後存在鏡像中）"""
+        bot_user_id = self.mirror.get_bot_user_id()
+        if bot_user_id is None:
+            try:
+                bot_user_id = (await self._arequest("GET", "users/me")).get("id")
+            except httpx.HTTPError as e:
+                logger.warning(f"Failed to look up the Notion bot user: {e}")
+                return None
+            if bot_user_id:
+                self.mirror.set_bot_user_id(bot_user_id)
+        return bot_user_id
+
+    async def _ainvalidate_external_edits(self, entries: list[dict]) -> None:
+        """
+        清除被其他人編輯過的頁面的屬性雜湊
+
+        本地雜湊只記錄我們上次寫入的內容；頁面在 Notion 上被手動修改後雜湊不再
+        代表頁面的實際內容，差異同步會誤判為沒有變更，因此改為下次送出完整屬性。
+        """
+        edited = [entry for entry in entries if entry.get("last_edited_by")]
+        if not edited:
+            return
+        bot_user_id = await self._aget_bot_user_id()
+        if bot_user_id is None:
+            return
+
+        invalidated = self.mirror.invalidate_hashes(
+            [entry["full_name"] for entry in edited if entry["last_edited_by"] != bot_user_id]
+        )
+        if invalidated:
+            logger.info(f"{invalidated} Notion pages were edited by someone else, resyncing all properties")
+            metrics.incr("notion.external_edits", invalidated)
+
+    def _index_pages(self, results: list[dict]) -> None:
+        """由查詢結果建立 full_name 對照表"""
+        for entry in map(self._parse_page, results):
+            if entry:
+                self.existing_pages[entry["full_name"]] = {
+                    "page_id": entry["page_id"],
+                    "updated_at": entry["updated_at"],
+                    "stars": entry["stars"],
+                }
 
         logger.info(f"Loaded {len(self.existing_pages)} existing pages from Notion")
 
-    def upsert_repository(self, repo: Repository) -> str:
+    @staticmethod
+    def _parse_page(page: dict) -> dict | None:
+        """取出頁面的 Full Name / Updated At / Stars（沒有 Full Name 的頁面回傳 None）"""
+        props = page["properties"]
+
+        # 取得 Full Name
+        full_name_prop = props.get("Full Name", {})
+        rich_text = full_name_prop.get("rich_text", [])
+        if not rich_text:
+            return None
+        full_name = rich_text[0].get("plain_text", "")
+
+        # 取得 Updated At
+        updated_at_prop = props.get("Updated At", {})
+        date_value = updated_at_prop.get("date")
+        updated_at = None
+        if date_value and date_value.get("start"):
+            try:
+                updated_at = datetime.fromisoformat(date_value["start"].replace("Z", "+00:00"))
+            except (ValueError, TypeError):
+                pass
+
+        # 取得目前星星數（用於計算成長）
+        stars_prop = props.get("Stars", {})
+        current_stars = stars_prop.get("number", 0)
+
+        return {
+            "full_name": full_name,
+            "page_id": page["id"],
+            "updated_at": updated_at,
+            "stars": current_stars,
+            "last_edited_time": page.get("last_edited_time"),
+            "last_edited_by": (page.get("last_edited_by") or {}).get("id"),
+        }
+
+    def _plan_upsert(self, repo: Repository) -> UpsertPlan:
         """
-        Upsert 單一專案到 Notion
+        決定單一專案要新增、更新或跳過
 
-        Returns:
-            "created" | "updated" | "skipped"
+        有上次寫入的屬性雜湊時，只 PATCH 雜湊不同的屬性，全部相同則跳過；
+        沒有紀錄時依 Updated At 判斷並送出完整屬性。
         """
         full_name = repo.full_name
 
-        if full_name in self.existing_pages:
-            existing = self.existing_pages[full_name]
-
-            # 比較更新時間（如果 existing 沒有更新時間，則強制更新）
-            should_update = True
-            if existing["updated_at"] is not None:
-                # 移除時區資訊進行比較（避免 naive vs aware 問題）
-                existing_time = existing["updated_at"].replace(tzinfo=None)
-                repo_time = repo.updated_at.replace(tzinfo=None)
-                should_update = repo_time > existing_time
-
-            if should_update:
-                # GitHub 資料較新，執行更新
-                previous_stars = existing.get("stars", 0)
-                self._update_page(existing["page_id"], repo, previous_stars)
-                return "updated"
-            else:
-                # 資料沒有變化，跳過
-                return "skipped"
-        else:
+        if full_name not in self.existing_pages:
             # 新專案，執行新增
-            self._create_page(repo)
-            return "created"
+            properties = self._build_properties(repo, previous_stars=None)
+            return UpsertPlan(
+                result="created",
+                request=self._create_request(properties),
+                property_hashes=self._hash_properties(properties),
+            )
+
+        existing = self.existing_pages[full_name]
+        page_id = existing["page_id"]
+        properties = self._build_properties(repo, previous_stars=existing.get("stars", 0))
+        hashes = self._hash_properties(properties)
+        last_hashes = self.mirror.get_hashes(full_name, page_id) if self.mirror else None
+
+        if last_hashes is not None:
+            changed = {
+                name: value
+                for name, value in properties.items()
+                if name not in VOLATILE_PROPERTIES and hashes[name] != last_hashes.get(name)
+            }
+            if not changed:
+                return UpsertPlan(result="skipped")
+
+            if "Stars" not in changed:
+                # 星星數沒變時 Previous Stars 維持原值
+                properties.pop("Previous Stars", None)
+            changed.update(
+                (name, properties[name]) for name in VOLATILE_PROPERTIES if name in properties
+            )
+            return UpsertPlan(
+                result="updated",
+                request=self._update_request(page_id, changed),
+                page_id=page_id,
+                property_hashes={**last_hashes, **hashes},
+            )
+
+        # 比較更新時間（如果 existing 沒有更新時間，則強制更新）
+        should_update = True
+        if existing["updated_at"] is not None:
+            # 移除時區資訊進行比較（避免 naive vs aware 問題）
+            existing_time = existing["updated_at"].replace(tzinfo=None)
+            repo_time = repo.updated_at.replace(tzinfo=None)
+            should_update = repo_time > existing_time
+
+        if should_update:
+            # GitHub 資料較新，執行更新
+            return UpsertPlan(
+                result="updated",
+                request=self._update_request(page_id, properties),
+                page_id=page_id,
+                property_hashes=hashes,
+            )
+        # 資料沒有變化，跳過
+        return UpsertPlan(result="skipped")
+
+    @staticmethod
+    def _hash_properties(properties: dict) -> dict[str, str]:
+        """計算每個屬性的雜湊（不含每次都會變的屬性）"""
+        return {
+            name: hash_property(value)
+            for name, value in properties.items()
+            if name not in VOLATILE_PROPERTIES
+        }
+
+    def _record_write(self, repo: Repository, plan: UpsertPlan, response: dict) -> None:
+        """寫入成功後更新對照表並記錄屬性雜湊，之後的同步據此比對"""
+        page_id = plan.page_id or response.get("id")
+        if not page_id:
+            return
+
+        self.existing_pages[repo.full_name] = {
+            "page_id": page_id,
+            "updated_at": repo.updated_at,
+            "stars": repo.stargazers_count,
+        }
+        if self.mirror is not None:
+            self.mirror.record(repo.full_name, page_id, plan.property_hashes)
+
+    @staticmethod
+    def _is_gone(error: httpx.HTTPStatusError) -> bool:
+        """PATCH 失敗是否因為頁面已被刪除（404）或封存（400 archived）"""
+        response = error.response
+        return response.status_code == 404 or (
+            response.status_code == 400 and "archived" in response.text
+        )
+
+    def _forget_page(self, full_name: str) -> None:
+        """移除已不存在的頁面，之後重新規劃時會改為新增"""
+        logger.warning(f"Notion page for {full_name} was archived or deleted, re-creating it")
+        self.existing_pages.pop(full_name, None)
+        if self.mirror is not None:
+            self.mirror.forget(full_name)
+        metrics.incr("notion.recreated")
+
+    def upsert_repository(self, repo: Repository) -> str:
+        """
+        Upsert 單一專案到 Notion
 
-    def _create_page(self, repo: Repository) -> None:
+        Returns:
+            "created" | "updated" | "skipped"
+        """
+        with metrics.span("notion.upsert", full_name=repo.full_name):
+            plan = self._plan_upsert(repo)
+            if plan.request:
+                method, endpoint, body = plan.request
+                try:
+                    response = self._request(method, endpoint, json=body)
+                except httpx.HTTPStatusError as e:
+                    if plan.result != "updated" or not self._is_gone(e):
+                        raise
+                    # 頁面已被封存或刪除：移除鏡像紀錄後改為重新建立
+                    self._forget_page(repo.full_name)
+                    plan = self._plan_upsert(repo)
+                    method, endpoint, body = plan.request
+                    response = self._request(method, endpoint, json=body)
+                self._record_write(repo, plan, response)
+        metrics.incr(f"notion.{plan.result}")
+        return plan.result
+
+    async def aupsert_repository(self, repo: Repository) -> str:
+        """非同步版的 upsert_repository"""
+        with metrics.span("notion.upsert", full_name=repo.full_name):
+            async with self._repo_locks[repo.full_name]:
+                plan = self._plan_upsert(repo)
+                if plan.request:
+                    method, endpoint, body = plan.request
+                    try:
+                        response = await self._arequest(method, endpoint, json=body)
+                    except httpx.HTTPStatusError as e:
+                        if plan.result != "updated" or not self._is_gone(e):
+                            raise
+                        # 頁面已被封存或刪除：移除鏡像紀錄後改為重新建立
+                        self._forget_page(repo.full_name)
+                        plan = self._plan_upsert(repo)
+                        method, endpoint, body = plan.request
+                        response = await self._arequest(method, endpoint, json=body)
+                    self._record_write(repo, plan, response)
+        metrics.incr(f"notion.{plan.result}")
+        return plan.result
+
+    def _create_request(self, properties: dict) -> NotionRequest:
         """新增頁面到 Notion"""
         body = {
             "parent": {"database_id": self.database_id},
-            "properties": self._build_properties(repo, previous_stars=None),
+            "properties": properties,
         }
-        self._request("POST", "pages", json=body)
+        return "POST", "pages", body
 
-    def _update_page(self, page_id: str, repo: Repository, previous_stars: int | None) -> None:
-        """更新現有頁面"""
+    def _update_request(self, page_id: str, properties: dict) -> NotionRequest:
+        """更新現有頁面（只送出給定的屬性）"""
         page_id_clean = page_id.replace("-", "")
         body = {
-            "properties": self._build_properties(repo, previous_stars),
+            "properties": properties,
         }
-        self._request("PATCH", f"pages/{page_id_clean}", json=body)
+        return "PATCH", f"pages/{page_id_clean}", body
 
     def _build_properties(self, repo: Repository, previous_stars: int | None) -> dict:
         """建構 Notion 頁面屬性"""
@@ -211,40 +506,131 @@ class NotionSync:
         Returns:
             統計結果 {"created": n, "updated": n, "skipped": n}
         """
-        # Step 1: 載入現有資料
-        self.load_existing_pages()
-
-        # Step 2: Upsert 每個專案
         stats = {"created": 0, "updated": 0, "skipped": 0}
 
-        for i, repo in enumerate(repos, 1):
-            try:
-                result = self.upsert_repository(repo)
-                stats[result] += 1
+        # 整個同步過程共用同一個連線池，結束後關閉
+        with self.transport:
+            # Step 1: 載入現有資料
+            self.load_existing_pages()
+
+            # Step 2: Upsert 每個專案
+            for i, repo in enumerate(repos, 1):
+                try:
+                    result = self.upsert_repository(repo)
+                    stats[result] += 1
+
+                    # 顯示進度
+                    if result == "skipped":
+                        logger.debug(f"[{i}/{len(repos)}] SKIP: {repo.full_name}")
+                    else:
+                        logger.info(
+                            f"[{i}/{len(repos)}] {result.upper()}: {repo.full_name} "
+                            f"(forks: {repo.forks_count})"
+                        )
+
+                    # Notion API 速率限制：約 3 requests/秒
+                    if result != "skipped":
+                        with metrics.wait("notion"):
+                            time.sleep(NOTION_RATE_LIMIT_DELAY)
+
+                except Exception as e:
+                    logger.error(f"Error syncing {repo.full_name}: {e}")
+                    # 遇到錯誤時等待更長時間（可能是速率限制）
+                    with metrics.wait("notion"):
+                        time.sleep(1)
+                    continue
+
+        # Step 3: 輸出統計
+        logger.info(
+            f"Sync completed! Created: {stats['created']}, "
+            f"Updated: {stats['updated']}, Skipped: {stats['skipped']}"
+        )
+
+        return stats
+
+    async def async_sync_repositories(
+        self,
+        repos: list[Repository],
+        full_reload: bool = False,
+    ) -> dict[str, int]:
+        """
+        非同步同步多個 repositories 到 Notion
+
+        Args:
+            repos: Repository 列表
+            full_reload: 忽略本地鏡像，完整重新載入 Notion 資料庫
+
+        Returns:
+            統計結果 {"created": n, "updated": n, "skipped": n, "failed": n}
+        """
+        queue: asyncio.Queue[Repository | None] = asyncio.Queue()
+        for repo in repos:
+            queue.put_nowait(repo)
+        queue.put_nowait(None)
+        return await self.async_sync_stream(queue, full_reload=full_reload)
+
+    async def async_sync_stream(
+        self,
+        queue: "asyncio.Queue[Repository | None]",
+        full_reload: bool = False,
+    ) -> dict[str, int]:
+        """
+        從 queue 持續取出 repositories 同步到 Notion，直到收到 None
+
+        多個寫入同時進行（NOTION_CONCURRENCY），實際送出速率由 token bucket
+        控制在 Notion 的平均限制內，不再每次寫入後固定 sleep。生產端（GitHub 搜尋）
+        可以在同步進行中持續放入新的 repo。
+
+        Args:
+            queue: 待同步的 repositories，以 None 表示結束
+            full_reload: 忽略本地鏡像，完整重新載入 Notion 資料庫
 
-                # 顯示進度
+        Returns:
+            統計結果 {"created": n, "updated": n, "skipped": n, "failed": n}
+        """
+        stats = {"created": 0, "updated": 0, "skipped": 0, "failed": 0}
+        processed = 0
+
+        async def worker() -> None:
+            nonlocal processed
+            while True:
+                repo = await queue.get()
+                if repo is None:
+                    # 把結束標記放回去，讓其他 worker 也能結束
+                    queue.put_nowait(None)
+                    return
+
+                try:
+                    result = await self.aupsert_repository(repo)
+                except Exception as e:
+                    logger.error(f"Error syncing {repo.full_name}: {e}")
+                    stats["failed"] += 1
+                    metrics.incr("notion.failed")
+                    continue
+
+                processed += 1
+                stats[result] += 1
                 if result == "skipped":
-                    logger.debug(f"[{i}/{len(repos)}] SKIP: {repo.full_name}")
+                    logger.debug(f"[{processed}] SKIP: {repo.full_name}")
                 else:
                     logger.info(
-                        f"[{i}/{len(repos)}] {result.upper()}: {repo.full_name} "
+                        f"[{processed}] {result.upper()}: {repo.full_name} "
                         f"(forks: {repo.forks_count})"
                     )
 
-                # Notion API 速率限制：約 3 requests/秒
-                if result != "skipped":
-                    time.sleep(NOTION_RATE_LIMIT_DELAY)
+        async with self.async_transport:
+            # Step 1: 載入現有資料（生產端同時在搜尋）
+            with metrics.span("notion.load_pages"):
+                await self.aload_existing_pages(full_reload=full_reload)
 
-            except Exception as e:
-                logger.error(f"Error syncing {repo.full_name}: {e}")
-                # 遇到錯誤時等待更長時間（可能是速率限制）
-                time.sleep(1)
-                continue
+            # Step 2: 並行 upsert，由 token bucket 控制速率
+            await asyncio.gather(*(worker() for _ in range(NOTION_CONCURRENCY)))
 
         # Step 3: 輸出統計
         logger.info(
             f"Sync completed! Created: {stats['created']}, "
-            f"Updated: {stats['updated']}, Skipped: {stats['skipped']}"
+            f"Updated: {stats['updated']}, Skipped: {stats['skipped']}, "
+            f"Failed: {stats['failed']} (rate limiter waited {self.bucket.waited_seconds:.1f}s)"
         )
 
         return stats
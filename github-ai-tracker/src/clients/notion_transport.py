@@ -0,0 +1,160 @@
+"""Pooled HTTP transport for the Notion API"""
+
+import asyncio
+import time
+
+import httpx
+
+from src.config import NOTION_MAX_RETRIES
+from src.clients.rate_limit import TokenBucket, parse_retry_after
+from src.utils.logger import logger
+from src.utils.metrics import metrics
+
+# Notion API 設定
+NOTION_API_BASE = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+NOTION_TIMEOUT = 30
+
+# 連線層錯誤（連線失敗、連線被重置）的重試次數，由 httpx transport 處理
+CONNECT_RETRIES = 2
+
+# 5xx 暫時性錯誤的退避秒數（第 n 次重試等待 BACKOFF_SECONDS * 2**n）
+BACKOFF_SECONDS = 1.0
+RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
+
+_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=60)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """
+    回應需要重試時回傳等待秒數，否則回傳 None
+
+    429 依 Retry-After（秒數或 HTTP-date），沒有或無法解析時與 5xx 一樣以指數退避。
+    """
+    if attempt >= NOTION_MAX_RETRIES:
+        return None
+    if response.status_code == 429:
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        if retry_after is not None:
+            return retry_after
+        return BACKOFF_SECONDS * 2 ** attempt
+    if response.status_code in RETRYABLE_STATUS:
+        return BACKOFF_SECONDS * 2 ** attempt
+    return None
+
+
+class NotionTransport:
+    """
+    同步版 Notion transport
+
+    整個同步過程共用一個 keep-alive 的 HTTP/2 連線池，
+    不再每個 API 呼叫都重新建立連線與 TLS 握手。
+    """
+
+    def __init__(self, headers: dict[str, str], base_url: str = NOTION_API_BASE):
+        self.headers = headers
+        self.base_url = base_url
+        self._client: httpx.Client | None = None
+
+    def __enter__(self) -> "NotionTransport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_client(self) -> httpx.Client:
+        """取得共用的 HTTP client（第一次使用時建立）"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=NOTION_TIMEOUT,
+                transport=httpx.HTTPTransport(http2=True, retries=CONNECT_RETRIES, limits=_LIMITS),
+            )
+        return self._client
+
+    def request(self, method: str, endpoint: str, json: dict | None = None) -> dict:
+        """發送 Notion API 請求（429 / 5xx 自動重試）"""
+        attempt = 0
+        while True:
+            response = self._get_client().request(method, endpoint, json=json)
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                response.raise_for_status()
+                return response.json()
+
+            logger.warning(f"Notion returned {response.status_code}, retrying in {delay:.1f}s")
+            metrics.incr(f"notion.retry.{response.status_code}")
+            with metrics.wait("notion"):
+                time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """關閉連線池"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class AsyncNotionTransport:
+    """
+    非同步版 Notion transport
+
+    所有請求先經過共用的 token bucket；收到 429 時暫停整個 bucket，
+    讓並行中的其他寫入一起等待 Retry-After，而不是各自重試。
+    """
+
+    def __init__(
+        self,
+        headers: dict[str, str],
+        bucket: TokenBucket | None = None,
+        base_url: str = NOTION_API_BASE,
+    ):
+        self.headers = headers
+        self.bucket = bucket
+        self.base_url = base_url
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "AsyncNotionTransport":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """取得共用的 HTTP client（第一次使用時建立）"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=NOTION_TIMEOUT,
+                transport=httpx.AsyncHTTPTransport(http2=True, retries=CONNECT_RETRIES, limits=_LIMITS),
+            )
+        return self._client
+
+    async def request(self, method: str, endpoint: str, json: dict | None = None) -> dict:
+        """發送 Notion API 請求（經過 token bucket，429 / 5xx 自動重試）"""
+        attempt = 0
+        while True:
+            if self.bucket:
+                await self.bucket.acquire()
+            response = await self._get_client().request(method, endpoint, json=json)
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                response.raise_for_status()
+                return response.json()
+
+            logger.warning(f"Notion returned {response.status_code}, retrying in {delay:.1f}s")
+            metrics.incr(f"notion.retry.{response.status_code}")
+            if response.status_code == 429 and self.bucket:
+                self.bucket.pause(delay)
+            else:
+                with metrics.wait("notion"):
+                    await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """關閉連線池"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,124 @@
+"""Planner that packs keyword x topic search matrices into combined OR queries"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from math import ceil
+
+# GitHub Search API 限制：單一查詢最多 5 個 AND / OR / NOT 運算子、256 個字元
+MAX_OPERATORS = 5
+MAX_QUERY_LENGTH = 256
+
+# GitHub Search API 單一查詢最多只能取得前 1000 筆結果
+SEARCH_RESULT_CAP = 1000
+
+# 依建立日期分片的起點（GitHub 在此之前沒有 repo）
+SEARCH_EPOCH = date(2008, 1, 1)
+
+
+@dataclass(frozen=True)
+class PlannedQuery:
+    """一個合併後的搜尋查詢與它涵蓋的詞彙"""
+
+    query: str
+    keywords: tuple[str, ...]
+    topics: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CreatedRange:
+    """
+    依 repo 建立日期切出的查詢分片（日期含頭尾）
+
+    end 為 None 表示不設上限；最新的分片以 `created:>=` 表示，
+    查詢字串不含今天的日期，ETag 快取在日期改變後仍能命中。
+    """
+
+    start: date = SEARCH_EPOCH
+    end: date | None = None
+
+    def qualifier(self) -> str:
+        if self.end is None:
+            return f"created:>={self.start.isoformat()}"
+        return f"created:{self.start.isoformat()}..{self.end.isoformat()}"
+
+    def split(self, today: date | None = None) -> tuple["CreatedRange", "CreatedRange"] | None:
+        """
+        從中間切成兩半（只剩一天時無法再切，回傳 None）
+
+        Args:
+            today: 沒有上限的分片以今天作為切分的終點（預設為 UTC 的今天）
+        """
+        end = self.end or today or datetime.now(timezone.utc).date()
+        if end <= self.start:
+            return None
+        middle = self.start + (end - self.start) // 2
+        return CreatedRange(self.start, middle), CreatedRange(middle + timedelta(days=1), self.end)
+
+
+def _term(value: str) -> str:
+    """含空白的詞加上引號"""
+    return f'"{value}"' if " " in value else value
+
+
+def _group(values: tuple[str, ...]) -> str:
+    """以 OR 合併一組詞（只有一個詞時不加括號）"""
+    terms = [_term(value) for value in values]
+    return terms[0] if len(terms) == 1 else f"({' OR '.join(terms)})"
+
+
+def _chunks(values: list[str], size: int) -> list[tuple[str, ...]]:
+    return [tuple(values[i:i + size]) for i in range(0, len(values), size)]
+
+
+def _build(keywords: tuple[str, ...], topics: tuple[str, ...], qualifier: str) -> str:
+    return " ".join(part for part in (_group(keywords), _group(topics), qualifier) if part)
+
+
+def plan_queries(
+    keywords: list[str],
+    topics: list[str],
+    qualifier: str = "",
+    max_operators: int = MAX_OPERATORS,
+    max_length: int = MAX_QUERY_LENGTH,
+) -> list[PlannedQuery]:
+    """
+    把 keywords x topics 的搜尋矩陣合併成最少的 OR 查詢
+
+    每個查詢形如 `(k1 OR k2) (t1 OR t2 OR t3) qualifier`，關鍵字組與 topic 組之間是
+    隱含的 AND（不計入運算子）。在運算子與長度限制內選出查詢數最少的分組大小；
+    超過長度限制時縮小分組。
+
+    Args:
+        keywords: 關鍵字列表
+        topics: topic 詞列表
+        qualifier: 附加在每個查詢後的限定詞（例如 "in:readme"）
+        max_operators: 單一查詢的 OR 數上限
+        max_length: 單一查詢的字元數上限
+
+    Returns:
+        涵蓋整個矩陣的查詢列表
+    """
+    if not keywords or not topics:
+        return []
+
+    best: list[PlannedQuery] | None = None
+    for keyword_size in range(1, len(keywords) + 1):
+        for topic_size in range(1, len(topics) + 1):
+            if (keyword_size - 1) + (topic_size - 1) > max_operators:
+                continue
+            if best is not None and (
+                ceil(len(keywords) / keyword_size) * ceil(len(topics) / topic_size) >= len(best)
+            ):
+                continue
+
+            plan = [
+                PlannedQuery(_build(k, t, qualifier), k, t)
+                for k in _chunks(keywords, keyword_size)
+                for t in _chunks(topics, topic_size)
+            ]
+            if all(len(planned.query) <= max_length for planned in plan):
+                best = plan
+
+    if best is None:
+        raise ValueError("Search terms do not fit into a single query")
+    return best
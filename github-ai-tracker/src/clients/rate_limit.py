@@ -0,0 +1,212 @@
+"""Rate limiting helpers shared by the API clients"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Mapping
+
+import httpx
+
+from src.utils.logger import logger
+from src.utils.metrics import metrics
+
+# 視窗重置後多等一點時間，避免 GitHub 時鐘誤差導致剛重置就又被擋
+RESET_MARGIN_SECONDS = 1.0
+
+# 次要限制（secondary rate limit）沒有帶 Retry-After 時的等待秒數（第 n 次重試等待 60 * 2**n）
+SECONDARY_LIMIT_SECONDS = 60.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    解析 Retry-After 標頭（秒數或 HTTP-date），無法解析時回傳 None
+
+    HTTP-date 換算成距離現在的秒數；已經過去的時間回傳 0。
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def rate_limit_delay(response: httpx.Response, attempt: int) -> float | None:
+    """
+    GitHub 回應因 rate limit 被擋時回傳應等待的秒數，否則回傳 None
+
+    - 有 Retry-After（次要限制）：依其秒數
+    - X-RateLimit-Remaining 為 0（主要額度用完）：等到 X-RateLimit-Reset
+    - 其他 429 或訊息提到 rate limit 的 403：以指數退避等待
+    權限不足等一般的 403 回傳 None。
+    """
+    if response.status_code not in (403, 429):
+        return None
+
+    retry_after = parse_retry_after(response.headers.get("retry-after"))
+    if retry_after is not None:
+        return retry_after
+
+    reset = response.headers.get("x-ratelimit-reset")
+    if response.headers.get("x-ratelimit-remaining") == "0" and reset:
+        try:
+            return max(float(reset) - time.time(), 0.0)
+        except ValueError:
+            pass
+
+    if response.status_code == 429 or "rate limit" in response.text.lower():
+        return SECONDARY_LIMIT_SECONDS * 2 ** attempt
+    return None
+
+
+class RateLimitGovernor:
+    """
+    依 GitHub 回應標頭調節請求節奏的共用限流器
+
+    - 以 semaphore 限制同時進行的請求數
+    - 以 `X-RateLimit-Remaining` / `X-RateLimit-Reset` 追蹤剩餘額度，
+      額度用完時所有請求一起等到視窗重置，而不是每次請求固定 sleep
+    """
+
+    def __init__(self, name: str, max_concurrency: int, min_interval: float = 0.0):
+        self.name = name
+        self.min_interval = min_interval
+        self.remaining: int | None = None
+        self.limit: int | None = None
+        self.reset_at: float = 0.0
+        self.waited_seconds: float = 0.0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._last_start: float = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """取得一個請求名額（必要時等待額度重置）"""
+        async with self._semaphore:
+            await self._wait_for_quota()
+            yield
+
+    async def _wait_for_quota(self) -> None:
+        async with self._lock:
+            while self.remaining is not None and self.remaining <= 0:
+                delay = self.reset_at - time.time() + RESET_MARGIN_SECONDS
+                if delay <= 0:
+                    # 視窗已重置，等下一個回應帶回實際額度
+                    self.remaining = None
+                    break
+                logger.info(
+                    f"[{self.name}] Rate limit exhausted, waiting {delay:.1f}s for reset"
+                )
+                await self._sleep(delay)
+
+            if self.min_interval > 0:
+                gap = self._last_start + self.min_interval - time.monotonic()
+                if gap > 0:
+                    await self._sleep(gap)
+
+            if self.remaining is not None:
+                self.remaining -= 1
+            self._last_start = time.monotonic()
+
+    async def _sleep(self, seconds: float) -> None:
+        self.waited_seconds += seconds
+        with metrics.wait(self.name):
+            await asyncio.sleep(seconds)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """依回應標頭更新剩餘額度"""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining_value = int(remaining)
+            reset_value = float(reset)
+        except ValueError:
+            return
+
+        limit = headers.get("x-ratelimit-limit")
+        if limit is not None and limit.isdigit():
+            self.limit = int(limit)
+
+        if reset_value > self.reset_at:
+            # 新的計費視窗
+            self.reset_at = reset_value
+            self.remaining = remaining_value
+        elif self.remaining is None:
+            self.remaining = remaining_value
+        else:
+            # 同一視窗內回應可能亂序抵達，取較小值較保守
+            self.remaining = min(self.remaining, remaining_value)
+
+        metrics.quota(self.name, self.remaining, self.limit)
+
+    def refund(self) -> None:
+        """退還一次額度（例如 304 Not Modified 不計入 rate limit）"""
+        if self.remaining is not None:
+            self.remaining += 1
+
+    def block_until(self, reset_at: float) -> None:
+        """強制暫停到指定時間（例如收到 403 rate limit 時）"""
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, reset_at)
+
+
+class TokenBucket:
+    """
+    平均速率 + 突發額度的 token bucket（用於 Notion API 約 3 req/s 的限制）
+
+    每個請求取一個 token，token 以固定速率補充、最多累積 burst 個；
+    收到 429 時以 pause() 讓所有等待中的請求一起暫停 Retry-After 秒。
+    """
+
+    def __init__(self, rate: float, burst: int, name: str = "bucket"):
+        self.name = name
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.waited_seconds: float = 0.0
+        self._updated = time.monotonic()
+        self._paused_until: float = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """取得一個 token（不足時等待補充）"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await self._sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await self._sleep((1 - self.tokens) / self.rate)
+
+    async def _sleep(self, seconds: float) -> None:
+        self.waited_seconds += seconds
+        with metrics.wait(self.name):
+            await asyncio.sleep(seconds)
+
+    def pause(self, seconds: float) -> None:
+        """暫停發放 token（例如收到 429 Retry-After 時），並清空累積的突發額度"""
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._refill(now)
+        self.tokens = 0.0
@@ -1,6 +1,7 @@
 """Configuration management for GitHub AI Tracker"""
 
 import os
+from pathlib import Path
 from typing import Literal
 from dotenv import load_dotenv
 
@@ -16,9 +17,30 @@ NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID", "")
 # ===== App Settings =====
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 MAX_REPOS_PER_ECOSYSTEM = int(os.getenv("MAX_REPOS_PER_ECOSYSTEM", "50"))  # 每個生態系取前 50 名
+TOPIC_MAX_RESULTS = int(os.getenv("TOPIC_MAX_RESULTS", "100"))  # 每個 topic 取回的候選數（0 表示全部；超過 1000 時依建立日期分片）
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
-SEARCH_DELAY_SECONDS = float(os.getenv("SEARCH_DELAY_SECONDS", "2"))
-NOTION_RATE_LIMIT_DELAY = float(os.getenv("NOTION_RATE_LIMIT_DELAY", "0.35"))  # Notion API 限制約 3 req/s
+SEARCH_DELAY_SECONDS = float(os.getenv("SEARCH_DELAY_SECONDS", "0"))  # 搜尋請求最小間隔（額度由 rate limit 標頭控制）
+SEARCH_CONCURRENCY = int(os.getenv("SEARCH_CONCURRENCY", "4"))  # 同時進行的搜尋請求數
+GITHUB_MAX_RETRIES = int(os.getenv("GITHUB_MAX_RETRIES", "3"))  # 403 / 429 rate limit 時等待重置後的重試次數
+GITHUB_FETCH_MODE = os.getenv("GITHUB_FETCH_MODE", "rest")  # rest | graphql（搜尋取 ID + 批次取欄位）
+NOTION_RATE_LIMIT_DELAY = float(os.getenv("NOTION_RATE_LIMIT_DELAY", "0.35"))  # Notion API 限制約 3 req/s（同步版）
+NOTION_REQUESTS_PER_SECOND = float(os.getenv("NOTION_REQUESTS_PER_SECOND", "3"))  # token bucket 平均速率
+NOTION_BURST = int(os.getenv("NOTION_BURST", "5"))  # token bucket 突發額度
+NOTION_CONCURRENCY = int(os.getenv("NOTION_CONCURRENCY", "6"))  # 同時進行的 Notion 寫入數
+NOTION_MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", "3"))  # 429 時的重試次數
+
+# ===== Local Storage =====
+DATA_DIR = Path(__file__).parent.parent / "data"
+TRACKER_DB_PATH = Path(os.getenv("TRACKER_DB_PATH", str(DATA_DIR / "tracker.db")))
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"  # GitHub 搜尋 ETag 快取
+RANK_BY = os.getenv("RANK_BY", "momentum")  # momentum（動能分數）| forks（Fork 數）
+RANKING_WEIGHTS = os.getenv("RANKING_WEIGHTS", "")  # 例如 "star_velocity=1,stars=0.5"
+TRENDING_WINDOW_DAYS = int(os.getenv("TRENDING_WINDOW_DAYS", "30"))  # 成長率計算的時間窗
+EXPORT_DIR = Path(os.getenv("EXPORT_DIR", str(DATA_DIR / "export")))
+EXPORT_FORMATS = os.getenv("EXPORT_FORMATS", "")  # 例如 "csv,parquet"（空字串表示不匯出）
+RUN_REPORT_PATH = Path(os.getenv("RUN_REPORT_PATH", str(DATA_DIR / "run_report.json")))  # 執行報告（耗時、限流、額度）
+CRAWL_MODE = os.getenv("CRAWL_MODE", "full")  # full | incremental（只查詢上次執行後有 push 的 repo）
+CRAWL_RESUME = os.getenv("CRAWL_RESUME", "false").lower() == "true"  # 沿用上次中斷執行的檢查點，略過已完成的搜尋
 
 # ===== GitHub API =====
 GITHUB_API_BASE_URL = "https://api.github.com"
@@ -104,6 +126,20 @@ TOPICS: dict[str, list[str]] = {
     ],
 }
 
+# ===== Traditional Chinese Search =====
+# 關鍵字 x AI topic 的搜尋矩陣，由 query_planner 合併成少數幾個 OR 查詢；
+# 結果再以 README 內容在本地判斷是否為繁體中文
+CHINESE_KEYWORDS: list[str] = [
+    "繁體中文",
+    "正體中文",
+    "台灣",
+    "臺灣",
+    "中文說明",
+    "中文文件",
+    "Chinese README",
+]
+CHINESE_AI_TOPICS: list[str] = ["llm", "ai", "chatgpt", "gpt", "langchain", "ollama"]
+
 # ===== Tool Category Mapping =====
 # 用於根據 Topics 自動判斷工具分類（可多選）
 TOOL_CATEGORY_MAPPING: dict[str, str] = {
@@ -153,16 +189,35 @@ TOOL_CATEGORY_MAPPING: dict[str, str] = {
 }
 
 
+# 別名：指向 TOOL_CATEGORY_MAPPING 中既有 topic 的其他寫法
+TOOL_CATEGORY_ALIASES: dict[str, str] = {
+    "claudecode": "claude-code",
+    "claude-ai": "claude",
+    "githubcopilot": "github-copilot",
+    "modelcontextprotocol": "model-context-protocol",
+    "notebook-lm": "notebooklm",
+    "lang-chain": "langchain",
+}
+
+# 萬用字元規則（fnmatch 語法），例如 `*-mcp` 涵蓋 filesystem-mcp、github-mcp 等
+TOOL_CATEGORY_PATTERNS: dict[str, str] = {
+    "*-mcp": "MCP",
+    "mcp-*": "MCP",
+    "cursor-*": "Cursor",
+    "windsurf-*": "Windsurf",
+    "claude-*": "Claude",
+    "ollama-*": "Ollama",
+    "langchain-*": "LangChain",
+    "pdf-*": "PDF",
+}
+
+
 def get_tool_categories(topics: list[str]) -> list[str]:
     """根據 Topics 自動判斷工具分類（可能返回多個）"""
-    categories = set()
-
-    for topic in topics:
-        topic_lower = topic.lower()
-        if topic_lower in TOOL_CATEGORY_MAPPING:
-            categories.add(TOOL_CATEGORY_MAPPING[topic_lower])
+    # 規則在 src/classifier.py 預先編譯（延遲 import 避免循環相依）
+    from src.classifier import default_classifier
 
-    return sorted(list(categories))
+    return default_classifier.classify(topics)
 
 
 def validate_config() -> list[str]:
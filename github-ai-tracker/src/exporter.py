@@ -0,0 +1,281 @@
+"""Streaming export of tracked repositories and their history to CSV / NDJSON / Parquet"""
+
+import csv
+import json
+import os
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from src.config import EXPORT_DIR
+from src.models.repository import Repository
+from src.storage.history import RepositoryHistory
+from src.utils.logger import logger
+
+# 支援的格式（同時也是副檔名）
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+
+# 每批寫入的列數（Parquet 每批一個 row group）
+CHUNK_SIZE = 1000
+
+# CSV 中 list 欄位的分隔符號
+LIST_SEPARATOR = ";"
+
+# (欄位, 型別)：str | int | list | timestamp
+Columns = list[tuple[str, str]]
+
+REPOSITORY_COLUMNS: Columns = [
+    ("full_name", "str"),
+    ("name", "str"),
+    ("ecosystem", "str"),
+    ("matched_topic", "str"),
+    ("tool_categories", "list"),
+    ("stargazers_count", "int"),
+    ("forks_count", "int"),
+    ("open_issues_count", "int"),
+    ("language", "str"),
+    ("license_name", "str"),
+    ("topics", "list"),
+    ("description", "str"),
+    ("html_url", "str"),
+    ("homepage", "str"),
+    ("created_at", "timestamp"),
+    ("updated_at", "timestamp"),
+    ("fetched_at", "timestamp"),
+]
+
+HISTORY_COLUMNS: Columns = [
+    ("full_name", "str"),
+    ("fetched_at", "timestamp"),
+    ("stars", "int"),
+    ("forks", "int"),
+    ("open_issues", "int"),
+]
+
+
+def parse_formats(spec: str) -> list[str]:
+    """解析 "csv,parquet" 形式的格式設定（未知格式拋出 ValueError）"""
+    formats = [part.strip().lower() for part in spec.split(",") if part.strip()]
+    for fmt in formats:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+    return list(dict.fromkeys(formats))
+
+
+def _utc(value: datetime) -> datetime:
+    """轉為 UTC（沒有時區的時間視為本地時間）"""
+    return value.astimezone(timezone.utc)
+
+
+def _chunked(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def repository_rows(repos: Iterable[Repository]) -> Iterator[dict[str, Any]]:
+    """Repository 轉成匯出用的列（時間統一為 UTC）"""
+    for repo in repos:
+        yield {
+            "full_name": repo.full_name,
+            "name": repo.name,
+            "ecosystem": repo.ecosystem,
+            "matched_topic": repo.matched_topic,
+            "tool_categories": sorted(repo.tool_categories),
+            "stargazers_count": repo.stargazers_count,
+            "forks_count": repo.forks_count,
+            "open_issues_count": repo.open_issues_count,
+            "language": repo.language,
+            "license_name": repo.license_name,
+            "topics": list(repo.topics),
+            "description": repo.description,
+            "html_url": str(repo.html_url),
+            "homepage": repo.homepage,
+            "created_at": _utc(repo.created_at),
+            "updated_at": _utc(repo.updated_at),
+            "fetched_at": _utc(repo.fetched_at),
+        }
+
+
+def history_chunks(
+    history: RepositoryHistory,
+    since: datetime | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """分批讀出歷史樣本並轉成匯出用的列"""
+    for rows in history.iter_rows(since=since, chunk_size=chunk_size):
+        yield [
+            {
+                "full_name": full_name,
+                "fetched_at": datetime.fromtimestamp(fetched_at, timezone.utc),
+                "stars": stars,
+                "forks": forks,
+                "open_issues": open_issues,
+            }
+            for full_name, fetched_at, stars, forks, open_issues in rows
+        ]
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, columns: Columns):
+        self.columns = columns
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([name for name, _ in columns])
+
+    def _cell(self, value: Any, kind: str) -> Any:
+        if value is None:
+            return ""
+        if kind == "list":
+            return LIST_SEPARATOR.join(value)
+        if kind == "timestamp":
+            return value.isoformat()
+        return value
+
+    def write(self, chunk: list[dict]) -> None:
+        self.writer.writerows(
+            [self._cell(row[name], kind) for name, kind in self.columns] for row in chunk
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _NdjsonWriter:
+    def __init__(self, path: Path, columns: Columns):
+        self.columns = columns
+        self.file = open(path, "w", encoding="utf-8")
+
+    def _record(self, row: dict) -> dict:
+        return {
+            name: row[name].isoformat() if kind == "timestamp" else row[name]
+            for name, kind in self.columns
+        }
+
+    def write(self, chunk: list[dict]) -> None:
+        self.file.writelines(
+            json.dumps(self._record(row), ensure_ascii=False) + "\n" for row in chunk
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, columns: Columns):
+        pa, pq = _import_pyarrow()
+        types = {
+            "str": pa.string(),
+            "int": pa.int64(),
+            "list": pa.list_(pa.string()),
+            "timestamp": pa.timestamp("us", tz="UTC"),
+        }
+        self.pa = pa
+        self.schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+
+    def write(self, chunk: list[dict]) -> None:
+        self.writer.write_table(self.pa.Table.from_pylist(chunk, schema=self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+_WRITERS = {"csv": _CsvWriter, "ndjson": _NdjsonWriter, "parquet": _ParquetWriter}
+
+
+def _import_pyarrow():
+    """Parquet 需要選用相依套件 pyarrow"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError(
+            "Parquet export requires pyarrow (install with: uv sync --extra export)"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def write_dataset(path: Path, fmt: str, columns: Columns, chunks: Iterable[list[dict]]) -> int:
+    """
+    分批寫入單一資料集
+
+    先寫到暫存檔，完成後才取代目標檔案，BI 工具不會讀到寫到一半的檔案。
+
+    Returns:
+        寫入的列數
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    writer = _WRITERS[fmt](tmp_path, columns)
+    rows = 0
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+            rows += len(chunk)
+    except BaseException:
+        writer.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    writer.close()
+    os.replace(tmp_path, path)
+    return rows
+
+
+class RepositoryExporter:
+    """
+    將本次取得的 repositories 與本地歷史匯出到 data/export/
+
+    每種格式輸出 repositories.<ext> 與 history.<ext> 兩個檔案，
+    資料以 CHUNK_SIZE 列為單位分批寫入，歷史表再大也不需一次載入記憶體。
+    """
+
+    def __init__(
+        self,
+        formats: list[str],
+        out_dir: Path | str | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self.formats = formats
+        self.out_dir = Path(out_dir or EXPORT_DIR)
+        self.chunk_size = chunk_size
+        if "parquet" in formats:
+            _import_pyarrow()  # 提早發現缺少的相依套件
+
+    def export(
+        self,
+        repos: list[Repository],
+        history: RepositoryHistory | None = None,
+        since: datetime | None = None,
+    ) -> list[Path]:
+        """
+        匯出 repositories（與歷史樣本）
+
+        Args:
+            repos: 本次取得的 repositories
+            history: 本地歷史（None 表示不匯出歷史）
+            since: 只匯出此時間之後的歷史樣本
+
+        Returns:
+            寫出的檔案路徑
+        """
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        written: list[Path] = []
+
+        for fmt in self.formats:
+            path = self.out_dir / f"repositories.{fmt}"
+            rows = write_dataset(
+                path, fmt, REPOSITORY_COLUMNS, _chunked(repository_rows(repos), self.chunk_size)
+            )
+            logger.info(f"Exported {rows} repositories to {path}")
+            written.append(path)
+
+            if history is not None:
+                path = self.out_dir / f"history.{fmt}"
+                rows = write_dataset(
+                    path, fmt, HISTORY_COLUMNS, history_chunks(history, since, self.chunk_size)
+                )
+                logger.info(f"Exported {rows} history samples to {path}")
+                written.append(path)
+
+        return written
@@ -5,18 +5,54 @@ GitHub AI Tracker - 主程式入口
 並將結果同步到 Notion 資料庫。
 """
 
+import argparse
 import asyncio
 import sys
-from datetime import datetime
+from contextlib import ExitStack, closing
+from datetime import datetime, timedelta
+from pathlib import Path
 
-from src.config import validate_config, TOPICS
+from src.config import (
+    validate_config,
+    TOPICS,
+    HTTP_CACHE_ENABLED,
+    CRAWL_MODE,
+    CRAWL_RESUME,
+    TRENDING_WINDOW_DAYS,
+    RANK_BY,
+    RANKING_WEIGHTS,
+    RUN_REPORT_PATH,
+    EXPORT_FORMATS,
+)
 from src.clients.github_client import GitHubClient
 from src.clients.notion_sync import NotionSync
+from src.exporter import RepositoryExporter, parse_formats
+from src.pipeline import fetch_and_sync
+from src.ranking import RankingEngine, RankingWeights
+from src.storage.http_cache import ResponseCache
+from src.storage.snapshot import RepositorySnapshot
+from src.storage.checkpoint import CrawlCheckpoint
+from src.storage.history import RepositoryHistory
+from src.storage.notion_mirror import NotionMirror
 from src.utils.logger import logger
+from src.utils.metrics import metrics
 
 
-async def main() -> None:
-    """主程式"""
+async def main(
+    incremental: bool = False,
+    reload_notion: bool = False,
+    export_formats: list[str] | None = None,
+    resume: bool = False,
+) -> None:
+    """
+    主程式
+
+    Args:
+        incremental: 增量爬取（只查詢上次執行後有 push 的 repo，前 N 名由本地快照計算）
+        reload_notion: 忽略本地的 Notion 鏡像，完整重新載入 Notion 資料庫
+        export_formats: 同步後另外匯出到 data/export/ 的格式（csv / ndjson / parquet）
+        resume: 沿用上次中斷執行的檢查點，已完成的搜尋不再重新查詢
+    """
     start_time = datetime.now()
     logger.info("=" * 60)
     logger.info("Starting GitHub AI Tracker...")
@@ -29,76 +65,228 @@ async def main() -> None:
         logger.error("Please check your .env file")
         sys.exit(1)
 
+    # 匯出器（缺少 pyarrow 等相依套件時在爬取前就結束）
+    exporter = None
+    if export_formats:
+        try:
+            exporter = RepositoryExporter(export_formats)
+        except RuntimeError as e:
+            logger.error(str(e))
+            sys.exit(1)
+
     # 顯示設定摘要
     total_topics = sum(len(topics) for topics in TOPICS.values())
     logger.info(f"Loaded {len(TOPICS)} ecosystems with {total_topics} topics")
+    logger.info(f"Crawl mode: {'incremental' if incremental else 'full'}, ranking by {RANK_BY}")
+    metrics.context.update(
+        crawl_mode="incremental" if incremental else "full",
+        rank_by=RANK_BY,
+        ecosystems=len(TOPICS),
+        topics=total_topics,
+        resume=resume,
+    )
 
-    # Step 2: 爬取 GitHub 資料
+    # Step 2: 爬取 GitHub 資料，同時同步到 Notion
     logger.info("-" * 40)
-    logger.info("Phase 1: Fetching repositories from GitHub...")
+    logger.info("Fetching repositories from GitHub and syncing to Notion...")
     logger.info("-" * 40)
 
-    github_client = GitHubClient()
+    # 本地資料庫的連線在結束時一律關閉（包括失敗時），WAL 中已提交的資料（例如檢查點）
+    # 才會寫回 data/tracker.db，下次 --resume 讀得到
+    with ExitStack() as stores:
+        # 搜尋回應 ETag 快取：結果沒變的頁面回 304，不消耗額度
+        response_cache = ResponseCache() if HTTP_CACHE_ENABLED else None
+        if response_cache:
+            stores.callback(response_cache.close)
 
-    # 檢查 rate limit
-    try:
-        rate_limit = await github_client.check_rate_limit()
-        search_limit = rate_limit.get("resources", {}).get("search", {})
-        logger.info(
-            f"GitHub Search API Rate Limit: "
-            f"{search_limit.get('remaining', '?')}/{search_limit.get('limit', '?')}"
-        )
-    except Exception as e:
-        logger.warning(f"Could not check rate limit: {e}")
+        # 本地 repo 快照：全量爬取也會更新，之後才能切換到增量模式
+        snapshot = stores.enter_context(closing(RepositorySnapshot()))
 
-    # 爬取所有 repositories
-    try:
-        repositories = await github_client.fetch_all_repositories()
-    except Exception as e:
-        logger.error(f"Failed to fetch repositories: {e}")
-        sys.exit(1)
+        # 爬取檢查點：中途失敗後以 --resume 重跑時略過已完成的搜尋；不是 resume 時從頭開始
+        checkpoint = stores.enter_context(closing(CrawlCheckpoint()))
+        if resume:
+            logger.info(f"Resuming from {checkpoint.count()} completed searches")
+        else:
+            checkpoint.clear()
 
-    if not repositories:
-        logger.warning("No repositories found!")
-        return
+        # 動能排名：以本地歷史中時間窗內的成長計算各生態系前 N 名
+        history = stores.enter_context(closing(RepositoryHistory()))
+        window_start = start_time - timedelta(days=TRENDING_WINDOW_DAYS)
+        ranker = None
+        if RANK_BY == "momentum":
+            ranker = RankingEngine(
+                growth=history.growth(since=window_start),
+                weights=RankingWeights.parse(RANKING_WEIGHTS),
+            )
 
-    logger.info(f"Total unique repositories fetched: {len(repositories)}")
+        # Notion 本地鏡像：現有頁面只增量更新，並記錄上次寫入的屬性雜湊（只 PATCH 實際變更的屬性）
+        notion_mirror = stores.enter_context(closing(NotionMirror()))
+        notion_sync = NotionSync(mirror=notion_mirror)
 
-    # 顯示 Top 10
-    logger.info("Top 10 repositories by stars:")
-    for i, repo in enumerate(repositories[:10], 1):
-        logger.info(f"  {i}. {repo.full_name} - {repo.stargazers_count:,} stars")
+        # GitHubClient 擁有共用的 HTTP/2 連線池，整個爬取階段重複使用
+        async with GitHubClient(
+            response_cache=response_cache,
+            snapshot=snapshot,
+            incremental=incremental,
+            ranker=ranker,
+            checkpoint=checkpoint,
+            resume=resume,
+        ) as github_client:
+            # 檢查 rate limit
+            try:
+                rate_limit = await github_client.check_rate_limit()
+                search_limit = rate_limit.get("resources", {}).get("search", {})
+                logger.info(
+                    f"GitHub Search API Rate Limit: "
+                    f"{search_limit.get('remaining', '?')}/{search_limit.get('limit', '?')}"
+                )
+            except Exception as e:
+                logger.warning(f"Could not check rate limit: {e}")
 
-    # Step 3: 同步到 Notion
-    logger.info("-" * 40)
-    logger.info("Phase 2: Syncing to Notion database...")
-    logger.info("-" * 40)
+            # 爬取所有 repositories：每個生態系完成就交給 Notion 寫入端，不等全部搜尋完
+            try:
+                with metrics.span("phase.fetch_and_sync"):
+                    repositories, stats = await fetch_and_sync(
+                        github_client, notion_sync, full_reload=reload_notion
+                    )
+            except Exception as e:
+                logger.error(f"Failed to fetch or sync repositories: {e}")
+                logger.error("Completed searches are checkpointed, rerun with --resume to continue")
+                sys.exit(1)
 
-    notion_sync = NotionSync()
+            # 有搜尋失敗時保留檢查點，--resume 只會重試失敗的搜尋
+            failed = github_client.failed_searches
+            if failed:
+                logger.warning(
+                    f"{len(failed)} searches failed ({', '.join(failed)}), "
+                    f"rerun with --resume to retry only those"
+                )
+            else:
+                checkpoint.clear()
 
-    try:
-        stats = notion_sync.sync_repositories(repositories)
-    except Exception as e:
-        logger.error(f"Failed to sync to Notion: {e}")
-        sys.exit(1)
+        if response_cache:
+            logger.info(
+                f"Search cache: {response_cache.hits} not modified (304), "
+                f"{response_cache.misses} refreshed"
+            )
 
-    # Step 4: 輸出執行摘要
-    elapsed = datetime.now() - start_time
-    logger.info("=" * 60)
-    logger.info("Execution Summary")
-    logger.info("=" * 60)
-    logger.info(f"Total repositories processed: {len(repositories)}")
-    logger.info(f"  - Created: {stats['created']}")
-    logger.info(f"  - Updated: {stats['updated']}")
-    logger.info(f"  - Skipped: {stats['skipped']}")
-    logger.info(f"Elapsed time: {elapsed.total_seconds():.1f} seconds")
-    logger.info("=" * 60)
-    logger.info("Done!")
+        logger.info(f"Snapshot: {snapshot.count()} known repositories")
+
+        if not repositories:
+            logger.warning("No repositories found!")
+            return
+
+        logger.info(f"Total unique repositories fetched: {len(repositories)}")
+
+        # 顯示 Top 10
+        logger.info(f"Top 10 repositories ({RANK_BY}):")
+        for i, repo in enumerate(repositories[:10], 1):
+            logger.info(f"  {i}. {repo.full_name} - {repo.stargazers_count:,} stars")
+
+        # 記錄本次數據到本地歷史，成長率直接由歷史計算，不必回讀 Notion；
+        # 增量模式下由快照補上、本次沒有重新取得的 repo 不記錄（數據是舊的）
+        with metrics.span("phase.history"):
+            history.record(repositories, fetched_at=start_time, full_names=github_client.crawled)
+            growth = history.growth(
+                since=window_start,
+                full_names=[repo.full_name for repo in repositories],
+            )
+
+        # 匯出給 BI 工具直接讀取（不必透過 Notion API 分頁讀回）
+        if exporter:
+            try:
+                with metrics.span("phase.export"):
+                    exporter.export(repositories, history=history)
+            except Exception as e:
+                logger.error(f"Export failed: {e}")
+
+        index = growth.index()
+        logger.info(f"Fastest growing in the last {TRENDING_WINDOW_DAYS} days (stars/day):")
+        for full_name in growth.top(10, by="star_velocity"):
+            i = index[full_name]
+            if growth.star_velocity[i] <= 0:
+                break
+            logger.info(
+                f"  {full_name} - +{growth.star_delta[i]:,} stars "
+                f"({growth.star_velocity[i]:.1f}/day)"
+            )
+
+        # Step 3: 輸出執行摘要
+        elapsed = datetime.now() - start_time
+        logger.info("=" * 60)
+        logger.info("Execution Summary")
+        logger.info("=" * 60)
+        logger.info(f"Total repositories processed: {len(repositories)}")
+        logger.info(f"  - Created: {stats['created']}")
+        logger.info(f"  - Updated: {stats['updated']}")
+        logger.info(f"  - Skipped: {stats['skipped']}")
+        logger.info(f"  - Failed: {stats['failed']}")
+        logger.info(f"Elapsed time: {elapsed.total_seconds():.1f} seconds")
+        report = metrics.report()
+        logger.info(
+            f"  - Rate limited: {report['rate_limited_seconds']:.1f}s, "
+            f"working: {report['working_seconds']:.1f}s"
+        )
+        logger.info("=" * 60)
+        logger.info("Done!")
 
 
 def run() -> None:
     """同步執行入口（供命令列使用）"""
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="GitHub AI Tracker")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        default=CRAWL_MODE == "incremental",
+        help="只查詢上次執行後有 push 的 repo，合併進本地快照（預設取自 CRAWL_MODE）",
+    )
+    mode.add_argument(
+        "--full",
+        dest="incremental",
+        action="store_false",
+        help="全量爬取每個 topic 的前 100 名",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=CRAWL_RESUME,
+        help="沿用上次中斷執行的檢查點，略過已完成的搜尋（預設取自 CRAWL_RESUME）",
+    )
+    parser.add_argument(
+        "--reload-notion",
+        action="store_true",
+        help="完整重新載入 Notion 資料庫（預設只查詢上次之後被編輯過的頁面）",
+    )
+    parser.add_argument(
+        "--export",
+        type=parse_formats,
+        default=parse_formats(EXPORT_FORMATS),
+        metavar="FORMATS",
+        help="同步後匯出到 data/export/，例如 csv,ndjson,parquet（預設取自 EXPORT_FORMATS）",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=RUN_REPORT_PATH,
+        help="執行報告（JSON）的輸出路徑（預設取自 RUN_REPORT_PATH）",
+    )
+    args = parser.parse_args()
+
+    metrics.reset()
+    try:
+        asyncio.run(
+            main(
+                incremental=args.incremental,
+                reload_notion=args.reload_notion,
+                export_formats=args.export,
+                resume=args.resume,
+            )
+        )
+    finally:
+        # 失敗時也寫出報告，才看得出時間花在哪裡
+        path = metrics.write(args.report)
+        logger.info(f"Run report written to {path}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Data models for the GitHub AI Tracker"""
 
 from .repository import Repository, EcosystemType
+from .record import RepoRecord
 
-__all__ = ["Repository", "EcosystemType"]
+__all__ = ["Repository", "EcosystemType", "RepoRecord"]
@@ -0,0 +1,134 @@
+"""Lightweight repository record for the crawl hot path"""
+
+from datetime import datetime
+
+from .repository import Repository, EcosystemType
+
+
+class RepoRecord:
+    """
+    爬取過程中使用的精簡 repository 紀錄
+
+    每個搜尋結果都會先轉成 RepoRecord：只做欄位複製與一次 created_at 解析
+    （排名需要），不做 pydantic 驗證。各生態系選出前 N 名後才以
+    to_repository() 轉成經過完整驗證的 Repository，因此被淘汰的數千筆
+    候選不需負擔 HttpUrl 驗證與模型建構的成本。
+
+    欄位名稱與 Repository 相同，排名、快照等只讀取欄位的程式可直接使用。
+    """
+
+    __slots__ = (
+        "name",
+        "full_name",
+        "description",
+        "html_url",
+        "homepage",
+        "stargazers_count",
+        "forks_count",
+        "open_issues_count",
+        "language",
+        "topics",
+        "license_name",
+        "created_at",
+        "updated_at",
+        "ecosystem",
+        "tool_categories",
+        "matched_topic",
+        "fetched_at",
+        "pushed_at",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        full_name: str,
+        description: str | None,
+        html_url: str,
+        homepage: str | None,
+        stargazers_count: int,
+        forks_count: int,
+        open_issues_count: int,
+        language: str | None,
+        topics: list[str],
+        license_name: str | None,
+        created_at: datetime,
+        updated_at: str,
+        ecosystem: EcosystemType,
+        tool_categories: list[str],
+        matched_topic: str,
+        fetched_at: datetime,
+        pushed_at: str | None = None,
+    ):
+        self.name = name
+        self.full_name = full_name
+        self.description = description
+        self.html_url = html_url
+        self.homepage = homepage
+        self.stargazers_count = stargazers_count
+        self.forks_count = forks_count
+        self.open_issues_count = open_issues_count
+        self.language = language
+        self.topics = topics
+        self.license_name = license_name
+        self.created_at = created_at
+        self.updated_at = updated_at  # ISO 字串，到 to_repository() 才解析
+        self.ecosystem = ecosystem
+        self.tool_categories = tool_categories
+        self.matched_topic = matched_topic
+        self.fetched_at = fetched_at
+        self.pushed_at = pushed_at  # ISO 字串，作為 README 判斷結果的快取鍵
+
+    @classmethod
+    def from_github_item(
+        cls,
+        data: dict,
+        ecosystem: EcosystemType,
+        matched_topic: str,
+        tool_categories: list[str],
+        fetched_at: datetime | None = None,
+    ) -> "RepoRecord":
+        """從 GitHub 搜尋結果建立紀錄（欄位對應與 Repository.from_github_response 相同）"""
+        license_info = data.get("license")
+        return cls(
+            name=data["name"],
+            full_name=data["full_name"],
+            description=data.get("description"),
+            html_url=data["html_url"],
+            homepage=data.get("homepage") or None,
+            stargazers_count=data.get("stargazers_count", 0),
+            forks_count=data.get("forks_count", 0),
+            open_issues_count=data.get("open_issues_count", 0),
+            language=data.get("language"),
+            topics=data.get("topics", []),
+            license_name=license_info.get("name") if isinstance(license_info, dict) else None,
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=data["updated_at"],
+            ecosystem=ecosystem,
+            tool_categories=tool_categories,
+            matched_topic=matched_topic,
+            fetched_at=fetched_at or datetime.now(),
+            pushed_at=data.get("pushed_at"),
+        )
+
+    def to_dict(self) -> dict:
+        """轉成可 JSON 序列化的 dict（格式與 Repository.model_dump(mode="json") 相容）"""
+        data = {field: getattr(self, field) for field in self.__slots__}
+        data["created_at"] = self.created_at.isoformat()
+        data["fetched_at"] = self.fetched_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RepoRecord":
+        """由 to_dict() 的結果還原紀錄（例如讀取爬取檢查點）"""
+        # 舊版檢查點沒有 pushed_at 等選填欄位
+        values = {field: data[field] for field in cls.__slots__ if field in data}
+        values["created_at"] = datetime.fromisoformat(data["created_at"])
+        values["fetched_at"] = datetime.fromisoformat(data["fetched_at"])
+        return cls(**values)
+
+    def to_repository(self) -> Repository:
+        """在輸出邊界轉成經過完整驗證的 Repository"""
+        return Repository.model_validate({field: getattr(self, field) for field in self.__slots__})
+
+    def __repr__(self) -> str:
+        return f"RepoRecord({self.full_name!r}, forks={self.forks_count}, stars={self.stargazers_count})"
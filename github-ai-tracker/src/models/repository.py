@@ -41,6 +41,7 @@ class Repository(BaseModel):
     # 時間資訊
     created_at: datetime  # 建立時間
     updated_at: datetime  # 更新時間
+    pushed_at: Optional[datetime] = None  # 最後 push 時間
 
     # 自訂欄位
     ecosystem: EcosystemType  # 生態系分類
@@ -88,6 +89,7 @@ class Repository(BaseModel):
             tool_categories=tool_categories,
             matched_topic=matched_topic,
             fetched_at=datetime.now(),
+            pushed_at=data.get("pushed_at"),
         )
 
     def __hash__(self) -> int:
@@ -0,0 +1,53 @@
+"""Producer/consumer pipeline from GitHub search into the Notion sync"""
+
+import asyncio
+
+from src.clients.github_client import GitHubClient
+from src.clients.notion_sync import NotionSync
+from src.models.repository import Repository
+from src.utils.logger import logger
+
+
+async def fetch_and_sync(
+    github_client: GitHubClient,
+    notion_sync: NotionSync,
+    full_reload: bool = False,
+) -> tuple[list[Repository], dict[str, int]]:
+    """
+    邊搜尋邊同步：每個生態系合併完成就放入 queue，由 Notion 寫入端立即處理
+
+    Notion 端載入現有頁面與寫入的同時，後面的生態系仍在搜尋，
+    總執行時間接近 max(搜尋, 同步) 而不是兩者相加。
+
+    Returns:
+        (去重排序後的 Repository 列表, Notion 同步統計)
+    """
+    queue: asyncio.Queue[Repository | None] = asyncio.Queue()
+
+    async def enqueue(repos: list[Repository]) -> None:
+        for repo in repos:
+            queue.put_nowait(repo)
+        logger.debug(f"Queued {len(repos)} repositories for Notion ({queue.qsize()} pending)")
+
+    async def produce() -> list[Repository]:
+        try:
+            return await github_client.fetch_all_repositories(on_batch=enqueue)
+        finally:
+            # 搜尋失敗也要讓寫入端結束
+            queue.put_nowait(None)
+
+    # 不用 TaskGroup：搜尋失敗時寫入端仍要把已放入 queue 的 repo 寫完，
+    # 反過來寫入端失敗時繼續搜尋沒有意義，立即取消搜尋端
+    producer = asyncio.create_task(produce())
+    consumer = asyncio.create_task(
+        notion_sync.async_sync_stream(queue, full_reload=full_reload)
+    )
+    try:
+        stats = await consumer
+    except BaseException:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        raise
+
+    repositories = await producer
+    return repositories, stats
@@ -0,0 +1,131 @@
+"""Momentum-based ranking of candidate repositories"""
+
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.models.repository import Repository
+from src.storage.history import GrowthStats
+
+SECONDS_PER_DAY = 86400.0
+
+# 歷史樣本至少跨這麼多天才以觀測到的速度取代終身平均
+MIN_HISTORY_DAYS = 1.0
+
+
+@dataclass(frozen=True)
+class RankingWeights:
+    """
+    動能分數的權重
+
+    score = (各指標 log1p 後的加權和) / (1 + 年齡(年)) ** age_gravity
+    """
+
+    star_velocity: float = 1.0  # 每天增加的星星數
+    fork_velocity: float = 0.5  # 每天增加的 Fork 數
+    stars: float = 0.2  # 總星星數（避免只剩短暫爆紅的專案）
+    forks: float = 0.1  # 總 Fork 數
+    age_gravity: float = 0.5  # 年齡懲罰，越大越偏好新專案
+
+    @classmethod
+    def parse(cls, spec: str) -> "RankingWeights":
+        """
+        由設定字串建立權重，例如 "star_velocity=1,stars=0.5"
+
+        未指定的權重使用預設值。
+        """
+        names = {field.name for field in fields(cls)}
+        values: dict[str, float] = {}
+        for part in spec.split(","):
+            if not part.strip():
+                continue
+            key, _, value = part.partition("=")
+            key = key.strip()
+            if key not in names:
+                raise ValueError(f"Unknown ranking weight: {key}")
+            values[key] = float(value)
+        return cls(**values)
+
+
+class RankingEngine:
+    """
+    依動能分數挑選前 N 名（取代單純的 Fork 數排序）
+
+    星星 / Fork 速度優先使用本地歷史（repo_history）中時間窗內第一筆樣本
+    到本次數值的變化；沒有足夠歷史的 repo 以終身平均（總數 / 年齡）代替。
+    所有候選 repo 以 NumPy 一次向量化計算，數萬筆也只需單次運算。
+    """
+
+    def __init__(
+        self,
+        growth: GrowthStats | None = None,
+        weights: RankingWeights | None = None,
+        now: datetime | None = None,
+    ):
+        self.weights = weights or RankingWeights()
+        self.now = (now or datetime.now(timezone.utc)).timestamp()
+        self.growth = growth
+        self._growth_index = growth.index() if growth is not None else {}
+
+    def score(self, repos: list[Repository]) -> np.ndarray:
+        """計算每個 repo 的動能分數（與 repos 順序相同）"""
+        count = len(repos)
+        stars = np.fromiter((r.stargazers_count for r in repos), np.float64, count)
+        forks = np.fromiter((r.forks_count for r in repos), np.float64, count)
+        created = np.fromiter((r.created_at.timestamp() for r in repos), np.float64, count)
+
+        age_days = np.maximum((self.now - created) / SECONDS_PER_DAY, 1.0)
+        star_velocity = stars / age_days
+        fork_velocity = forks / age_days
+
+        if self._growth_index:
+            index = np.fromiter(
+                (self._growth_index.get(r.full_name, -1) for r in repos), np.int64, count
+            )
+            known = np.flatnonzero(index >= 0)
+            rows = index[known]
+            span = (self.now - self.growth.first_fetched_at[rows]) / SECONDS_PER_DAY
+            observed = span >= MIN_HISTORY_DAYS
+            safe_span = np.where(observed, span, 1.0)
+
+            star_velocity[known] = np.where(
+                observed,
+                (stars[known] - self.growth.first_stars[rows]) / safe_span,
+                star_velocity[known],
+            )
+            fork_velocity[known] = np.where(
+                observed,
+                (forks[known] - self.growth.first_forks[rows]) / safe_span,
+                fork_velocity[known],
+            )
+
+        w = self.weights
+        raw = (
+            w.star_velocity * np.log1p(np.maximum(star_velocity, 0.0))
+            + w.fork_velocity * np.log1p(np.maximum(fork_velocity, 0.0))
+            + w.stars * np.log1p(stars)
+            + w.forks * np.log1p(forks)
+        )
+        return raw / (1.0 + age_days / 365.0) ** w.age_gravity
+
+    def rank(self, repos: list[Repository], limit: int | None = None) -> list[Repository]:
+        """
+        依動能分數排序並取前 N 名
+
+        Args:
+            repos: 候選 repositories
+            limit: 取前 N 名（None 表示全部排序）
+        """
+        if not repos or (limit is not None and limit <= 0):
+            return []
+
+        scores = self.score(repos)
+        if limit is not None and limit < len(repos):
+            # 先以 argpartition 取出前 N 名，只排序這 N 筆（同分時維持輸入順序）
+            candidates = np.sort(np.argpartition(-scores, limit - 1)[:limit])
+        else:
+            candidates = np.arange(len(repos))
+
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [repos[i] for i in order]
@@ -0,0 +1,19 @@
+"""Local SQLite storage under data/"""
+
+from .database import connect
+from .http_cache import ResponseCache, CachedResponse
+from .snapshot import RepositorySnapshot
+from .checkpoint import CrawlCheckpoint
+from .history import RepositoryHistory, GrowthStats
+from .notion_mirror import NotionMirror
+
+__all__ = [
+    "connect",
+    "ResponseCache",
+    "CachedResponse",
+    "RepositorySnapshot",
+    "CrawlCheckpoint",
+    "RepositoryHistory",
+    "GrowthStats",
+    "NotionMirror",
+]
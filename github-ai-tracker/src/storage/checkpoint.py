@@ -0,0 +1,63 @@
+"""Per-search crawl checkpoints for resuming an interrupted run"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from src.models.record import RepoRecord
+
+from .database import connect
+
+
+class CrawlCheckpoint:
+    """
+    爬取進度檢查點（data/tracker.db）
+
+    每個搜尋（一個 topic 或一個合併後的中文查詢）完成後記錄它的結果；
+    執行中途失敗（例如被 rate limit 擋下）後以 --resume 重跑時，已完成的搜尋
+    直接讀回結果，不再消耗搜尋額度。整次爬取成功後清除。
+    """
+
+    def __init__(self, db_path: Path | str | None = None):
+        self.conn = connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS crawl_checkpoint (
+                scope TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                completed_at TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def load(self, scope: str) -> list[RepoRecord] | None:
+        """取得某個搜尋已完成的結果（尚未完成時回傳 None）"""
+        row = self.conn.execute(
+            "SELECT data FROM crawl_checkpoint WHERE scope = ?", (scope,)
+        ).fetchone()
+        if row is None:
+            return None
+        return [RepoRecord.from_dict(data) for data in json.loads(row["data"])]
+
+    def save(self, scope: str, repos: list[RepoRecord]) -> None:
+        """記錄某個搜尋已完成及其結果"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO crawl_checkpoint (scope, data, completed_at) VALUES (?, ?, ?)",
+            (
+                scope,
+                json.dumps([repo.to_dict() for repo in repos], ensure_ascii=False),
+                datetime.now().isoformat(),
+            ),
+        )
+        self.conn.commit()
+
+    def count(self) -> int:
+        """已完成的搜尋數"""
+        return self.conn.execute("SELECT COUNT(*) FROM crawl_checkpoint").fetchone()[0]
+
+    def clear(self) -> None:
+        """清除所有檢查點（開始新的一次爬取，或爬取成功完成時）"""
+        self.conn.execute("DELETE FROM crawl_checkpoint")
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
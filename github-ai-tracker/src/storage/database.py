@@ -0,0 +1,21 @@
+"""SQLite connection helper for the local tracker database"""
+
+import sqlite3
+from pathlib import Path
+
+from src.config import TRACKER_DB_PATH
+
+
+def connect(db_path: Path | str | None = None) -> sqlite3.Connection:
+    """
+    開啟本地 SQLite 資料庫（預設 data/tracker.db）
+
+    各儲存模組自行以 CREATE TABLE IF NOT EXISTS 建立所需的表。
+    """
+    path = Path(db_path or TRACKER_DB_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
@@ -0,0 +1,249 @@
+"""Append-only time series of repository metrics"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from src.models.repository import Repository
+
+from .database import connect
+
+SECONDS_PER_DAY = 86400.0
+
+
+@dataclass
+class GrowthStats:
+    """
+    每個 repo 在時間窗內的成長數據（各欄位為等長的 numpy 陣列）
+
+    以第一筆與最後一筆樣本計算，只有一筆樣本的 repo 成長為 0。
+    """
+
+    full_names: np.ndarray
+    samples: np.ndarray  # 時間窗內的樣本數
+    span_days: np.ndarray  # 第一筆到最後一筆樣本的天數
+    stars: np.ndarray  # 最新星星數
+    forks: np.ndarray  # 最新 Fork 數
+    first_fetched_at: np.ndarray  # 時間窗內第一筆樣本的時間（Unix 秒）
+    first_stars: np.ndarray
+    first_forks: np.ndarray
+    star_delta: np.ndarray
+    fork_delta: np.ndarray
+    star_growth_rate: np.ndarray  # star_delta / 起始星星數
+    star_velocity: np.ndarray  # 每天增加的星星數
+    fork_velocity: np.ndarray  # 每天增加的 Fork 數
+
+    def __len__(self) -> int:
+        return len(self.full_names)
+
+    def index(self) -> dict[str, int]:
+        """full_name -> 陣列索引"""
+        return {name: i for i, name in enumerate(self.full_names.tolist())}
+
+    def top(self, n: int, by: str = "star_velocity") -> list[str]:
+        """依指定欄位取前 N 名的 full_name"""
+        values = getattr(self, by)
+        order = np.argsort(-values, kind="stable")[:n]
+        return self.full_names[order].tolist()
+
+
+class RepositoryHistory:
+    """
+    每次執行的 repo 數據（stars / forks / issues）歷史紀錄
+
+    以 (full_name, fetched_at) 為主鍵的 WITHOUT ROWID 表儲存，同一個 repo 的樣本
+    在磁碟上連續排列，依 repo 讀取時間序列只需一次範圍掃描。
+    """
+
+    def __init__(self, db_path: Path | str | None = None):
+        self.conn = connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS repo_history (
+                full_name TEXT NOT NULL,
+                fetched_at INTEGER NOT NULL,
+                stars INTEGER NOT NULL,
+                forks INTEGER NOT NULL,
+                open_issues INTEGER NOT NULL,
+                PRIMARY KEY (full_name, fetched_at)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_repo_history_fetched_at
+                ON repo_history (fetched_at);
+        """)
+        self.conn.commit()
+
+    def record(
+        self,
+        repos: list[Repository],
+        fetched_at: datetime | None = None,
+        full_names: set[str] | None = None,
+    ) -> int:
+        """
+        寫入一次執行的數據（同一個 repo 在同一時間點只記一筆）
+
+        Args:
+            repos: 本次取得的 repositories
+            fetched_at: 本次執行時間（預設現在）
+            full_names: 只記錄這些 repo（本次搜尋取得或由檢查點續跑讀回的）；增量模式下
+                由快照補上、本次沒有重新取得的 repo 數據是舊的，記成新樣本會壓低成長率
+
+        Returns:
+            int: 新增的樣本數
+        """
+        timestamp = int((fetched_at or datetime.now()).timestamp())
+        rows = {
+            repo.full_name: (
+                repo.full_name,
+                timestamp,
+                repo.stargazers_count,
+                repo.forks_count,
+                repo.open_issues_count,
+            )
+            for repo in repos
+            if full_names is None or repo.full_name in full_names
+        }
+
+        before = self.conn.total_changes
+        self.conn.executemany(
+            """
+            INSERT OR IGNORE INTO repo_history
+                (full_name, fetched_at, stars, forks, open_issues)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows.values(),
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def iter_rows(
+        self,
+        since: datetime | None = None,
+        chunk_size: int = 5000,
+    ) -> Iterator[list[tuple[str, int, int, int, int]]]:
+        """
+        分批讀出歷史樣本（供匯出使用，不一次載入整張表）
+
+        Yields:
+            [(full_name, fetched_at(Unix 秒), stars, forks, open_issues), ...]
+        """
+        query = "SELECT full_name, fetched_at, stars, forks, open_issues FROM repo_history"
+        params: tuple = ()
+        if since is not None:
+            query += " WHERE fetched_at >= ?"
+            params = (int(since.timestamp()),)
+        cursor = self.conn.execute(query + " ORDER BY full_name, fetched_at", params)
+        while rows := cursor.fetchmany(chunk_size):
+            yield [tuple(row) for row in rows]
+
+    def series(self, full_name: str) -> list[tuple[datetime, int, int, int]]:
+        """取得單一 repo 的時間序列 [(fetched_at, stars, forks, open_issues), ...]"""
+        rows = self.conn.execute(
+            """
+            SELECT fetched_at, stars, forks, open_issues FROM repo_history
+            WHERE full_name = ?
+            ORDER BY fetched_at
+            """,
+            (full_name,),
+        ).fetchall()
+        return [
+            (datetime.fromtimestamp(row[0]), row[1], row[2], row[3])
+            for row in rows
+        ]
+
+    def growth(
+        self,
+        since: datetime | None = None,
+        full_names: list[str] | None = None,
+    ) -> GrowthStats:
+        """
+        計算時間窗內每個 repo 的成長率與速度（單次排序查詢 + 向量化運算）
+
+        Args:
+            since: 時間窗起點（預設使用全部歷史）
+            full_names: 只計算指定的 repos（預設全部）
+        """
+        query = "SELECT full_name, fetched_at, stars, forks FROM repo_history"
+        conditions = []
+        params: list = []
+        if since is not None:
+            conditions.append("fetched_at >= ?")
+            params.append(int(since.timestamp()))
+        if full_names is not None:
+            conditions.append(f"full_name IN ({','.join('?' * len(full_names))})")
+            params.extend(full_names)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY full_name, fetched_at"
+
+        rows = self.conn.execute(query, params).fetchall()
+        names, fetched_at, stars, forks = zip(*rows) if rows else ((), (), (), ())
+        return growth_from_arrays(
+            np.array(names, dtype=object),
+            np.array(fetched_at, dtype=np.int64),
+            np.array(stars, dtype=np.int64),
+            np.array(forks, dtype=np.int64),
+        )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def growth_from_arrays(
+    names: np.ndarray,
+    fetched_at: np.ndarray,
+    stars: np.ndarray,
+    forks: np.ndarray,
+) -> GrowthStats:
+    """
+    由依 (full_name, fetched_at) 排序的樣本計算每個 repo 的成長數據
+
+    每個 repo 的第一筆與最後一筆樣本以陣列切片一次取出，不需逐 repo 迴圈。
+    """
+    if len(names) == 0:
+        empty_int = np.array([], dtype=np.int64)
+        empty_float = np.array([], dtype=np.float64)
+        return GrowthStats(
+            full_names=np.array([], dtype=object),
+            samples=empty_int,
+            span_days=empty_float,
+            stars=empty_int,
+            forks=empty_int,
+            first_fetched_at=empty_int,
+            first_stars=empty_int,
+            first_forks=empty_int,
+            star_delta=empty_int,
+            fork_delta=empty_int,
+            star_growth_rate=empty_float,
+            star_velocity=empty_float,
+            fork_velocity=empty_float,
+        )
+
+    # 已排序，名稱改變的位置就是每個 repo 的第一筆
+    starts = np.flatnonzero(np.r_[True, names[1:] != names[:-1]])
+    ends = np.r_[starts[1:], len(names)] - 1
+
+    span_days = (fetched_at[ends] - fetched_at[starts]) / SECONDS_PER_DAY
+    star_delta = stars[ends] - stars[starts]
+    fork_delta = forks[ends] - forks[starts]
+
+    # 只有一筆樣本時 span 為 0，速度記為 0
+    safe_span = np.where(span_days > 0, span_days, 1.0)
+    has_span = span_days > 0
+
+    return GrowthStats(
+        full_names=names[starts],
+        samples=ends - starts + 1,
+        span_days=span_days,
+        stars=stars[ends],
+        forks=forks[ends],
+        first_fetched_at=fetched_at[starts],
+        first_stars=stars[starts],
+        first_forks=forks[starts],
+        star_delta=star_delta,
+        fork_delta=fork_delta,
+        star_growth_rate=star_delta / np.maximum(stars[starts], 1),
+        star_velocity=np.where(has_span, star_delta / safe_span, 0.0),
+        fork_velocity=np.where(has_span, fork_delta / safe_span, 0.0),
+    )
@@ -0,0 +1,73 @@
+"""On-disk ETag cache for GitHub API responses"""
+
+import hashlib
+import json
+import sqlite3
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .database import connect
+
+
+@dataclass
+class CachedResponse:
+    """快取的回應內容"""
+
+    etag: str
+    body: dict
+
+
+class ResponseCache:
+    """
+    以 query + page 為 key 的回應快取
+
+    下次請求帶上 `If-None-Match`，GitHub 回 304 時直接使用快取內容；
+    304 回應不計入 rate limit 額度。
+    """
+
+    def __init__(self, db_path: Path | str | None = None):
+        self.conn = connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                etag TEXT NOT NULL,
+                body BLOB NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(path: str, params: dict) -> str:
+        """以請求路徑與參數產生快取 key"""
+        raw = json.dumps([path, sorted(params.items())], ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """取得快取內容，沒有則回傳 None"""
+        row = self.conn.execute(
+            "SELECT etag, body FROM http_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(etag=row["etag"], body=json.loads(zlib.decompress(row["body"])))
+
+    def put(self, key: str, path: str, etag: str, body: dict) -> None:
+        """寫入或更新快取內容"""
+        compressed = zlib.compress(json.dumps(body, ensure_ascii=False).encode("utf-8"))
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO http_cache (key, path, etag, body, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (key, path, etag, sqlite3.Binary(compressed), datetime.now().isoformat()),
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
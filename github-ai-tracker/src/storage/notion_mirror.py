@@ -0,0 +1,172 @@
+"""Local mirror of the Notion database and of what was last written to each page"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+from .database import connect
+
+
+def hash_property(value: dict) -> str:
+    """計算單一 Notion 屬性 payload 的雜湊（key 排序後序列化）"""
+    raw = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class NotionMirror:
+    """
+    Notion 資料庫的本地鏡像
+
+    - notion_pages：每個頁面最後一次寫入的屬性雜湊，同步時只 PATCH 雜湊不同的屬性
+    - notion_index：資料庫中現有頁面（full_name → page_id / Updated At / Stars），
+      每次只以 last_edited_time 篩選查詢上次之後被編輯過的頁面來更新
+    - notion_state：上次更新鏡像的時間、整合（bot）本身的 user id
+    """
+
+    def __init__(self, db_path: Path | str | None = None):
+        self.conn = connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS notion_pages (
+                full_name TEXT PRIMARY KEY,
+                page_id TEXT NOT NULL,
+                property_hashes TEXT NOT NULL,
+                synced_at TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS notion_index (
+                full_name TEXT PRIMARY KEY,
+                page_id TEXT NOT NULL,
+                updated_at TEXT,
+                stars INTEGER,
+                last_edited_time TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS notion_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def get_hashes(self, full_name: str, page_id: str) -> dict[str, str] | None:
+        """
+        取得上次寫入的屬性雜湊，沒有紀錄則回傳 None
+
+        頁面在 Notion 被刪除重建（page_id 不同）時紀錄不再適用，同樣回傳 None。
+        """
+        row = self.conn.execute(
+            "SELECT property_hashes FROM notion_pages WHERE full_name = ? AND page_id = ?",
+            (full_name, page_id),
+        ).fetchone()
+        return json.loads(row["property_hashes"]) if row else None
+
+    def record(self, full_name: str, page_id: str, hashes: dict[str, str]) -> None:
+        """記錄寫入後頁面上所有屬性的雜湊"""
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO notion_pages (full_name, page_id, property_hashes, synced_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (full_name, page_id, json.dumps(hashes, sort_keys=True), datetime.now().isoformat()),
+        )
+        self.conn.commit()
+
+    def invalidate_hashes(self, full_names: list[str]) -> int:
+        """
+        清除指定頁面的屬性雜湊（頁面被其他人在 Notion 上編輯過時）
+
+        雜湊改為空的紀錄，下次同步時所有屬性都視為變更，送出完整 PATCH 覆蓋手動修改。
+
+        Returns:
+            int: 被清除的紀錄數
+        """
+        before = self.conn.total_changes
+        self.conn.executemany(
+            "UPDATE notion_pages SET property_hashes = '{}' WHERE full_name = ?",
+            [(full_name,) for full_name in full_names],
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def forget(self, full_name: str) -> None:
+        """移除單一頁面的鏡像與雜湊紀錄（頁面在 Notion 已被封存或刪除）"""
+        self.conn.execute("DELETE FROM notion_index WHERE full_name = ?", (full_name,))
+        self.conn.execute("DELETE FROM notion_pages WHERE full_name = ?", (full_name,))
+        self.conn.commit()
+
+    def load_index(self) -> dict[str, dict]:
+        """
+        取得鏡像中的所有頁面
+
+        Returns:
+            {full_name: {"page_id", "updated_at", "stars"}}，格式與 NotionSync.existing_pages 相同
+        """
+        return {
+            row["full_name"]: {
+                "page_id": row["page_id"],
+                "updated_at": datetime.fromisoformat(row["updated_at"]) if row["updated_at"] else None,
+                "stars": row["stars"],
+            }
+            for row in self.conn.execute(
+                "SELECT full_name, page_id, updated_at, stars FROM notion_index"
+            )
+        }
+
+    def upsert_index(self, entries: list[dict]) -> None:
+        """寫入從 Notion 查詢到的頁面（同一個 full_name 以最新的為準）"""
+        self.conn.executemany(
+            """
+            INSERT OR REPLACE INTO notion_index
+                (full_name, page_id, updated_at, stars, last_edited_time)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    entry["full_name"],
+                    entry["page_id"],
+                    entry["updated_at"].isoformat() if entry.get("updated_at") else None,
+                    entry.get("stars"),
+                    entry.get("last_edited_time"),
+                )
+                for entry in entries
+            ],
+        )
+        self.conn.commit()
+
+    def clear_index(self) -> None:
+        """清空頁面鏡像（完整重新載入前）"""
+        self.conn.execute("DELETE FROM notion_index")
+        self.conn.execute("DELETE FROM notion_state WHERE key = 'refreshed_at'")
+        self.conn.commit()
+
+    def get_refreshed_at(self) -> datetime | None:
+        """上次從 Notion 更新鏡像的時間"""
+        row = self.conn.execute(
+            "SELECT value FROM notion_state WHERE key = 'refreshed_at'"
+        ).fetchone()
+        return datetime.fromisoformat(row["value"]) if row else None
+
+    def set_refreshed_at(self, when: datetime) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO notion_state (key, value) VALUES ('refreshed_at', ?)",
+            (when.isoformat(),),
+        )
+        self.conn.commit()
+
+    def get_bot_user_id(self) -> str | None:
+        """整合（bot）本身的 Notion user id，用來分辨頁面是否被其他人編輯過"""
+        row = self.conn.execute(
+            "SELECT value FROM notion_state WHERE key = 'bot_user_id'"
+        ).fetchone()
+        return row["value"] if row else None
+
+    def set_bot_user_id(self, user_id: str) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO notion_state (key, value) VALUES ('bot_user_id', ?)",
+            (user_id,),
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
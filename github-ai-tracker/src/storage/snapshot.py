@@ -0,0 +1,158 @@
+"""Local snapshot of known repositories for incremental crawling"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from src.models.record import RepoRecord
+from src.models.repository import Repository
+
+from .database import connect
+
+
+class RepositorySnapshot:
+    """
+    已知 repositories 的本地快照（data/tracker.db）
+
+    增量爬取時只查詢 `pushed:>上次執行時間` 的差異，合併進快照後
+    再由快照在本地重新計算每個生態系的前 N 名。
+
+    readme_script 表記錄每個 repo README 的繁簡判斷結果，以 pushed_at 作為版本：
+    沒有新的 push 時 README 不會改變，下次執行不必再讀取。
+    """
+
+    def __init__(self, db_path: Path | str | None = None):
+        self.conn = connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS repo_snapshot (
+                ecosystem TEXT NOT NULL,
+                full_name TEXT NOT NULL,
+                forks_count INTEGER NOT NULL,
+                stargazers_count INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                last_seen_at TEXT NOT NULL,
+                PRIMARY KEY (ecosystem, full_name)
+            );
+            CREATE INDEX IF NOT EXISTS idx_repo_snapshot_forks
+                ON repo_snapshot (ecosystem, forks_count DESC);
+
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                scope TEXT PRIMARY KEY,
+                last_run TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS readme_script (
+                full_name TEXT PRIMARY KEY,
+                pushed_at TEXT NOT NULL,
+                script TEXT
+            );
+        """)
+        self.conn.commit()
+
+    def upsert(self, ecosystem: str, repos: list[Repository | RepoRecord]) -> None:
+        """
+        合併 repositories 到快照（tool_categories 取聯集）
+
+        爬取中的 RepoRecord 直接序列化寫入，不經 pydantic；讀出時（top）才驗證。
+        """
+        if not repos:
+            return
+
+        existing_categories: dict[str, set[str]] = {}
+        placeholders = ",".join("?" * len(repos))
+        for row in self.conn.execute(
+            f"SELECT full_name, data FROM repo_snapshot "
+            f"WHERE ecosystem = ? AND full_name IN ({placeholders})",
+            (ecosystem, *(repo.full_name for repo in repos)),
+        ):
+            existing_categories[row["full_name"]] = set(
+                json.loads(row["data"]).get("tool_categories", [])
+            )
+
+        now = datetime.now().isoformat()
+        rows = []
+        for repo in repos:
+            if isinstance(repo, RepoRecord):
+                data = repo.to_dict()
+            else:
+                data = repo.model_dump(mode="json")
+            categories = existing_categories.get(repo.full_name)
+            if categories and not categories.issubset(repo.tool_categories):
+                data["tool_categories"] = sorted(categories.union(repo.tool_categories))
+            rows.append((
+                ecosystem,
+                repo.full_name,
+                repo.forks_count,
+                repo.stargazers_count,
+                json.dumps(data, ensure_ascii=False),
+                now,
+            ))
+
+        self.conn.executemany(
+            """
+            INSERT OR REPLACE INTO repo_snapshot
+                (ecosystem, full_name, forks_count, stargazers_count, data, last_seen_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        self.conn.commit()
+
+    def top(self, ecosystem: str, limit: int | None = None) -> list[Repository]:
+        """取得快照中某生態系依 Fork 數排序的前 N 名（None 表示全部）"""
+        rows = self.conn.execute(
+            """
+            SELECT data FROM repo_snapshot
+            WHERE ecosystem = ?
+            ORDER BY forks_count DESC
+            LIMIT ?
+            """,
+            (ecosystem, -1 if limit is None else limit),
+        ).fetchall()
+        return [Repository.model_validate_json(row["data"]) for row in rows]
+
+    def count(self, ecosystem: str | None = None) -> int:
+        """快照中的 repository 數量"""
+        if ecosystem is None:
+            return self.conn.execute("SELECT COUNT(*) FROM repo_snapshot").fetchone()[0]
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM repo_snapshot WHERE ecosystem = ?", (ecosystem,)
+        ).fetchone()[0]
+
+    def get_last_run(self, scope: str) -> datetime | None:
+        """取得某個搜尋範圍上次成功爬取的時間"""
+        row = self.conn.execute(
+            "SELECT last_run FROM crawl_state WHERE scope = ?", (scope,)
+        ).fetchone()
+        return datetime.fromisoformat(row["last_run"]) if row else None
+
+    def set_last_run(self, scope: str, when: datetime) -> None:
+        """記錄某個搜尋範圍的爬取時間"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO crawl_state (scope, last_run) VALUES (?, ?)",
+            (scope, when.isoformat()),
+        )
+        self.conn.commit()
+
+    def load_readme_scripts(self) -> dict[str, tuple[str, str | None]]:
+        """
+        取得所有 README 判斷結果
+
+        Returns:
+            {full_name: (pushed_at, "traditional" / "simplified" / None)}
+        """
+        return {
+            row["full_name"]: (row["pushed_at"], row["script"])
+            for row in self.conn.execute("SELECT full_name, pushed_at, script FROM readme_script")
+        }
+
+    def record_readme_script(self, full_name: str, pushed_at: str, script: str | None) -> None:
+        """記錄 README 判斷結果（None 表示不是中文或無法判斷）"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO readme_script (full_name, pushed_at, script) VALUES (?, ?, ?)",
+            (full_name, pushed_at, script),
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
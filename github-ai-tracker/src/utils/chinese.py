@@ -0,0 +1,45 @@
+"""Local Traditional / Simplified Chinese script detection"""
+
+from typing import Literal
+
+ChineseScript = Literal["traditional", "simplified"]
+
+# 常用字的繁簡對照（只收兩邊字形不同、且不會在另一種寫法中單獨出現的字）
+_TRADITIONAL_CHARS = "這個們來說為時會對開關與發體過還進實現應問題學習資料檔項設計說明產生處圖網頁語數據庫務線範例載裝請點選單擇讀寫輸類訊號記憶錄鍵盤環境變檢測試驗證專案"
+_SIMPLIFIED_CHARS = "这个们来说为时会对开关与发体过还进实现应问题学习资料档项设计说明产生处图网页语数据库务线范例载装请点选单择读写输类讯号记忆录键盘环境变检测试验证专案"
+
+TRADITIONAL_ONLY = frozenset(_TRADITIONAL_CHARS) - frozenset(_SIMPLIFIED_CHARS)
+SIMPLIFIED_ONLY = frozenset(_SIMPLIFIED_CHARS) - frozenset(_TRADITIONAL_CHARS)
+
+# 判斷所需的最少特徵字數（太少時視為不是中文文件）
+MIN_SAMPLE = 8
+
+# 其中一種字形需佔特徵字的比例
+DOMINANCE = 0.75
+
+# 只看 README 開頭（翻譯段落通常在後面）
+MAX_SCAN_CHARS = 20_000
+
+
+def detect_chinese_script(text: str | None) -> ChineseScript | None:
+    """
+    依繁簡特徵字的比例判斷文字是繁體或簡體中文
+
+    Returns:
+        "traditional" / "simplified"；中文特徵字不足或繁簡混雜時回傳 None
+    """
+    if not text:
+        return None
+
+    sample = text[:MAX_SCAN_CHARS]
+    traditional = sum(map(TRADITIONAL_ONLY.__contains__, sample))
+    simplified = sum(map(SIMPLIFIED_ONLY.__contains__, sample))
+    total = traditional + simplified
+    if total < MIN_SAMPLE:
+        return None
+
+    if traditional >= total * DOMINANCE:
+        return "traditional"
+    if simplified >= total * DOMINANCE:
+        return "simplified"
+    return None
@@ -0,0 +1,166 @@
+"""Run-level metrics: timing spans, rate-limit waits and quota tracking"""
+
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+# 報告中列出的最慢 span 數量
+SLOWEST_SPANS = 20
+
+
+@dataclass
+class SpanStats:
+    """同名 span 的彙總"""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    errors: int = 0
+
+    def add(self, seconds: float, failed: bool) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if failed:
+            self.errors += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 3),
+            "max_seconds": round(self.max_seconds, 3),
+            "errors": self.errors,
+        }
+
+
+def _union_seconds(intervals: list[tuple[float, float]]) -> float:
+    """多個（可能重疊的）時間區間合併後的總長度"""
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+class RunMetrics:
+    """
+    一次執行的計時與額度紀錄
+
+    - span()：包住一段工作（一個 topic 的搜尋、一頁結果、一次 Notion upsert），
+      依名稱彙總次數 / 總耗時 / 最大耗時 / 錯誤數，並保留最慢的幾筆
+    - wait()：包住因 rate limit 而等待的時間；並行的等待以時間區間聯集計算，
+      得出整次執行中「被限流卡住」與「實際在工作」的牆鐘時間
+    - quota()：各 API 最新的剩餘額度與本次執行的最低點
+
+    所有紀錄在 event loop 的單一執行緒中進行，不需要加鎖。
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """清除所有紀錄並重新開始計時"""
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.spans: dict[str, SpanStats] = {}
+        self.waits: dict[str, SpanStats] = {}
+        self.counters: Counter[str] = Counter()
+        self.quotas: dict[str, dict[str, int | None]] = {}
+        self.context: dict[str, Any] = {}
+        self._wait_intervals: list[tuple[float, float]] = []
+        self._slowest: list[tuple[float, str, dict]] = []
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[None]:
+        """計時一段工作（例外會記為錯誤後照常拋出）"""
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            self.spans.setdefault(name, SpanStats()).add(seconds, failed)
+            self._keep_slowest(seconds, name, attrs)
+
+    @contextmanager
+    def wait(self, name: str) -> Iterator[None]:
+        """計時一段因 rate limit 而等待的時間"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.waits.setdefault(name, SpanStats()).add(end - start, False)
+            self._wait_intervals.append((start, end))
+
+    def quota(self, name: str, remaining: int | None, limit: int | None = None) -> None:
+        """記錄 API 剩餘額度"""
+        entry = self.quotas.setdefault(name, {"remaining": None, "limit": None, "min_remaining": None})
+        entry["remaining"] = remaining
+        if limit is not None:
+            entry["limit"] = limit
+        if remaining is not None and (entry["min_remaining"] is None or remaining < entry["min_remaining"]):
+            entry["min_remaining"] = remaining
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def _keep_slowest(self, seconds: float, name: str, attrs: dict) -> None:
+        if len(self._slowest) < SLOWEST_SPANS:
+            self._slowest.append((seconds, name, attrs))
+            return
+        fastest = min(range(len(self._slowest)), key=lambda i: self._slowest[i][0])
+        if seconds > self._slowest[fastest][0]:
+            self._slowest[fastest] = (seconds, name, attrs)
+
+    def report(self) -> dict:
+        """產生執行報告（可直接序列化為 JSON）"""
+        wall = time.perf_counter() - self._start
+        rate_limited = min(_union_seconds(self._wait_intervals), wall)
+        return {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "context": self.context,
+            "wall_seconds": round(wall, 3),
+            "rate_limited_seconds": round(rate_limited, 3),
+            "working_seconds": round(wall - rate_limited, 3),
+            "waits": {name: stats.to_dict() for name, stats in sorted(self.waits.items())},
+            "spans": {name: stats.to_dict() for name, stats in sorted(self.spans.items())},
+            "quota": self.quotas,
+            "counters": dict(sorted(self.counters.items())),
+            "slowest": [
+                {"name": name, "seconds": round(seconds, 3), **attrs}
+                for seconds, name, attrs in sorted(self._slowest, key=lambda s: s[0], reverse=True)
+            ],
+        }
+
+    def write(self, path: Path | str) -> Path:
+        """將執行報告寫成 JSON 檔"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.report(), indent=2, ensure_ascii=False, default=str),
+            encoding="utf-8",
+        )
+        return path
+
+
+# 整個程式共用的紀錄器（與 logger 相同，import 後直接使用）
+metrics = RunMetrics()
+
+__all__ = ["RunMetrics", "SpanStats", "metrics"]
@@ -0,0 +1,44 @@
+"""Tests for the crawl checkpoint store"""
+
+from src.models.record import RepoRecord
+from src.storage.checkpoint import CrawlCheckpoint
+
+
+def make_record(full_name: str, forks: int) -> RepoRecord:
+    owner, name = full_name.split("/")
+    return RepoRecord.from_github_item(
+        data={
+            "name": name,
+            "full_name": full_name,
+            "html_url": f"https://github.com/{full_name}",
+            "forks_count": forks,
+            "topics": ["llm"],
+            "license": {"name": "MIT License"},
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "updated_at": "2025-01-01T00:00:00Z",
+        },
+        ecosystem="ai_infrastructure",
+        matched_topic="llm",
+        tool_categories=["LangChain"],
+    )
+
+
+def test_checkpoint_round_trip_and_clear(tmp_path):
+    """測試檢查點記錄的結果可完整讀回，清除後視為未完成"""
+    checkpoint = CrawlCheckpoint(tmp_path / "tracker.db")
+    records = [make_record("a/one", 10), make_record("b/two", 20)]
+
+    assert checkpoint.load("ai_infrastructure:topic:llm") is None
+    checkpoint.save("ai_infrastructure:topic:llm", records)
+    checkpoint.save("ai_infrastructure:topic:rag", [])
+
+    loaded = checkpoint.load("ai_infrastructure:topic:llm")
+    assert [record.to_dict() for record in loaded] == [record.to_dict() for record in records]
+    assert loaded[0].to_repository() == records[0].to_repository()
+    assert checkpoint.load("ai_infrastructure:topic:rag") == []
+    assert checkpoint.count() == 2
+
+    checkpoint.clear()
+    assert checkpoint.count() == 0
+    assert checkpoint.load("ai_infrastructure:topic:llm") is None
+    checkpoint.close()
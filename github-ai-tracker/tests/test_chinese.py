@@ -0,0 +1,18 @@
+"""Tests for Traditional / Simplified Chinese detection"""
+
+from src.utils.chinese import detect_chinese_script
+
+
+def test_detects_traditional_and_simplified():
+    """測試依特徵字判斷繁體與簡體"""
+    traditional = "這個專案提供繁體中文說明，請點選下方連結開始使用，設計與實現都很簡單。"
+    simplified = "这个项目提供简体中文说明，请点选下方链接开始使用，设计与实现都很简单。"
+
+    assert detect_chinese_script(traditional) == "traditional"
+    assert detect_chinese_script(simplified) == "simplified"
+
+
+def test_returns_none_without_enough_chinese():
+    """測試英文或中文過少的文件不判斷"""
+    assert detect_chinese_script(None) is None
+    assert detect_chinese_script("An LLM toolkit. Supports 台灣 users.") is None
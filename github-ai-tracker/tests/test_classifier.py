@@ -0,0 +1,52 @@
+"""Tests for the tool-category classifier"""
+
+import pytest
+
+from src.classifier import ToolClassifier, default_classifier, normalize_topic
+
+
+def test_normalize_topic():
+    """測試 topic 正規化"""
+    assert normalize_topic(" Claude_Code ") == "claude-code"
+    assert normalize_topic("Model Context Protocol") == "model-context-protocol"
+
+
+def test_exact_alias_and_pattern_rules():
+    """測試精確對照、別名與萬用字元規則"""
+    assert default_classifier.classify(["cursor"]) == ["Cursor"]
+    assert default_classifier.classify(["claudecode"]) == ["Claude"]
+    assert default_classifier.classify(["Notebook_LM"]) == ["NotebookLM"]
+    assert default_classifier.classify(["filesystem-mcp"]) == ["MCP"]
+    assert default_classifier.classify(["pdf-mcp"]) == ["MCP", "PDF"]
+    assert default_classifier.classify(["unknown-topic"]) == []
+
+
+def test_classify_is_sorted_and_deduplicated():
+    """測試分類結果排序且不重複"""
+    categories = default_classifier.classify(["ollama", "mcp", "cursor-ai", "mcp-server", "cursor"])
+    assert categories == ["Cursor", "MCP", "Ollama"]
+
+
+def test_classify_batch_matches_classify_and_caches_topics():
+    """測試整批分類結果與逐筆一致，且每個 topic 只比對一次"""
+    classifier = ToolClassifier(
+        mapping={"mcp": "MCP", "cursor": "Cursor"},
+        aliases={},
+        patterns={"*-mcp": "MCP"},
+    )
+    batch = [["mcp"], ["cursor", "github-mcp"], ["mcp"], [], ["github-mcp", "cursor"]]
+
+    results = classifier.classify_batch(batch)
+
+    assert results == [classifier.classify(topics) for topics in batch]
+    assert results[1] == ["Cursor", "MCP"]
+    assert set(classifier._cache) == {"mcp", "cursor", "github-mcp"}
+    # 每筆結果是獨立的 list，修改其中一筆不影響其他結果
+    results[0].append("Other")
+    assert results[2] == ["MCP"]
+
+
+def test_alias_to_unknown_topic_raises():
+    """測試別名指向不存在的 topic 時拋出錯誤"""
+    with pytest.raises(ValueError, match="unknown topic"):
+        ToolClassifier(mapping={"mcp": "MCP"}, aliases={"m-c-p": "missing"}, patterns={})
@@ -0,0 +1,96 @@
+"""Tests for the streaming exporter"""
+
+import csv
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.exporter import RepositoryExporter, parse_formats
+from src.models.repository import Repository
+from src.storage.history import RepositoryHistory
+
+
+def make_repo(full_name: str, stars: int) -> Repository:
+    owner, name = full_name.split("/")
+    return Repository(
+        name=name,
+        full_name=full_name,
+        html_url=f"https://github.com/{full_name}",
+        stargazers_count=stars,
+        forks_count=stars // 10,
+        open_issues_count=0,
+        topics=["mcp", "llm"],
+        ecosystem="ai_infrastructure",
+        tool_categories=["MCP", "LLM"],
+        matched_topic="mcp",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        fetched_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def make_history(tmp_path) -> RepositoryHistory:
+    history = RepositoryHistory(tmp_path / "tracker.db")
+    run = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    for day in range(3):
+        history.record(
+            [make_repo("a/one", 10 + day), make_repo("b/two", 20 + day)],
+            fetched_at=run + timedelta(days=day),
+        )
+    return history
+
+
+def test_exports_csv_and_ndjson_in_chunks(tmp_path):
+    """測試分批匯出 CSV 與 NDJSON（含歷史樣本）"""
+    history = make_history(tmp_path)
+    repos = [make_repo(f"owner/repo-{i}", i * 10) for i in range(5)]
+    out_dir = tmp_path / "export"
+
+    paths = RepositoryExporter(["csv", "ndjson"], out_dir=out_dir, chunk_size=2).export(
+        repos, history=history
+    )
+
+    assert [path.name for path in paths] == [
+        "repositories.csv", "history.csv", "repositories.ndjson", "history.ndjson",
+    ]
+    with open(out_dir / "repositories.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["full_name"] for row in rows] == [repo.full_name for repo in repos]
+    assert rows[1]["tool_categories"] == "LLM;MCP"
+    assert rows[1]["created_at"] == "2024-01-01T00:00:00+00:00"
+
+    lines = (out_dir / "history.ndjson").read_text(encoding="utf-8").splitlines()
+    samples = [json.loads(line) for line in lines]
+    assert len(samples) == 6
+    assert samples[0] == {
+        "full_name": "a/one",
+        "fetched_at": "2025-06-01T00:00:00+00:00",
+        "stars": 10,
+        "forks": 1,
+        "open_issues": 0,
+    }
+    assert not list(out_dir.glob(".*.tmp"))
+
+
+def test_exports_parquet(tmp_path):
+    """測試匯出 Parquet（需要選用的 pyarrow）"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    repos = [make_repo(f"owner/repo-{i}", i * 10) for i in range(5)]
+
+    RepositoryExporter(["parquet"], out_dir=tmp_path, chunk_size=2).export(repos)
+
+    parquet = pq.ParquetFile(tmp_path / "repositories.parquet")
+    assert parquet.metadata.num_rows == 5
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("tool_categories").to_pylist()[0] == ["LLM", "MCP"]
+    assert str(table.schema.field("created_at").type) == "timestamp[us, tz=UTC]"
+
+
+def test_parse_formats_rejects_unknown():
+    """測試格式設定解析"""
+    assert parse_formats("csv, parquet,csv") == ["csv", "parquet"]
+    assert parse_formats("") == []
+    with pytest.raises(ValueError):
+        parse_formats("xlsx")
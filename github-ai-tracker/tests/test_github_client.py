@@ -0,0 +1,479 @@
+"""Tests for the GitHub API client"""
+
+import asyncio
+import json
+import re
+from datetime import date
+
+import httpx
+
+from src.clients.github_client import GitHubClient
+from src.clients.github_graphql import node_to_rest_item
+from src.clients.query_planner import CreatedRange
+from src.models.repository import Repository
+from src.storage.checkpoint import CrawlCheckpoint
+from src.storage.http_cache import ResponseCache
+from src.storage.snapshot import RepositorySnapshot
+
+SEARCH_URL = re.compile(r"https://api\.github\.com/search/repositories.*")
+
+
+def make_item(full_name: str, forks: int, topics: list[str] | None = None) -> dict:
+    """建立 GitHub search API 的單筆結果"""
+    owner, name = full_name.split("/")
+    return {
+        "name": name,
+        "full_name": full_name,
+        "html_url": f"https://github.com/{full_name}",
+        "stargazers_count": forks * 10,
+        "forks_count": forks,
+        "open_issues_count": 0,
+        "topics": topics or [],
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def search_response(items: list[dict], remaining: int = 29) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"total_count": len(items), "items": items},
+        headers={
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": "4102444800",
+            "X-RateLimit-Limit": "30",
+        },
+    )
+
+
+async def test_search_ecosystem_merges_topics_and_sorts_by_forks(httpx_mock):
+    """測試並行搜尋多個 topics 後合併、去重並依 Fork 數排序"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        if query == "topic:cursor":
+            return search_response([
+                make_item("a/one", 10, ["cursor"]),
+                make_item("b/two", 50, ["cursor"]),
+            ])
+        return search_response([
+            make_item("a/one", 10, ["mcp"]),
+            make_item("c/three", 30, ["mcp"]),
+        ])
+
+    httpx_mock.add_callback(handler, url=SEARCH_URL, is_reusable=True)
+
+    async with GitHubClient(token="test") as client:
+        repos = await client.search_ecosystem("vibe_coding_ide", ["cursor", "mcp"], max_results=10)
+
+    assert [r.full_name for r in repos] == ["b/two", "c/three", "a/one"]
+    merged = next(r for r in repos if r.full_name == "a/one")
+    assert sorted(merged.tool_categories) == ["Cursor", "MCP"]
+
+
+async def test_search_updates_governor_from_headers(httpx_mock):
+    """測試搜尋回應的 rate limit 標頭會更新共用限流器"""
+    httpx_mock.add_response(
+        url=SEARCH_URL,
+        json={"total_count": 1, "items": [make_item("a/one", 1)]},
+        headers={"X-RateLimit-Remaining": "7", "X-RateLimit-Reset": "4102444800"},
+    )
+
+    async with GitHubClient(token="test") as client:
+        await client.search_ecosystem("pdf_tools", ["ocr"])
+
+    assert client.search_governor.remaining == 7
+    assert client.search_governor.reset_at == 4102444800
+
+
+async def test_client_reuses_pooled_connection_until_closed():
+    """測試 context manager 期間共用同一個 HTTP client，離開後關閉"""
+    async with GitHubClient(token="test") as client:
+        pooled = client._get_client()
+        assert client._get_client() is pooled
+        assert pooled.headers["Authorization"] == "Bearer test"
+
+    assert pooled.is_closed
+    assert client._client is None
+
+
+def make_node(full_name: str, forks: int) -> dict:
+    """建立 GraphQL Repository node"""
+    owner, name = full_name.split("/")
+    return {
+        "id": f"R_{name}",
+        "name": name,
+        "nameWithOwner": full_name,
+        "description": None,
+        "url": f"https://github.com/{full_name}",
+        "homepageUrl": "",
+        "stargazerCount": forks * 10,
+        "forkCount": forks,
+        "issues": {"totalCount": 3},
+        "pullRequests": {"totalCount": 2},
+        "primaryLanguage": {"name": "Python"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "rag"}}]},
+        "licenseInfo": {"name": "MIT License"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+        "pushedAt": "2025-01-01T00:00:00Z",
+    }
+
+
+async def test_graphql_mode_fetches_shared_repos_once(httpx_mock):
+    """測試 GraphQL 模式下跨 topic 重複出現的 repo 只批次取一次"""
+    nodes = {"R_shared": make_node("a/shared", 100), "R_only": make_node("b/only", 5)}
+    fetched_ids: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        variables = payload["variables"]
+        if "search(" in payload["query"]:
+            assert variables["q"].endswith("sort:forks-desc")
+            ids = ["R_shared", "R_only"] if "topic:rag" in variables["q"] else ["R_shared"]
+            return httpx.Response(200, json={"data": {"search": {
+                "repositoryCount": len(ids),
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [{"id": node_id} for node_id in ids],
+            }}})
+        fetched_ids.extend(variables["ids"])
+        return httpx.Response(200, json={"data": {"nodes": [nodes[i] for i in variables["ids"]]}})
+
+    httpx_mock.add_callback(handler, url="https://api.github.com/graphql", is_reusable=True)
+
+    async with GitHubClient(token="test", fetch_mode="graphql") as client:
+        first = await client._search_topic("ai_infrastructure", "llm")
+        second = await client._search_topic("ai_infrastructure", "rag")
+
+    assert [r.full_name for r in first] == ["a/shared"]
+    assert [r.full_name for r in second] == ["a/shared", "b/only"]
+    assert sorted(fetched_ids) == ["R_only", "R_shared"]
+
+
+async def test_graphql_mode_concurrent_topics_share_node_fetch(httpx_mock):
+    """測試並行的 topic 搜尋共用正在進行中的 node 批次，不重複取回同一個 repo"""
+    nodes = {"R_shared": make_node("a/shared", 100), "R_only": make_node("b/only", 5)}
+    fetched_ids: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        variables = payload["variables"]
+        if "search(" in payload["query"]:
+            ids = ["R_shared", "R_only"] if "topic:rag" in variables["q"] else ["R_shared"]
+            return httpx.Response(200, json={"data": {"search": {
+                "repositoryCount": len(ids),
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [{"id": node_id} for node_id in ids],
+            }}})
+        fetched_ids.extend(variables["ids"])
+        # 取回 node 較慢：另一個 topic 的搜尋在這期間完成
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"data": {"nodes": [nodes[i] for i in variables["ids"]]}})
+
+    httpx_mock.add_callback(handler, url="https://api.github.com/graphql", is_reusable=True)
+
+    async with GitHubClient(token="test", fetch_mode="graphql") as client:
+        first, second = await asyncio.gather(
+            client._search_topic("ai_infrastructure", "llm"),
+            client._search_topic("ai_infrastructure", "rag"),
+        )
+
+    assert [r.full_name for r in first] == ["a/shared"]
+    assert [r.full_name for r in second] == ["a/shared", "b/only"]
+    assert sorted(fetched_ids) == ["R_only", "R_shared"]
+
+
+def test_node_to_rest_item_matches_rest_shape():
+    """測試 GraphQL node 轉換後可直接建立 Repository"""
+    item = node_to_rest_item(make_node("a/shared", 100))
+    repo = Repository.from_github_response(
+        data=item,
+        ecosystem="ai_infrastructure",
+        matched_topic="rag",
+        tool_categories=[],
+    )
+
+    assert repo.full_name == "a/shared"
+    assert repo.forks_count == 100
+    assert repo.open_issues_count == 5  # issues + PRs，與 REST 相同語意
+    assert repo.topics == ["rag"]
+    assert repo.license_name == "MIT License"
+    assert repo.homepage is None
+
+
+async def test_search_uses_etag_cache_on_not_modified(httpx_mock, tmp_path):
+    """測試第二次搜尋帶 If-None-Match，304 時使用快取內容且退還額度"""
+    cache = ResponseCache(tmp_path / "tracker.db")
+    body = {"total_count": 1, "items": [make_item("a/one", 1)]}
+
+    httpx_mock.add_response(
+        url=SEARCH_URL,
+        json=body,
+        headers={"ETag": 'W/"abc"', "X-RateLimit-Remaining": "29", "X-RateLimit-Reset": "4102444800"},
+    )
+    httpx_mock.add_response(
+        url=SEARCH_URL,
+        status_code=304,
+        match_headers={"If-None-Match": 'W/"abc"'},
+        headers={"X-RateLimit-Remaining": "29", "X-RateLimit-Reset": "4102444800"},
+    )
+
+    async with GitHubClient(token="test", response_cache=cache) as client:
+        first = await client._search_topic("pdf_tools", "ocr")
+        second = await client._search_topic("pdf_tools", "ocr")
+
+    assert [r.full_name for r in first] == [r.full_name for r in second] == ["a/one"]
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert client.search_governor.remaining == 29
+
+
+async def test_incremental_search_queries_only_pushed_deltas(httpx_mock, tmp_path):
+    """測試增量模式第二次只查詢 pushed:> 差異，並由快照重新計算前 N 名"""
+    snapshot = RepositorySnapshot(tmp_path / "tracker.db")
+    queries: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        if "pushed:>" in query:
+            return search_response([make_item("c/three", 25, ["ocr"])])
+        return search_response([make_item("a/one", 10, ["ocr"]), make_item("b/two", 20, ["ocr"])])
+
+    httpx_mock.add_callback(handler, url=SEARCH_URL, is_reusable=True)
+
+    async with GitHubClient(token="test", snapshot=snapshot, incremental=True) as client:
+        first = await client.search_ecosystem("pdf_tools", ["ocr"], max_results=2)
+        second = await client.search_ecosystem("pdf_tools", ["ocr"], max_results=2)
+
+    assert [r.full_name for r in first] == ["b/two", "a/one"]
+    assert [r.full_name for r in second] == ["c/three", "b/two"]
+    assert queries[0] == "topic:ocr"
+    assert re.fullmatch(r"topic:ocr pushed:>\S+Z forks:>=10", queries[1])
+
+
+async def test_search_shards_by_creation_date_past_result_cap(httpx_mock):
+    """測試超過 1000 筆的查詢依建立日期分片，取回全部結果"""
+    items = []
+    for i in range(2500):
+        item = make_item(f"owner/repo-{i}", i)
+        item["created_at"] = f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T00:00:00Z"
+        items.append(item)
+    created = re.compile(r"created:(?:>=(\S+)|(\S+)\.\.(\S+))")
+    queries: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        page = int(request.url.params["page"])
+        per_page = int(request.url.params["per_page"])
+        queries.append(query)
+
+        matched = items
+        shard = created.search(query)
+        if shard:
+            start = shard.group(1) or shard.group(2)
+            end = shard.group(3) or "9999-12-31"
+            matched = [item for item in items if start <= item["created_at"][:10] <= end]
+        # 與 GitHub 一樣只能分頁取得前 1000 筆
+        return httpx.Response(200, json={
+            "total_count": len(matched),
+            "items": matched[:1000][(page - 1) * per_page:page * per_page],
+        })
+
+    httpx_mock.add_callback(handler, url=SEARCH_URL, is_reusable=True)
+
+    async with GitHubClient(token="test") as client:
+        everything = await client._search_repos("topic:llm", "ai_infrastructure", "llm", max_results=None)
+        top = await client._search_repos("topic:llm", "ai_infrastructure", "llm", max_results=1500)
+
+    assert len(everything) == 2500
+    assert len({repo.full_name for repo in everything}) == 2500
+    assert [repo.forks_count for repo in top] == list(range(2499, 999, -1))
+    assert queries[0] == "topic:llm"
+    assert any("created:" in query for query in queries)
+
+
+async def test_unsplittable_shard_keeps_first_page(httpx_mock):
+    """測試同一天建立的分片仍超過上限時照常分頁取前 1000 筆，不重複請求第一頁"""
+    items = [make_item(f"owner/repo-{i}", 1500 - i) for i in range(1500)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json={
+            "total_count": len(items),
+            "items": items[:1000][(page - 1) * 100:page * 100],
+        })
+
+    httpx_mock.add_callback(handler, url=SEARCH_URL, is_reusable=True)
+
+    day = date(2024, 1, 1)
+    async with GitHubClient(token="test") as client:
+        repos = await client._search_sharded(
+            "topic:llm", "ai_infrastructure", "llm", "forks", True, CreatedRange(day, day)
+        )
+
+    pages = [int(r.url.params["page"]) for r in httpx_mock.get_requests()]
+    assert pages == list(range(1, 11))
+    assert len(repos) == 1000
+
+
+async def test_search_waits_out_secondary_rate_limit(httpx_mock, monkeypatch):
+    """測試 403 次要限制時依 Retry-After 等待後重試，而不是放棄搜尋"""
+    monkeypatch.setattr("src.clients.rate_limit.RESET_MARGIN_SECONDS", 0.0)
+    responses = [
+        httpx.Response(
+            403,
+            json={"message": "You have exceeded a secondary rate limit."},
+            headers={"Retry-After": "0"},
+        ),
+        search_response([make_item("a/one", 10, ["mcp"])]),
+    ]
+    httpx_mock.add_callback(lambda request: responses.pop(0), url=SEARCH_URL, is_reusable=True)
+
+    async with GitHubClient(token="test") as client:
+        repos = await client._search_repos("topic:mcp", "ai_infrastructure", "mcp")
+
+    assert [repo.full_name for repo in repos] == ["a/one"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+async def test_resume_skips_checkpointed_topics(httpx_mock, tmp_path):
+    """測試 resume 時已完成的 topic 直接讀回檢查點，只重試上次失敗的 topic"""
+    checkpoint = CrawlCheckpoint(tmp_path / "tracker.db")
+    queries: list[str] = []
+    mcp_down = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        queries.append(query)
+        if query == "topic:mcp":
+            if mcp_down:
+                return httpx.Response(500)
+            return search_response([make_item("c/three", 30, ["mcp"])])
+        return search_response([make_item("a/one", 10, ["cursor"]), make_item("b/two", 50, ["cursor"])])
+
+    httpx_mock.add_callback(handler, url=SEARCH_URL, is_reusable=True)
+
+    async with GitHubClient(token="test", checkpoint=checkpoint) as client:
+        first = await client.search_ecosystem("vibe_coding_ide", ["cursor", "mcp"], max_results=10)
+    assert [r.full_name for r in first] == ["b/two", "a/one"]
+    assert client.failed_searches == ["vibe_coding_ide:mcp"]
+
+    mcp_down = False
+    queries.clear()
+    async with GitHubClient(token="test", checkpoint=checkpoint, resume=True) as client:
+        second = await client.search_ecosystem("vibe_coding_ide", ["cursor", "mcp"], max_results=10)
+
+    assert queries == ["topic:mcp"]
+    assert [r.full_name for r in second] == ["b/two", "c/three", "a/one"]
+    assert client.failed_searches == []
+
+
+async def test_fetch_all_streams_batches_in_topics_order(httpx_mock, monkeypatch):
+    """測試各生態系依 TOPICS 順序交給 on_batch，重複的 repo 只在分類有變動時再次送出"""
+    monkeypatch.setattr(
+        "src.clients.github_client.TOPICS",
+        {"vibe_coding_ide": ["cursor"], "ai_infrastructure": ["mcp"]},
+    )
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        query = request.url.params["q"]
+        if query == "topic:cursor":
+            await asyncio.sleep(0.05)  # 第一個生態系較晚完成
+            return search_response([make_item("a/one", 10, ["cursor"])])
+        if query == "topic:mcp":
+            return search_response([make_item("a/one", 10, ["mcp"]), make_item("b/two", 5, ["mcp"])])
+        return search_response([])
+
+    httpx_mock.add_callback(handler, url=SEARCH_URL, is_reusable=True)
+    batches: list[list[str]] = []
+
+    async def on_batch(repos):
+        batches.append([r.full_name for r in repos])
+
+    async with GitHubClient(token="test") as client:
+        repos = await client.fetch_all_repositories(on_batch=on_batch)
+
+    assert batches == [["a/one"], ["a/one", "b/two"]]
+    merged = next(r for r in repos if r.full_name == "a/one")
+    assert merged.ecosystem == "vibe_coding_ide"
+    assert sorted(merged.tool_categories) == ["Cursor", "MCP"]
+
+
+async def test_chinese_search_keeps_only_traditional_readmes(httpx_mock, monkeypatch):
+    """測試繁體中文搜尋以合併查詢執行，並依 README 字形篩選"""
+    monkeypatch.setattr("src.clients.github_client.CHINESE_KEYWORDS", ["繁體中文", "台灣"])
+    monkeypatch.setattr("src.clients.github_client.CHINESE_AI_TOPICS", ["llm", "ollama"])
+    readmes = {
+        "tw/app": "這個專案提供繁體中文說明，請點選下方連結開始使用，設計與實現都很簡單。",
+        "cn/app": "这个项目提供简体中文说明，请点选下方链接开始使用，设计与实现都很简单。",
+    }
+
+    httpx_mock.add_response(
+        url=SEARCH_URL,
+        json={
+            "total_count": 2,
+            "items": [make_item("tw/app", 5, ["ollama"]), make_item("cn/app", 50, ["llm"])],
+        },
+    )
+    def readme(request: httpx.Request) -> httpx.Response:
+        full_name = request.url.path.removeprefix("/repos/").removesuffix("/readme")
+        return httpx.Response(200, text=readmes[full_name])
+
+    httpx_mock.add_callback(
+        readme,
+        url=re.compile(r"https://api\.github\.com/repos/.*/readme"),
+        is_reusable=True,
+    )
+
+    async with GitHubClient(token="test") as client:
+        repos = await client.search_chinese_projects()
+
+    search_requests = [r for r in httpx_mock.get_requests() if r.url.path == "/search/repositories"]
+    assert [r.url.params["q"] for r in search_requests] == [
+        "(繁體中文 OR 台灣) (llm OR ollama) in:readme"
+    ]
+    assert [r.full_name for r in repos] == ["tw/app"]
+    assert repos[0].matched_topic == "chinese-ollama"
+
+
+async def test_readme_verdicts_are_reused_until_next_push(httpx_mock, monkeypatch, tmp_path):
+    """測試 README 判斷結果存在快照中，pushed_at 沒變時下次執行不再讀取"""
+    monkeypatch.setattr("src.clients.github_client.CHINESE_KEYWORDS", ["繁體中文"])
+    monkeypatch.setattr("src.clients.github_client.CHINESE_AI_TOPICS", ["llm"])
+    snapshot = RepositorySnapshot(tmp_path / "tracker.db")
+    tw_app = make_item("tw/app", 5, ["llm"]) | {"pushed_at": "2025-01-01T00:00:00Z"}
+    cn_app = make_item("cn/app", 50, ["llm"]) | {"pushed_at": "2025-01-01T00:00:00Z"}
+
+    httpx_mock.add_response(url=SEARCH_URL, json={"total_count": 2, "items": [tw_app, cn_app]})
+    httpx_mock.add_response(url=SEARCH_URL, json={"total_count": 2, "items": [tw_app, cn_app]})
+    httpx_mock.add_response(
+        url=SEARCH_URL,
+        json={"total_count": 2, "items": [tw_app, cn_app | {"pushed_at": "2025-02-01T00:00:00Z"}]},
+    )
+    httpx_mock.add_response(
+        url="https://api.github.com/repos/tw/app/readme",
+        text="這個專案提供繁體中文說明，請點選下方連結開始使用，設計與實現都很簡單。",
+    )
+    httpx_mock.add_response(
+        url="https://api.github.com/repos/cn/app/readme",
+        text="这个项目提供简体中文说明，请点选下方链接开始使用，设计与实现都很简单。",
+        is_reusable=True,
+    )
+
+    def readme_requests() -> list[str]:
+        return [r.url.path for r in httpx_mock.get_requests() if r.url.path.endswith("/readme")]
+
+    async with GitHubClient(token="test", snapshot=snapshot) as client:
+        first = await client.search_chinese_projects()
+    assert len(readme_requests()) == 2
+
+    async with GitHubClient(token="test", snapshot=snapshot) as client:
+        second = await client.search_chinese_projects()
+    assert len(readme_requests()) == 2
+
+    # cn/app 有新的 push → 只重新讀取它的 README
+    async with GitHubClient(token="test", snapshot=snapshot) as client:
+        await client.search_chinese_projects()
+    assert readme_requests()[2:] == ["/repos/cn/app/readme"]
+    assert [r.full_name for r in first] == [r.full_name for r in second] == ["tw/app"]
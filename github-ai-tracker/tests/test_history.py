@@ -0,0 +1,118 @@
+"""Tests for the repository history store"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.clients.github_client import GitHubClient
+from src.models.record import RepoRecord
+from src.models.repository import Repository
+from src.storage.checkpoint import CrawlCheckpoint
+from src.storage.history import RepositoryHistory, growth_from_arrays
+
+
+def make_repo(full_name: str, stars: int, forks: int = 0) -> Repository:
+    owner, name = full_name.split("/")
+    return Repository(
+        name=name,
+        full_name=full_name,
+        html_url=f"https://github.com/{full_name}",
+        stargazers_count=stars,
+        forks_count=forks,
+        open_issues_count=0,
+        ecosystem="ai_infrastructure",
+        matched_topic="llm",
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2025, 1, 1),
+        fetched_at=datetime(2025, 1, 1),
+    )
+
+
+def test_record_is_append_only_per_run(tmp_path):
+    """測試同一次執行重複出現的 repo 只記一筆，不同執行各記一筆"""
+    history = RepositoryHistory(tmp_path / "tracker.db")
+    run = datetime(2025, 6, 1)
+
+    assert history.record([make_repo("a/one", 10), make_repo("a/one", 10)], fetched_at=run) == 1
+    assert history.record([make_repo("a/one", 10)], fetched_at=run) == 0
+    assert history.record([make_repo("a/one", 25)], fetched_at=run + timedelta(days=1)) == 1
+
+    assert [stars for _, stars, _, _ in history.series("a/one")] == [10, 25]
+
+
+def test_record_skips_repos_not_fetched_this_run(tmp_path):
+    """測試不在本次取得名單中的（快照中的舊數據）repo 不記成新樣本"""
+    history = RepositoryHistory(tmp_path / "tracker.db")
+    run = datetime(2025, 6, 1)
+    fresh = make_repo("a/one", 30)
+    stale = make_repo("b/two", 10)  # 只是從快照讀出
+
+    assert history.record([fresh, stale], fetched_at=run, full_names={"a/one"}) == 1
+    assert history.series("b/two") == []
+
+
+async def test_record_keeps_repos_resumed_from_checkpoint(tmp_path):
+    """測試 --resume 讀回的檢查點結果（fetched_at 是中斷那次執行的時間）仍寫入歷史"""
+    checkpoint = CrawlCheckpoint(tmp_path / "tracker.db")
+    failed_run = datetime(2025, 6, 1, 6)
+    checkpoint.save("ai_infrastructure:topic:llm", [
+        RepoRecord.from_github_item(
+            {
+                "name": "one",
+                "full_name": "a/one",
+                "html_url": "https://github.com/a/one",
+                "stargazers_count": 30,
+                "created_at": "2024-01-01T00:00:00+00:00",
+                "updated_at": "2025-05-01T00:00:00Z",
+            },
+            ecosystem="ai_infrastructure",
+            matched_topic="llm",
+            tool_categories=[],
+            fetched_at=failed_run,
+        )
+    ])
+
+    async with GitHubClient(token="test", checkpoint=checkpoint, resume=True) as client:
+        repos = await client._search_tracked("topic:llm", "ai_infrastructure", "llm", max_results=10)
+
+    history = RepositoryHistory(tmp_path / "tracker.db")
+    resumed_run = failed_run + timedelta(hours=1)
+    repositories = [record.to_repository() for record in repos]
+    assert history.record(repositories, fetched_at=resumed_run, full_names=client.crawled) == 1
+    assert [stars for _, stars, _, _ in history.series("a/one")] == [30]
+
+
+def test_growth_computes_velocity_within_window(tmp_path):
+    """測試成長數據以時間窗內第一筆與最後一筆樣本計算"""
+    history = RepositoryHistory(tmp_path / "tracker.db")
+    start = datetime(2025, 6, 1)
+    history.record([make_repo("a/one", 100, 10), make_repo("b/two", 50)], fetched_at=start)
+    history.record([make_repo("a/one", 120, 12)], fetched_at=start + timedelta(days=2))
+    history.record([make_repo("a/one", 160, 14), make_repo("c/new", 5)], fetched_at=start + timedelta(days=4))
+
+    growth = history.growth()
+    index = growth.index()
+    one = index["a/one"]
+
+    assert growth.star_delta[one] == 60
+    assert growth.star_velocity[one] == 15.0
+    assert growth.fork_velocity[one] == 1.0
+    assert growth.star_growth_rate[one] == 0.6
+    assert growth.samples[one] == 3
+    assert growth.star_velocity[index["b/two"]] == 0.0  # 只有一筆樣本
+    assert growth.top(1) == ["a/one"]
+
+    recent = history.growth(since=start + timedelta(days=1), full_names=["a/one"])
+    assert recent.full_names.tolist() == ["a/one"]
+    assert recent.star_velocity[0] == 20.0
+
+
+def test_growth_from_empty_arrays():
+    growth = growth_from_arrays(
+        np.array([], dtype=object),
+        np.array([], dtype=np.int64),
+        np.array([], dtype=np.int64),
+        np.array([], dtype=np.int64),
+    )
+    assert len(growth) == 0
+    assert growth.top(5) == []
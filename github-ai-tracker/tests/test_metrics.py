@@ -0,0 +1,51 @@
+"""Tests for run-level metrics"""
+
+import json
+
+import pytest
+
+from src.clients.rate_limit import RateLimitGovernor
+from src.utils.metrics import RunMetrics, _union_seconds
+
+
+def test_span_aggregates_and_counts_errors():
+    """測試 span 依名稱彙總並記錄錯誤"""
+    metrics = RunMetrics()
+    with metrics.span("github.search_page", page=1):
+        pass
+    with pytest.raises(RuntimeError):
+        with metrics.span("github.search_page", page=2):
+            raise RuntimeError("boom")
+
+    report = metrics.report()
+    assert report["spans"]["github.search_page"]["count"] == 2
+    assert report["spans"]["github.search_page"]["errors"] == 1
+    assert {entry["page"] for entry in report["slowest"]} == {1, 2}
+
+
+def test_overlapping_waits_count_once_in_wall_time():
+    """測試並行的等待以區間聯集計入限流時間"""
+    assert _union_seconds([(0, 2), (1, 3), (5, 6)]) == 4
+    assert _union_seconds([]) == 0
+
+
+async def test_governor_records_waits_and_quota(tmp_path, monkeypatch):
+    """測試限流器的等待與額度寫入執行報告"""
+    metrics = RunMetrics()
+    monkeypatch.setattr("src.clients.rate_limit.metrics", metrics)
+
+    governor = RateLimitGovernor(name="search", max_concurrency=2, min_interval=0.02)
+    governor.update({
+        "x-ratelimit-remaining": "5",
+        "x-ratelimit-reset": "4102444800",
+        "x-ratelimit-limit": "30",
+    })
+    for _ in range(2):
+        async with governor.slot():
+            pass
+
+    path = metrics.write(tmp_path / "report.json")
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert report["quota"]["search"] == {"remaining": 5, "limit": 30, "min_remaining": 5}
+    assert report["waits"]["search"]["count"] == 1
+    assert 0 < report["rate_limited_seconds"] <= report["wall_seconds"]
@@ -3,6 +3,7 @@
 from datetime import datetime
 import pytest
 
+from src.models.record import RepoRecord
 from src.models.repository import Repository
 
 
@@ -164,3 +165,43 @@ def test_repository_inequality():
     )
 
     assert repo1 != repo2
+
+
+def test_repo_record_matches_repository():
+    """測試 RepoRecord 轉換後與直接建立的 Repository 欄位相同"""
+    mock_response = {
+        "name": "test-repo",
+        "full_name": "owner/test-repo",
+        "description": "A test repository",
+        "html_url": "https://github.com/owner/test-repo",
+        "homepage": "",
+        "stargazers_count": 1000,
+        "forks_count": 100,
+        "open_issues_count": 10,
+        "language": "Python",
+        "topics": ["cursor", "mcp"],
+        "license": {"name": "MIT License"},
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2025-01-15T00:00:00Z",
+    }
+    fetched_at = datetime(2025, 2, 1)
+
+    record = RepoRecord.from_github_item(
+        data=mock_response,
+        ecosystem="ai_coding_agents",
+        matched_topic="cursor",
+        tool_categories=["Cursor", "MCP"],
+        fetched_at=fetched_at,
+    )
+    expected = Repository.from_github_response(
+        data=mock_response,
+        ecosystem="ai_coding_agents",
+        matched_topic="cursor",
+        tool_categories=["Cursor", "MCP"],
+    ).model_copy(update={"fetched_at": fetched_at})
+
+    assert record.forks_count == 100
+    assert record.created_at.year == 2024
+    assert record.to_repository().model_dump() == expected.model_dump()
+    assert Repository.model_validate(record.to_dict()).model_dump() == expected.model_dump()
+    assert not hasattr(record, "__dict__")
@@ -0,0 +1,240 @@
+"""Tests for the Notion sync client"""
+
+import json
+from datetime import datetime, timezone
+
+import httpx
+
+from src.clients.notion_sync import NotionSync
+from src.clients.notion_transport import BACKOFF_SECONDS, _retry_delay
+from src.models.repository import Repository
+from src.storage.notion_mirror import NotionMirror
+
+QUERY_URL = "https://api.notion.com/v1/databases/db123/query"
+PAGES_URL = "https://api.notion.com/v1/pages"
+
+
+def make_repo(full_name: str, updated_at: datetime, stars: int = 100) -> Repository:
+    owner, name = full_name.split("/")
+    return Repository(
+        name=name,
+        full_name=full_name,
+        html_url=f"https://github.com/{full_name}",
+        stargazers_count=stars,
+        forks_count=10,
+        open_issues_count=0,
+        ecosystem="ai_infrastructure",
+        matched_topic="llm",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        updated_at=updated_at,
+        fetched_at=datetime(2025, 6, 1),
+    )
+
+
+def make_page(page_id: str, full_name: str, updated_at: str, stars: int) -> dict:
+    return {
+        "id": page_id,
+        "properties": {
+            "Full Name": {"rich_text": [{"plain_text": full_name}]},
+            "Updated At": {"date": {"start": updated_at}},
+            "Stars": {"number": stars},
+        },
+    }
+
+
+async def test_async_sync_creates_updates_and_skips(httpx_mock):
+    """測試非同步同步依 Updated At 決定新增、更新或跳過"""
+    httpx_mock.add_response(
+        url=QUERY_URL,
+        json={
+            "results": [
+                make_page("page-old", "a/changed", "2025-01-01T00:00:00Z", 80),
+                make_page("page-same", "b/same", "2025-05-01T00:00:00Z", 50),
+            ],
+            "has_more": False,
+        },
+    )
+    httpx_mock.add_response(url=PAGES_URL, method="POST", json={"id": "page-new"})
+    httpx_mock.add_response(url=f"{PAGES_URL}/pageold", method="PATCH", json={"id": "page-old"})
+
+    sync = NotionSync(token="secret", database_id="db123")
+    stats = await sync.async_sync_repositories([
+        make_repo("a/changed", datetime(2025, 5, 1, tzinfo=timezone.utc)),
+        make_repo("b/same", datetime(2025, 5, 1, tzinfo=timezone.utc)),
+        make_repo("c/new", datetime(2025, 5, 1, tzinfo=timezone.utc)),
+    ])
+
+    assert stats == {"created": 1, "updated": 1, "skipped": 1, "failed": 0}
+    patch = httpx_mock.get_request(method="PATCH")
+    assert json.loads(patch.content)["properties"]["Previous Stars"] == {"number": 80}
+
+
+async def test_async_sync_retries_after_429(httpx_mock):
+    """測試收到 429 時依 Retry-After 暫停後重試"""
+    httpx_mock.add_response(url=QUERY_URL, json={"results": [], "has_more": False})
+    httpx_mock.add_response(url=PAGES_URL, status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(url=PAGES_URL, json={"id": "page-new"})
+
+    sync = NotionSync(token="secret", database_id="db123")
+    stats = await sync.async_sync_repositories([
+        make_repo("c/new", datetime(2025, 5, 1, tzinfo=timezone.utc)),
+    ])
+
+    assert stats["created"] == 1
+    assert len(httpx_mock.get_requests(url=PAGES_URL)) == 2
+
+
+def test_plan_upsert_matches_sync_and_async_paths():
+    """測試同步與非同步版共用同一個 upsert 判斷"""
+    sync = NotionSync(token="secret", database_id="db123")
+    sync.existing_pages["a/one"] = {
+        "page_id": "1111-2222",
+        "updated_at": datetime(2025, 1, 1),
+        "stars": 5,
+    }
+
+    plan = sync._plan_upsert(make_repo("a/one", datetime(2025, 1, 1)))
+    assert (plan.result, plan.request) == ("skipped", None)
+
+    plan = sync._plan_upsert(make_repo("a/one", datetime(2025, 2, 1)))
+    method, endpoint, body = plan.request
+    assert (plan.result, method, endpoint) == ("updated", "PATCH", "pages/11112222")
+
+
+async def test_diff_sync_patches_only_changed_properties(httpx_mock, tmp_path):
+    """測試有上次寫入的雜湊時只 PATCH 變更的屬性，沒變更則不送出請求"""
+    mirror = NotionMirror(tmp_path / "tracker.db")
+    page = make_page("page-1", "a/one", "2025-01-01T00:00:00Z", 100)
+    httpx_mock.add_response(url=QUERY_URL, json={"results": [], "has_more": False})
+    httpx_mock.add_response(url=PAGES_URL, method="POST", json={"id": "page-1"})
+    httpx_mock.add_response(
+        url=QUERY_URL, json={"results": [page], "has_more": False}, is_reusable=True
+    )
+    httpx_mock.add_response(url=f"{PAGES_URL}/page1", method="PATCH", json={"id": "page-1"})
+
+    first = await NotionSync(token="secret", database_id="db123", mirror=mirror).async_sync_repositories(
+        [make_repo("a/one", datetime(2025, 1, 1, tzinfo=timezone.utc), stars=100)]
+    )
+    assert first["created"] == 1
+
+    # 有新的 push，但追蹤的屬性都沒變 → 不送出
+    unchanged = await NotionSync(token="secret", database_id="db123", mirror=mirror).async_sync_repositories(
+        [make_repo("a/one", datetime(2025, 3, 1, tzinfo=timezone.utc), stars=100)]
+    )
+    assert unchanged["skipped"] == 1
+    assert httpx_mock.get_request(method="PATCH") is None
+
+    # 只有星星數改變 → PATCH 只含變更的屬性與 Fetched At / Previous Stars
+    changed = await NotionSync(token="secret", database_id="db123", mirror=mirror).async_sync_repositories(
+        [make_repo("a/one", datetime(2025, 3, 1, tzinfo=timezone.utc), stars=130)]
+    )
+    assert changed["updated"] == 1
+    sent = json.loads(httpx_mock.get_request(method="PATCH").content)["properties"]
+    assert set(sent) == {"Stars", "Updated At", "Fetched At", "Previous Stars"}
+    assert sent["Previous Stars"] == {"number": 100}
+
+
+async def test_mirror_refreshes_only_recently_edited_pages(httpx_mock, tmp_path):
+    """測試有本地鏡像時以 last_edited_time 篩選增量查詢，並與既有鏡像合併"""
+    mirror = NotionMirror(tmp_path / "tracker.db")
+    httpx_mock.add_response(
+        url=QUERY_URL,
+        json={"results": [make_page("page-1", "a/one", "2025-01-01T00:00:00Z", 10)], "has_more": False},
+    )
+    httpx_mock.add_response(
+        url=QUERY_URL,
+        json={"results": [make_page("page-2", "b/two", "2025-01-01T00:00:00Z", 20)], "has_more": False},
+    )
+
+    first = NotionSync(token="secret", database_id="db123", mirror=mirror)
+    async with first.async_transport:
+        await first.aload_existing_pages()
+    second = NotionSync(token="secret", database_id="db123", mirror=mirror)
+    async with second.async_transport:
+        await second.aload_existing_pages()
+
+    full_query, incremental_query = (json.loads(r.content) for r in httpx_mock.get_requests())
+    assert "filter" not in full_query
+    assert incremental_query["filter"]["timestamp"] == "last_edited_time"
+    assert set(second.existing_pages) == {"a/one", "b/two"}
+    assert second.existing_pages["a/one"]["stars"] == 10
+
+
+async def test_archived_page_is_recreated(httpx_mock, tmp_path):
+    """測試 PATCH 回報頁面已封存時移除鏡像紀錄並重新建立頁面"""
+    mirror = NotionMirror(tmp_path / "tracker.db")
+    mirror.record("a/one", "page-1", {"Stars": "stale"})
+    httpx_mock.add_response(
+        url=QUERY_URL,
+        json={"results": [make_page("page-1", "a/one", "2025-01-01T00:00:00Z", 100)], "has_more": False},
+    )
+    httpx_mock.add_response(
+        url=f"{PAGES_URL}/page1",
+        method="PATCH",
+        status_code=400,
+        json={"object": "error", "code": "validation_error",
+              "message": "Can't edit block that is archived. You must unarchive the block before editing."},
+    )
+    httpx_mock.add_response(url=PAGES_URL, method="POST", json={"id": "page-2"})
+
+    sync = NotionSync(token="secret", database_id="db123", mirror=mirror)
+    stats = await sync.async_sync_repositories(
+        [make_repo("a/one", datetime(2025, 3, 1, tzinfo=timezone.utc), stars=130)]
+    )
+
+    assert stats["created"] == 1 and stats["failed"] == 0
+    assert sync.existing_pages["a/one"]["page_id"] == "page-2"
+    assert mirror.get_hashes("a/one", "page-1") is None
+    assert mirror.get_hashes("a/one", "page-2")
+    assert set(mirror.load_index()) == set()
+
+
+async def test_externally_edited_page_gets_full_patch(httpx_mock, tmp_path):
+    """測試頁面被其他人編輯過時清除雜湊，下次同步送出完整屬性"""
+    mirror = NotionMirror(tmp_path / "tracker.db")
+    repo = make_repo("a/one", datetime(2025, 1, 1, tzinfo=timezone.utc), stars=100)
+    httpx_mock.add_response(url=QUERY_URL, json={"results": [], "has_more": False})
+    httpx_mock.add_response(url=PAGES_URL, method="POST", json={"id": "page-1"})
+    await NotionSync(token="secret", database_id="db123", mirror=mirror).async_sync_repositories([repo])
+
+    edited = make_page("page-1", "a/one", "2025-01-01T00:00:00Z", 100)
+    edited["last_edited_by"] = {"object": "user", "id": "someone-else"}
+    httpx_mock.add_response(url=QUERY_URL, json={"results": [edited], "has_more": False})
+    httpx_mock.add_response(url="https://api.notion.com/v1/users/me", json={"object": "user", "id": "bot"})
+    httpx_mock.add_response(url=f"{PAGES_URL}/page1", method="PATCH", json={"id": "page-1"})
+
+    stats = await NotionSync(token="secret", database_id="db123", mirror=mirror).async_sync_repositories([repo])
+
+    assert stats["updated"] == 1
+    sent = json.loads(httpx_mock.get_request(method="PATCH").content)["properties"]
+    assert {"Name", "Full Name", "Stars", "Forks"} <= set(sent)
+    assert mirror.get_bot_user_id() == "bot"
+
+
+def test_sync_transport_reuses_pooled_client_and_retries(httpx_mock, monkeypatch):
+    """測試同步版 transport 共用連線池，5xx / 429 時自動重試"""
+    monkeypatch.setattr("src.clients.notion_transport.BACKOFF_SECONDS", 0)
+    httpx_mock.add_response(url=QUERY_URL, status_code=503)
+    httpx_mock.add_response(url=QUERY_URL, status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(url=QUERY_URL, json={"results": [], "has_more": False})
+
+    sync = NotionSync(token="secret", database_id="db123")
+    with sync.transport:
+        pooled = sync.transport._get_client()
+        assert sync._query_database() == {"results": [], "has_more": False}
+        assert sync.transport._get_client() is pooled
+
+    assert pooled.is_closed
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_retry_delay_falls_back_to_backoff_on_bad_retry_after():
+    """測試 429 的 Retry-After 無法解析時改用指數退避，而不是拋出例外"""
+    request = httpx.Request("POST", QUERY_URL)
+    bad = httpx.Response(429, headers={"Retry-After": "soon"}, request=request)
+    missing = httpx.Response(429, request=request)
+    dated = httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, request=request)
+
+    assert _retry_delay(bad, attempt=2) == BACKOFF_SECONDS * 4
+    assert _retry_delay(missing, attempt=0) == BACKOFF_SECONDS
+    assert _retry_delay(dated, attempt=0) == 0.0
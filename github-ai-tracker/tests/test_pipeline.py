@@ -0,0 +1,95 @@
+"""Tests for the fetch-and-sync pipeline"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from src.clients.notion_sync import NotionSync
+from src.models.repository import Repository
+from src.pipeline import fetch_and_sync
+
+
+def make_repo(full_name: str) -> Repository:
+    owner, name = full_name.split("/")
+    return Repository(
+        name=name,
+        full_name=full_name,
+        html_url=f"https://github.com/{full_name}",
+        stargazers_count=10,
+        forks_count=1,
+        open_issues_count=0,
+        ecosystem="ai_infrastructure",
+        matched_topic="llm",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        fetched_at=datetime(2025, 6, 1),
+    )
+
+
+class FakeGitHubClient:
+    """第一批放入 queue 後，等 Notion 寫入完成才產出第二批"""
+
+    def __init__(self, first_written: asyncio.Event):
+        self.first_written = first_written
+
+    async def fetch_all_repositories(self, on_batch):
+        first, second = make_repo("a/first"), make_repo("b/second")
+        await on_batch([first])
+        await asyncio.wait_for(self.first_written.wait(), timeout=2)
+        await on_batch([second])
+        return [first, second]
+
+
+async def test_notion_writes_start_before_fetch_finishes(httpx_mock):
+    """測試第一個生態系的結果在搜尋仍進行時就寫入 Notion"""
+    first_written = asyncio.Event()
+
+    def create_page(request: httpx.Request) -> httpx.Response:
+        first_written.set()
+        return httpx.Response(200, json={"id": f"page-{len(httpx_mock.get_requests())}"})
+
+    httpx_mock.add_response(
+        url="https://api.notion.com/v1/databases/db123/query",
+        json={"results": [], "has_more": False},
+    )
+    httpx_mock.add_callback(create_page, url="https://api.notion.com/v1/pages", is_reusable=True)
+
+    repositories, stats = await fetch_and_sync(
+        FakeGitHubClient(first_written),
+        NotionSync(token="secret", database_id="db123"),
+    )
+
+    assert [r.full_name for r in repositories] == ["a/first", "b/second"]
+    assert stats["created"] == 2
+
+
+class EndlessGitHubClient:
+    """放入一批後一直搜尋下去，直到被取消"""
+
+    def __init__(self):
+        self.cancelled = False
+
+    async def fetch_all_repositories(self, on_batch):
+        await on_batch([make_repo("a/first")])
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return []
+
+
+async def test_notion_failure_cancels_search(httpx_mock):
+    """測試 Notion 寫入端失敗時立即取消仍在進行的搜尋並回報錯誤"""
+    httpx_mock.add_response(url="https://api.notion.com/v1/databases/db123/query", status_code=401)
+    github_client = EndlessGitHubClient()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await asyncio.wait_for(
+            fetch_and_sync(github_client, NotionSync(token="secret", database_id="db123")),
+            timeout=5,
+        )
+
+    assert github_client.cancelled
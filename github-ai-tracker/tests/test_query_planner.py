@@ -0,0 +1,53 @@
+"""Tests for the search query planner"""
+
+from datetime import date
+
+import pytest
+
+from src.clients.query_planner import MAX_OPERATORS, SEARCH_EPOCH, CreatedRange, plan_queries
+
+
+def test_plan_covers_matrix_within_operator_limit():
+    """測試合併後的查詢涵蓋整個矩陣且不超過運算子上限"""
+    keywords = ["繁體中文", "正體中文", "台灣", "臺灣", "中文說明", "Chinese README"]
+    topics = ["llm", "ai", "chatgpt", "gpt", "langchain", "ollama"]
+
+    plan = plan_queries(keywords, topics, qualifier="in:readme")
+
+    covered = {(k, t) for planned in plan for k in planned.keywords for t in planned.topics}
+    assert covered == {(k, t) for k in keywords for t in topics}
+    assert len(plan) < len(keywords) * len(topics)
+    for planned in plan:
+        assert planned.query.count(" OR ") <= MAX_OPERATORS
+        assert planned.query.endswith(" in:readme")
+    assert '"Chinese README"' in " ".join(planned.query for planned in plan)
+
+
+def test_plan_respects_length_limit():
+    """測試超過長度上限時縮小分組"""
+    keywords = ["k" * 40, "m" * 40, "n" * 40]
+    topics = ["t" * 40, "u" * 40]
+
+    plan = plan_queries(keywords, topics, max_length=100)
+
+    assert all(len(planned.query) <= 100 for planned in plan)
+    assert len(plan) == 6
+
+    with pytest.raises(ValueError):
+        plan_queries(["x" * 300], ["llm"])
+
+
+def test_created_range_splits_into_adjacent_halves():
+    """測試日期分片切成相鄰且不重疊的兩半，最新的分片不設上限"""
+    whole = CreatedRange()
+    assert whole.qualifier() == f"created:>={SEARCH_EPOCH.isoformat()}"
+
+    older, newer = whole.split(today=date(2008, 1, 10))
+    assert older.qualifier() == "created:2008-01-01..2008-01-05"
+    assert newer.qualifier() == "created:>=2008-01-06"
+
+    first, second = CreatedRange(date(2024, 1, 1), date(2024, 1, 2)).split()
+    assert (first.start, first.end, second.start, second.end) == (
+        date(2024, 1, 1), date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 2),
+    )
+    assert CreatedRange(date(2024, 1, 1), date(2024, 1, 1)).split() is None
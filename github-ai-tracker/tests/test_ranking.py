@@ -0,0 +1,77 @@
+"""Tests for the momentum ranking engine"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.models.repository import Repository
+from src.ranking import RankingEngine, RankingWeights
+from src.storage.history import growth_from_arrays
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+def make_repo(full_name: str, stars: int, forks: int, age_days: int) -> Repository:
+    owner, name = full_name.split("/")
+    return Repository(
+        name=name,
+        full_name=full_name,
+        html_url=f"https://github.com/{full_name}",
+        stargazers_count=stars,
+        forks_count=forks,
+        open_issues_count=0,
+        ecosystem="ai_infrastructure",
+        matched_topic="llm",
+        created_at=NOW - timedelta(days=age_days),
+        updated_at=NOW,
+        fetched_at=NOW,
+    )
+
+
+def test_young_fast_repo_outranks_old_giant():
+    """測試沒有歷史時以終身平均速度排名，新的快速成長專案排在老牌大專案前"""
+    giant = make_repo("old/giant", stars=50_000, forks=9_000, age_days=3_000)
+    rising = make_repo("new/rising", stars=8_000, forks=600, age_days=40)
+
+    engine = RankingEngine(now=NOW)
+    assert [r.full_name for r in engine.rank([giant, rising])] == ["new/rising", "old/giant"]
+
+
+def test_history_velocity_overrides_lifetime_average():
+    """測試有歷史樣本時以觀測到的近期速度計算"""
+    stalled = make_repo("a/stalled", stars=10_000, forks=100, age_days=100)
+    growing = make_repo("b/growing", stars=3_000, forks=100, age_days=100)
+    week_ago = int((NOW - timedelta(days=7)).timestamp())
+    growth = growth_from_arrays(
+        np.array(["a/stalled", "b/growing"], dtype=object),
+        np.array([week_ago, week_ago], dtype=np.int64),
+        np.array([10_000, 1_000], dtype=np.int64),
+        np.array([100, 100], dtype=np.int64),
+    )
+
+    without_history = RankingEngine(now=NOW).rank([stalled, growing])
+    with_history = RankingEngine(growth=growth, now=NOW).rank([stalled, growing])
+
+    assert without_history[0].full_name == "a/stalled"
+    assert with_history[0].full_name == "b/growing"
+
+
+def test_rank_limit_selects_top_n_in_score_order():
+    """測試取前 N 名時結果與完整排序的前 N 筆相同"""
+    repos = [make_repo(f"o/r{i}", stars=i * 37 % 1000, forks=i % 50, age_days=1 + i) for i in range(500)]
+    engine = RankingEngine(now=NOW)
+
+    assert engine.rank(repos, 20) == engine.rank(repos)[:20]
+    assert engine.rank(repos, 0) == []
+    assert engine.rank([], 5) == []
+
+
+def test_weights_parse():
+    weights = RankingWeights.parse("stars=0.5, age_gravity=0")
+    assert weights.stars == 0.5
+    assert weights.age_gravity == 0.0
+    assert weights.star_velocity == RankingWeights().star_velocity
+
+    with pytest.raises(ValueError):
+        RankingWeights.parse("popularity=1")
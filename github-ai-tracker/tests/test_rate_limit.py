@@ -0,0 +1,116 @@
+"""Tests for the shared rate limit governor"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from src.clients.rate_limit import RateLimitGovernor, TokenBucket, parse_retry_after
+
+
+def test_update_tracks_remaining_and_reset():
+    """測試從回應標頭更新剩餘額度"""
+    governor = RateLimitGovernor(name="test", max_concurrency=2)
+    governor.update({
+        "x-ratelimit-remaining": "10",
+        "x-ratelimit-reset": "1000",
+        "x-ratelimit-limit": "30",
+    })
+
+    assert governor.remaining == 10
+    assert governor.reset_at == 1000
+    assert governor.limit == 30
+
+
+def test_update_same_window_keeps_lowest_remaining():
+    """測試同一視窗內亂序抵達的回應不會調高剩餘額度"""
+    governor = RateLimitGovernor(name="test", max_concurrency=2)
+    governor.update({"x-ratelimit-remaining": "5", "x-ratelimit-reset": "1000"})
+    governor.update({"x-ratelimit-remaining": "8", "x-ratelimit-reset": "1000"})
+    assert governor.remaining == 5
+
+    # 新視窗則採用新的額度
+    governor.update({"x-ratelimit-remaining": "30", "x-ratelimit-reset": "1060"})
+    assert governor.remaining == 30
+
+
+def test_update_ignores_missing_headers():
+    """測試缺少標頭時不改變狀態"""
+    governor = RateLimitGovernor(name="test", max_concurrency=2)
+    governor.update({})
+    assert governor.remaining is None
+
+
+async def test_slot_waits_for_reset_when_exhausted(monkeypatch):
+    """測試額度用完時等待視窗重置"""
+    governor = RateLimitGovernor(name="test", max_concurrency=2)
+    governor.block_until(time.time() + 5)
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        # 模擬時間經過：視窗重置
+        governor.reset_at = time.time() - 10
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    async with governor.slot():
+        pass
+
+    assert len(sleeps) == 1
+    assert 5 <= sleeps[0] <= 7
+    assert governor.waited_seconds == sleeps[0]
+
+
+async def test_slot_limits_concurrency():
+    """測試同時進行的請求數不超過上限"""
+    governor = RateLimitGovernor(name="test", max_concurrency=2)
+    active = 0
+    peak = 0
+
+    async def request() -> None:
+        nonlocal active, peak
+        async with governor.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+    assert peak == 2
+
+
+async def test_token_bucket_allows_burst_then_paces():
+    """測試 token bucket 先放行突發額度，之後依平均速率放行"""
+    bucket = TokenBucket(rate=20.0, burst=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.02
+
+    for _ in range(2):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.09  # 兩個 token 各約 0.05 秒
+
+
+async def test_token_bucket_pause_blocks_all_waiters():
+    """測試 pause() 讓後續請求都等到暫停結束"""
+    bucket = TokenBucket(rate=100.0, burst=5)
+    bucket.pause(0.1)
+
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+    assert time.monotonic() - start >= 0.1
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    """測試 Retry-After 可為秒數或 HTTP-date，無法解析時回傳 None"""
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0.0
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(later) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
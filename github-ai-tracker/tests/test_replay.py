@@ -0,0 +1,30 @@
+"""End-to-end regression tests against the offline replay harness"""
+
+from benchmarks.replay import FakeGitHub, FakeNotion, ReplayServer, synthetic_fixtures
+from benchmarks.replay_benchmark import run_once
+
+
+async def test_replay_full_run_then_cached_rerun(tmp_path):
+    """測試完整執行遇到 429 仍全部寫入，第二次執行全部命中 ETag 且不再寫入 Notion"""
+    fixtures = synthetic_fixtures(per_query=20, pool_size=300)
+    notion = FakeNotion(requests_per_second=1000, burst=50, throttle_every=25)
+    db_path = tmp_path / "tracker.db"
+
+    with ReplayServer(FakeGitHub(fixtures), notion) as server:
+        first = await run_once(server, db_path, notion_rps=1000)
+        second = await run_once(server, db_path, notion_rps=1000)
+
+    assert first["sync"]["failed"] == 0
+    assert first["sync"]["created"] == first["repositories"] == len(notion.pages)
+    assert first["statuses"].get(429, 0) > 0
+    assert first["cache_misses"] == first["requests"]["github /search/repositories"]
+
+    assert second["cache_hits"] == first["cache_misses"]
+    assert second["statuses"][304] == second["requests"]["github /search/repositories"]
+    assert second["sync"] == {
+        "created": 0,
+        "updated": 0,
+        "skipped": first["repositories"],
+        "failed": 0,
+    }
+    assert "notion POST /v1/pages" not in second["requests"]
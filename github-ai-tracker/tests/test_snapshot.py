@@ -0,0 +1,47 @@
+"""Tests for the local repository snapshot"""
+
+from datetime import datetime, timezone
+
+from src.models.repository import Repository
+from src.storage.snapshot import RepositorySnapshot
+
+
+def make_repo(full_name: str, forks: int, categories: list[str] | None = None) -> Repository:
+    owner, name = full_name.split("/")
+    return Repository(
+        name=name,
+        full_name=full_name,
+        html_url=f"https://github.com/{full_name}",
+        stargazers_count=forks * 10,
+        forks_count=forks,
+        open_issues_count=0,
+        ecosystem="ai_infrastructure",
+        matched_topic="llm",
+        tool_categories=categories or [],
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2025, 1, 1),
+        fetched_at=datetime(2025, 1, 1),
+    )
+
+
+def test_upsert_replaces_metrics_and_unions_categories(tmp_path):
+    """測試重複 upsert 會更新數據並合併 tool_categories"""
+    snapshot = RepositorySnapshot(tmp_path / "tracker.db")
+    snapshot.upsert("ai_infrastructure", [make_repo("a/one", 10, ["RAG"]), make_repo("b/two", 20)])
+    snapshot.upsert("ai_infrastructure", [make_repo("a/one", 40, ["MCP"])])
+
+    top = snapshot.top("ai_infrastructure", 10)
+    assert [(r.full_name, r.forks_count) for r in top] == [("a/one", 40), ("b/two", 20)]
+    assert top[0].tool_categories == ["MCP", "RAG"]
+    assert snapshot.count() == 2
+    assert snapshot.top("pdf_tools", 10) == []
+
+
+def test_last_run_round_trip(tmp_path):
+    """測試 crawl_state 記錄的時間可正確讀回"""
+    snapshot = RepositorySnapshot(tmp_path / "tracker.db")
+    when = datetime(2025, 6, 1, 12, 30, tzinfo=timezone.utc)
+
+    assert snapshot.get_last_run("ai_infrastructure:topic:llm") is None
+    snapshot.set_last_run("ai_infrastructure:topic:llm", when)
+    assert snapshot.get_last_run("ai_infrastructure:topic:llm") == when
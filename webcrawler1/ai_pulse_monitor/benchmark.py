@@ -0,0 +1,159 @@
+"""啟動效能基準 - 量測 CLI 匯入時間與 --status 執行時間
+
+使用方式：
+    uv run python -m ai_pulse_monitor.benchmark [--db data/articles.db]
+
+--status 會執行 init_db()（建立或遷移資料表），因此一律在資料庫的暫存副本上量測，
+不會改動實際的資料庫。
+"""
+
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_DB = PROJECT_ROOT / "data" / "articles.db"
+
+# 輕量指令不應載入的重量級模組
+HEAVY_MODULES = ["crawl4ai", "playwright", "feedparser", "numpy"]
+
+
+def _run(args: list[str], db_path: Optional[Path] = None) -> subprocess.CompletedProcess:
+    env = None
+    if db_path is not None:
+        env = {**os.environ, "AI_PULSE_DB_PATH": str(db_path)}
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+def copy_database(source: Path, target_dir: Path) -> Path:
+    """
+    複製資料庫到暫存目錄（連同 WAL / journal 檔）
+
+    來源不存在時回傳暫存目錄中的新路徑，由 init_db() 建立空資料庫。
+    """
+    target = target_dir / source.name
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        path = source.with_name(source.name + suffix)
+        if path.exists():
+            shutil.copy2(path, target.with_name(target.name + suffix))
+    return target
+
+
+def _time_python(args: list[str]) -> float:
+    """量測單次 python 子程序執行時間（毫秒）"""
+    start = time.perf_counter()
+    _run(args)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_import_time(module: str = "ai_pulse_monitor.main") -> float:
+    """
+    以 `python -X importtime` 量測匯入模組的累計時間
+
+    Returns:
+        float: 匯入耗時（毫秒）
+    """
+    result = _run(["-X", "importtime", "-c", f"import {module}"])
+    # 格式：import time: self [us] | cumulative | imported package
+    pattern = re.compile(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*" + re.escape(module) + r"$")
+    for line in result.stderr.splitlines():
+        match = pattern.search(line)
+        if match:
+            return int(match.group(1)) / 1000
+    raise RuntimeError(f"無法解析 importtime 輸出：\n{result.stderr[-2000:]}")
+
+
+def find_heavy_imports(module: str = "ai_pulse_monitor.main") -> list[str]:
+    """回傳匯入模組後被連帶載入的重量級依賴"""
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = _run(["-c", code])
+    output = result.stdout.strip()
+    return output.split(",") if output else []
+
+
+def measure_command(
+    args: list[str],
+    repeat: int = 5,
+    db_path: Optional[Path] = None
+) -> list[float]:
+    """
+    量測完整 CLI 指令的執行時間（含直譯器啟動）
+
+    Args:
+        db_path: 指令使用的資料庫（傳給 AI_PULSE_DB_PATH；None 表示預設資料庫）
+
+    Returns:
+        list[float]: 每次執行耗時（毫秒）
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = _run(["-m", "ai_pulse_monitor.main", *args], db_path=db_path)
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            raise RuntimeError(f"指令執行失敗: {result.stdout}{result.stderr}")
+    return timings
+
+
+def main() -> None:
+    """基準測試入口"""
+    parser = argparse.ArgumentParser(
+        prog="ai-pulse-benchmark",
+        description="量測 ai-pulse CLI 的匯入與啟動時間"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="每項量測重複次數")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=DEFAULT_DB,
+        help="量測用的資料庫（會先複製到暫存目錄，預設 data/articles.db）"
+    )
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("AI Pulse Monitor - 啟動效能基準")
+    print("=" * 50)
+
+    interpreter_ms = statistics.median(_time_python(["-c", "pass"]) for _ in range(args.repeat))
+    print(f"  直譯器啟動: {interpreter_ms:.1f} ms")
+
+    import_ms = statistics.median(measure_import_time() for _ in range(args.repeat))
+    print(f"  匯入 ai_pulse_monitor.main: {import_ms:.1f} ms")
+
+    heavy = find_heavy_imports()
+    if heavy:
+        print(f"  [警告] 匯入時載入了重量級模組: {', '.join(heavy)}")
+    else:
+        print("  匯入時未載入重量級模組 ✓")
+
+    with tempfile.TemporaryDirectory(prefix="ai-pulse-benchmark-") as tmp:
+        db_copy = copy_database(args.db, Path(tmp))
+        status_ms = statistics.median(
+            measure_command(["--status"], repeat=args.repeat, db_path=db_copy)
+        )
+    print(f"  ai-pulse --status: {status_ms:.1f} ms（含直譯器啟動）")
+    print("=" * 50)
+
+    if heavy:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
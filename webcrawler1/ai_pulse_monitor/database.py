@@ -1,15 +1,62 @@
 """資料管理層 - 使用 aiosqlite 進行異步資料庫操作"""
 
+import os
+
 import aiosqlite
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
+
+# 可用環境變數 AI_PULSE_DB_PATH 指向其他資料庫（例如基準測試使用的暫存副本）
+DB_PATH = Path(
+    os.environ.get("AI_PULSE_DB_PATH") or Path(__file__).parent.parent / "data" / "articles.db"
+)
+
 
-DB_PATH = Path(__file__).parent.parent / "data" / "articles.db"
+# 統計表觸發器：由 SQLite 在寫入 articles 時同步維護 article_stats，
+# 讓 --status 與同步結束時的統計不必再對 articles 全表 COUNT(*)
+STATS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_articles_stats_insert
+    AFTER INSERT ON articles
+    BEGIN
+        INSERT INTO article_stats (source, day, total, summarized)
+        VALUES (NEW.source, substr(NEW.created_at, 1, 10), 1, NEW.is_summarized != 0)
+        ON CONFLICT(source, day) DO UPDATE SET
+            total = total + 1,
+            summarized = summarized + excluded.summarized;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_articles_stats_delete
+    AFTER DELETE ON articles
+    BEGIN
+        UPDATE article_stats SET
+            total = total - 1,
+            summarized = summarized - (OLD.is_summarized != 0)
+        WHERE source = OLD.source AND day = substr(OLD.created_at, 1, 10);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_articles_stats_update
+    AFTER UPDATE OF source, created_at, is_summarized ON articles
+    BEGIN
+        UPDATE article_stats SET
+            total = total - 1,
+            summarized = summarized - (OLD.is_summarized != 0)
+        WHERE source = OLD.source AND day = substr(OLD.created_at, 1, 10);
+        INSERT INTO article_stats (source, day, total, summarized)
+        VALUES (NEW.source, substr(NEW.created_at, 1, 10), 1, NEW.is_summarized != 0)
+        ON CONFLICT(source, day) DO UPDATE SET
+            total = total + 1,
+            summarized = summarized + excluded.summarized;
+    END
+    """,
+]
 
 
 async def init_db() -> None:
-    """初始化資料庫，建立 articles 表"""
+    """初始化資料庫，建立 articles 表與 article_stats 統計表"""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     async with aiosqlite.connect(DB_PATH) as db:
@@ -23,6 +70,114 @@ async def init_db() -> None:
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP
             )
         """)
+
+        # 檢查統計表是否已存在（不存在代表舊資料庫，建立後需回填）
+        async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_stats'"
+        ) as cursor:
+            stats_exists = await cursor.fetchone() is not None
+
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS article_stats (
+                source TEXT NOT NULL,
+                day TEXT NOT NULL,
+                total INTEGER NOT NULL DEFAULT 0,
+                summarized INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (source, day)
+            )
+        """)
+        for trigger in STATS_TRIGGERS:
+            await db.execute(trigger)
+
+        if not stats_exists:
+            await _rebuild_stats(db)
+
+        # 文章向量索引：記錄每篇文章在向量矩陣檔中的列號（依模型區分）
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS article_embeddings (
+                url TEXT NOT NULL,
+                model TEXT NOT NULL,
+                row INTEGER NOT NULL,
+                PRIMARY KEY (url, model)
+            )
+        """)
+
+        # TLDR 電子報拆出的單則新聞（子表），link 為主鍵可跨期去重；
+        # fetch_status: queued（待抓取原文）/ fetched / failed
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS tldr_items (
+                link TEXT PRIMARY KEY,
+                issue_url TEXT NOT NULL REFERENCES articles(url),
+                position INTEGER NOT NULL,
+                headline TEXT NOT NULL,
+                blurb TEXT,
+                fetch_status TEXT NOT NULL DEFAULT 'queued',
+                content_path TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tldr_items_issue ON tldr_items (issue_url, position)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tldr_items_status ON tldr_items (fetch_status)"
+        )
+
+        # 已拆分過的電子報（含拆出 0 則、或每則都與先前期數重複的），
+        # --split-items 不再重新讀取與解析這些 Markdown
+        async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tldr_split_issues'"
+        ) as cursor:
+            split_exists = await cursor.fetchone() is not None
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS tldr_split_issues (
+                issue_url TEXT PRIMARY KEY REFERENCES articles(url),
+                item_count INTEGER NOT NULL,
+                split_at TEXT NOT NULL
+            )
+        """)
+        if not split_exists:
+            # 舊資料庫：已有單則新聞的電子報視為已拆分
+            await db.execute("""
+                INSERT OR IGNORE INTO tldr_split_issues (issue_url, item_count, split_at)
+                SELECT issue_url, COUNT(*), MIN(created_at) FROM tldr_items GROUP BY issue_url
+            """)
+
+        # 待摘要文章的串流讀取索引（依建立時間 + URL 做 keyset 分頁）
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_articles_pending
+            ON articles (is_summarized, created_at, url)
+        """)
+
+        # 摘要工作進度檢查點：中斷後可從上次位置續跑
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS summarize_checkpoints (
+                job_id TEXT PRIMARY KEY,
+                last_created_at TEXT NOT NULL,
+                last_url TEXT NOT NULL,
+                processed INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            )
+        """)
+
+        await db.commit()
+
+
+async def _rebuild_stats(db: aiosqlite.Connection) -> None:
+    """依 articles 表重新計算 article_stats（僅在建立統計表或手動修復時使用）"""
+    await db.execute("DELETE FROM article_stats")
+    await db.execute("""
+        INSERT INTO article_stats (source, day, total, summarized)
+        SELECT source, substr(created_at, 1, 10), COUNT(*), SUM(is_summarized != 0)
+        FROM articles
+        GROUP BY source, substr(created_at, 1, 10)
+    """)
+
+
+async def rebuild_article_stats() -> None:
+    """重建統計表（例如手動修改過 articles 表後）"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        await _rebuild_stats(db)
         await db.commit()
 
 
@@ -65,6 +220,105 @@ async def get_pending_summaries() -> list[dict]:
             return [dict(row) for row in rows]
 
 
+async def iter_pending_summaries(
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    source: Optional[str] = None,
+    after: Optional[tuple[str, str]] = None,
+    batch_size: int = 100
+) -> AsyncIterator[list[dict]]:
+    """
+    分批串流讀取未摘要的文章（依建立時間排序，不會一次載入全部）
+
+    Args:
+        since: 起始日期 YYYY-MM-DD（含）
+        until: 結束日期 YYYY-MM-DD（含）
+        source: 只處理特定來源
+        after: 從 (created_at, url) 之後開始讀取（用於續跑）
+        batch_size: 每批筆數
+
+    Yields:
+        list[dict]: 一批文章 {"url", "title", "source", "content_path", "created_at"}
+    """
+    filters = ["is_summarized = 0"]
+    params: list = []
+    if since:
+        filters.append("created_at >= ?")
+        params.append(since)
+    if until:
+        # until 為含當日，轉為隔日 00:00 之前
+        next_day = (datetime.strptime(until, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+        filters.append("created_at < ?")
+        params.append(next_day)
+    if source:
+        filters.append("source = ?")
+        params.append(source)
+
+    async with aiosqlite.connect(DB_PATH) as db:
+        db.row_factory = aiosqlite.Row
+        while True:
+            query_filters = list(filters)
+            query_params = list(params)
+            if after:
+                query_filters.append("(created_at, url) > (?, ?)")
+                query_params.extend(after)
+
+            async with db.execute(
+                f"""
+                SELECT url, title, source, content_path, created_at
+                FROM articles
+                WHERE {" AND ".join(query_filters)}
+                ORDER BY created_at, url
+                LIMIT ?
+                """,
+                (*query_params, batch_size)
+            ) as cursor:
+                rows = [dict(row) for row in await cursor.fetchall()]
+
+            if not rows:
+                return
+            yield rows
+            after = (rows[-1]["created_at"], rows[-1]["url"])
+
+
+async def get_summarize_checkpoint(job_id: str) -> Optional[dict]:
+    """取得摘要工作的檢查點，沒有則回傳 None"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(
+            "SELECT * FROM summarize_checkpoints WHERE job_id = ?",
+            (job_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+            return dict(row) if row else None
+
+
+async def save_summarize_checkpoint(
+    job_id: str,
+    last_created_at: str,
+    last_url: str,
+    processed: int
+) -> None:
+    """儲存摘要工作的檢查點（已完成到哪一篇）"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        await db.execute(
+            """
+            INSERT OR REPLACE INTO summarize_checkpoints
+                (job_id, last_created_at, last_url, processed, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (job_id, last_created_at, last_url, processed, datetime.now().isoformat())
+        )
+        await db.commit()
+
+
+async def clear_summarize_checkpoint(job_id: str) -> None:
+    """工作完成後刪除檢查點"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        await db.execute("DELETE FROM summarize_checkpoints WHERE job_id = ?", (job_id,))
+        await db.commit()
+
+
 async def mark_as_summarized(url: str) -> None:
     """將文章標記為已摘要"""
     async with aiosqlite.connect(DB_PATH) as db:
@@ -75,16 +329,216 @@ async def mark_as_summarized(url: str) -> None:
         await db.commit()
 
 
+async def get_unembedded_articles(model: str) -> list[dict]:
+    """取得尚未以指定模型建立向量的文章"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(
+            """
+            SELECT a.url, a.title, a.source, a.content_path
+            FROM articles a
+            LEFT JOIN article_embeddings e ON e.url = a.url AND e.model = ?
+            WHERE e.url IS NULL
+            ORDER BY a.created_at
+            """,
+            (model,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+
+async def save_embedding_rows(model: str, rows: list[tuple[str, int]]) -> None:
+    """記錄文章與向量列號的對應 [(url, row), ...]"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        await db.executemany(
+            "INSERT OR REPLACE INTO article_embeddings (url, model, row) VALUES (?, ?, ?)",
+            [(url, model, row) for url, row in rows]
+        )
+        await db.commit()
+
+
+async def get_embedded_articles(model: str, day: Optional[str] = None) -> list[dict]:
+    """
+    取得已建立向量的文章
+
+    Args:
+        model: 向量模型名稱
+        day: 只取特定抓取日期 (YYYY-MM-DD)，None 表示全部
+
+    Returns:
+        list[dict]: {"url", "title", "source", "created_at", "row"}，依列號排序
+    """
+    query = """
+        SELECT a.url, a.title, a.source, a.created_at, e.row
+        FROM article_embeddings e
+        JOIN articles a ON a.url = e.url
+        WHERE e.model = ?
+    """
+    params: list = [model]
+    if day:
+        query += " AND substr(a.created_at, 1, 10) = ?"
+        params.append(day)
+    query += " ORDER BY e.row"
+
+    async with aiosqlite.connect(DB_PATH) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+
+async def insert_tldr_items(issue_url: str, items: list[dict]) -> int:
+    """
+    寫入電子報拆出的單則新聞（已存在的 link 會略過），並記錄此電子報已拆分
+
+    Args:
+        issue_url: 所屬電子報 URL
+        items: [{"headline", "link", "blurb"}, ...]
+
+    Returns:
+        int: 新增筆數
+    """
+    now = datetime.now().isoformat()
+    async with aiosqlite.connect(DB_PATH) as db:
+        before = db.total_changes
+        await db.executemany(
+            """
+            INSERT OR IGNORE INTO tldr_items (link, issue_url, position, headline, blurb, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (item["link"], issue_url, position, item["headline"], item["blurb"], now)
+                for position, item in enumerate(items)
+            ]
+        )
+        inserted = db.total_changes - before
+        await db.execute(
+            """
+            INSERT OR REPLACE INTO tldr_split_issues (issue_url, item_count, split_at)
+            VALUES (?, ?, ?)
+            """,
+            (issue_url, inserted, now)
+        )
+        await db.commit()
+        return inserted
+
+
+async def get_tldr_issues_without_items() -> list[dict]:
+    """取得尚未拆分過的 TLDR 電子報（依 tldr_split_issues 判斷，不看是否拆出單則新聞）"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(
+            """
+            SELECT a.url, a.content_path
+            FROM articles a
+            WHERE a.source = 'tldr_ai'
+              AND a.content_path IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM tldr_split_issues s WHERE s.issue_url = a.url)
+            """
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+
+async def get_queued_tldr_items(limit: int = 20) -> list[dict]:
+    """取得待抓取原文的單則新聞"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(
+            """
+            SELECT link, issue_url, headline, blurb
+            FROM tldr_items
+            WHERE fetch_status = 'queued'
+            ORDER BY created_at, position
+            LIMIT ?
+            """,
+            (limit,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+
+async def mark_tldr_item_fetched(
+    link: str,
+    status: str,
+    content_path: Optional[str] = None
+) -> None:
+    """更新單則新聞的原文抓取狀態（fetched / failed）"""
+    async with aiosqlite.connect(DB_PATH) as db:
+        await db.execute(
+            "UPDATE tldr_items SET fetch_status = ?, content_path = ? WHERE link = ?",
+            (status, content_path, link)
+        )
+        await db.commit()
+
+
 async def get_article_count() -> dict:
-    """取得文章統計資訊"""
+    """取得文章統計資訊（讀取 article_stats，不掃描 articles 表）"""
     async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute("SELECT COUNT(*) FROM articles") as cursor:
-            total = (await cursor.fetchone())[0]
-        async with db.execute("SELECT COUNT(*) FROM articles WHERE is_summarized = 1") as cursor:
-            summarized = (await cursor.fetchone())[0]
+        async with db.execute(
+            "SELECT COALESCE(SUM(total), 0), COALESCE(SUM(summarized), 0) FROM article_stats"
+        ) as cursor:
+            total, summarized = await cursor.fetchone()
 
         return {
             "total": total,
             "summarized": summarized,
             "pending": total - summarized
         }
+
+
+async def get_source_stats(days: int = 7) -> list[dict]:
+    """
+    取得各來源的統計與近期趨勢
+
+    Args:
+        days: 計算近期新增數量的天數
+
+    Returns:
+        list[dict]: 每個來源一筆 {"source", "total", "summarized", "recent"}
+    """
+    since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    async with aiosqlite.connect(DB_PATH) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(
+            """
+            SELECT
+                source,
+                SUM(total) AS total,
+                SUM(summarized) AS summarized,
+                SUM(CASE WHEN day >= ? THEN total ELSE 0 END) AS recent
+            FROM article_stats
+            GROUP BY source
+            HAVING SUM(total) > 0
+            ORDER BY source
+            """,
+            (since,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+
+async def get_daily_stats(days: int = 7, source: Optional[str] = None) -> list[dict]:
+    """
+    取得每日新增文章數（依來源細分），用於趨勢報告
+
+    Args:
+        days: 回溯天數
+        source: 只看特定來源（None 表示全部）
+
+    Returns:
+        list[dict]: {"source", "day", "total", "summarized"}，依日期排序
+    """
+    since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    query = "SELECT source, day, total, summarized FROM article_stats WHERE day >= ?"
+    params: list = [since]
+    if source:
+        query += " AND source = ?"
+        params.append(source)
+    query += " ORDER BY day, source"
+
+    async with aiosqlite.connect(DB_PATH) as db:
+        db.row_factory = aiosqlite.Row
+        async with db.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
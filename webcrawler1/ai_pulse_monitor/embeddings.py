@@ -0,0 +1,411 @@
+"""向量化與主題分群 - 文章嵌入、近似最近鄰索引與新聞事件分群"""
+
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Protocol
+
+import numpy as np
+
+from .database import (
+    get_unembedded_articles,
+    save_embedding_rows,
+    get_embedded_articles,
+)
+from .utils import strip_frontmatter
+
+# 每篇文章最多取用的正文字元數（標題 + 開頭段落已足以判斷主題）
+MAX_TEXT_CHARS = 4000
+
+# 向量數低於此值時直接做精確搜尋（小語料下 LSH 分桶過細，召回率差）
+EXACT_SEARCH_LIMIT = 5000
+
+# 分群時每塊相似度矩陣的元素上限（約 64MB float32），n 篇文章每次只算 n 列中的一塊
+CLUSTER_BLOCK_ELEMENTS = 16 * 1024 * 1024
+
+# 英文停用詞（只保留最常見的功能詞，避免稀釋主題特徵）
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were will with we you your our they their not but can more".split()
+)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*|[\u4e00-\u9fff]+")
+CJK_PATTERN = re.compile(r"[\u4e00-\u9fff]")
+
+
+class Embedder(Protocol):
+    """向量模型介面，任何實作 name / dim / embed 的物件都能替換"""
+
+    name: str
+    dim: int
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """將文字轉為 (len(texts), dim) 的 float32 單位向量"""
+        ...
+
+
+@lru_cache(maxsize=65536)
+def _hash_token(token: str) -> int:
+    """穩定的 token 雜湊（不受 PYTHONHASHSEED 影響）"""
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    將文字切成 token：英文取單字，中文取字元二元組
+
+    Args:
+        text: 原始文字
+
+    Returns:
+        token 列表
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.findall(text.lower()):
+        if CJK_PATTERN.match(match):
+            if len(match) == 1:
+                tokens.append(match)
+            else:
+                tokens.extend(match[i:i + 2] for i in range(len(match) - 1))
+        elif match not in STOPWORDS and len(match) > 1:
+            tokens.append(match)
+    return tokens
+
+
+class HashingEmbedder:
+    """特徵雜湊向量器 - 不需模型檔、結果可重現"""
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        doc_ids: list[int] = []
+        hashes: list[int] = []
+        for doc_id, text in enumerate(texts):
+            tokens = tokenize(text)
+            doc_ids.extend([doc_id] * len(tokens))
+            hashes.extend(_hash_token(token) for token in tokens)
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if hashes:
+            hash_array = np.asarray(hashes, dtype=np.uint32)
+            columns = hash_array % self.dim
+            # 最高位決定正負號，降低雜湊碰撞造成的偏差
+            signs = np.where(hash_array >> 31, 1.0, -1.0).astype(np.float32)
+            np.add.at(matrix, (np.asarray(doc_ids), columns), signs)
+
+        # 次線性詞頻 + L2 正規化
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        return _normalize(matrix)
+
+
+class SentenceTransformerEmbedder:
+    """本地 sentence-transformers 模型（需另行安裝 sentence-transformers）"""
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "使用本地模型需安裝 sentence-transformers：uv add sentence-transformers"
+            ) from e
+
+        self._model = SentenceTransformer(model_name)
+        self.dim = self._model.get_sentence_embedding_dimension()
+        self.name = f"st-{model_name.replace('/', '_')}"
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        vectors = self._model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+        return _normalize(vectors.astype(np.float32))
+
+
+def get_embedder(spec: str = "hashing") -> Embedder:
+    """
+    依設定字串取得向量模型
+
+    Args:
+        spec: "hashing"、"hashing:<dim>" 或 "st:<model_name>"
+
+    Returns:
+        Embedder 實例
+    """
+    kind, _, arg = spec.partition(":")
+    if kind == "hashing":
+        return HashingEmbedder(dim=int(arg) if arg else 1024)
+    if kind == "st":
+        return SentenceTransformerEmbedder(arg or "all-MiniLM-L6-v2")
+    raise ValueError(f"未知的向量模型: {spec}")
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """逐列 L2 正規化（零向量維持為零）"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class VectorStore:
+    """
+    以記憶體映射檔儲存的向量矩陣（只新增、不修改）
+
+    每列向量的 LSH 桶編號另存於同目錄的 .i32 檔，隨 append 一起更新；
+    查詢相關文章時只需比對桶編號，不必每次重新對整個矩陣計算雜湊。
+    """
+
+    def __init__(self, data_dir: Path, model_name: str, dim: int, lsh: Optional["LSHIndex"] = None):
+        self.dim = dim
+        self.lsh = lsh or LSHIndex(dim)
+        self.path = data_dir / "embeddings" / f"{model_name}.f32"
+        self.codes_path = self.path.with_name(
+            f"{model_name}.lsh-{self.lsh.n_bits}x{self.lsh.n_tables}-{self.lsh.seed}.i32"
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        if not self.path.exists():
+            return 0
+        return self.path.stat().st_size // (self.dim * 4)
+
+    def append(self, vectors: np.ndarray) -> list[int]:
+        """
+        附加向量到矩陣檔尾端
+
+        Returns:
+            新增向量對應的列號
+        """
+        start = len(self)
+        with open(self.path, "ab") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        self._sync_codes()
+        return list(range(start, start + len(vectors)))
+
+    def _sync_codes(self, chunk_size: int = 8192) -> None:
+        """補上尚未計算桶編號的列（一般只有剛 append 的向量；舊資料第一次使用時整批補齊）"""
+        done = self.codes_path.stat().st_size // (self.lsh.n_tables * 4) if self.codes_path.exists() else 0
+        rows = len(self)
+        if done >= rows:
+            return
+
+        matrix = self.matrix()
+        with open(self.codes_path, "ab") as f:
+            for i in range(done, rows, chunk_size):
+                codes = self.lsh.codes(np.asarray(matrix[i:i + chunk_size]))
+                f.write(codes.astype(np.int32).tobytes())
+
+    def codes(self) -> np.ndarray:
+        """以唯讀 memmap 開啟所有列的 LSH 桶編號，形狀為 (n, n_tables)"""
+        self._sync_codes()
+        rows = len(self)
+        if rows == 0:
+            return np.zeros((0, self.lsh.n_tables), dtype=np.int32)
+        return np.memmap(self.codes_path, dtype=np.int32, mode="r", shape=(rows, self.lsh.n_tables))
+
+    def matrix(self) -> np.ndarray:
+        """以唯讀 memmap 開啟整個矩陣（不會一次載入記憶體）"""
+        rows = len(self)
+        if rows == 0:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.memmap(self.path, dtype=np.float32, mode="r", shape=(rows, self.dim))
+
+
+class LSHIndex:
+    """隨機超平面 LSH 近似最近鄰索引（餘弦相似度）"""
+
+    def __init__(self, dim: int, n_bits: int = 12, n_tables: int = 8, seed: int = 42):
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((n_tables, n_bits, dim)).astype(np.float32)
+        self.bit_weights = (1 << np.arange(n_bits)).astype(np.int64)
+        self.n_bits = n_bits
+        self.n_tables = n_tables
+        self.seed = seed
+        self._table_codes: Optional[np.ndarray] = None
+        self._matrix: Optional[np.ndarray] = None
+
+    def codes(self, vectors: np.ndarray) -> np.ndarray:
+        """計算 (n, n_tables) 的桶編號"""
+        bits = np.einsum("nd,tbd->ntb", vectors, self.planes) > 0
+        return bits.astype(np.int64) @ self.bit_weights
+
+    def build(
+        self,
+        matrix: np.ndarray,
+        codes: Optional[np.ndarray] = None,
+        chunk_size: int = 8192,
+    ) -> "LSHIndex":
+        """
+        以整個向量矩陣建立索引（分塊計算，可處理 memmap）
+
+        Args:
+            matrix: (n, dim) 向量矩陣
+            codes: 已計算好的 (n, n_tables) 桶編號（例如 VectorStore.codes()），
+                提供時不再重新計算雜湊
+        """
+        self._matrix = matrix
+        if codes is None:
+            codes = np.concatenate(
+                [self.codes(np.asarray(matrix[i:i + chunk_size]))
+                 for i in range(0, len(matrix), chunk_size)]
+            ) if len(matrix) else np.zeros((0, self.n_tables), dtype=np.int64)
+        self._table_codes = codes
+        return self
+
+    def candidates(self, vector: np.ndarray) -> np.ndarray:
+        """取得與查詢向量至少在一個表中落在相同桶的列號（只比對整數桶編號）"""
+        query_codes = self.codes(vector[None, :])[0]
+        return np.flatnonzero((np.asarray(self._table_codes) == query_codes).any(axis=1))
+
+    def query(self, vector: np.ndarray, k: int = 5, exclude: Optional[int] = None) -> list[tuple[int, float]]:
+        """
+        查詢最相似的 k 筆向量
+
+        Returns:
+            [(row, similarity), ...]，依相似度遞減
+        """
+        if self._matrix is None:
+            raise RuntimeError("索引尚未建立，請先呼叫 build()")
+
+        rows = self.candidates(vector)
+        if exclude is not None:
+            rows = rows[rows != exclude]
+        if len(rows) == 0:
+            return []
+
+        sims = np.asarray(self._matrix[rows]) @ vector
+        top = np.argsort(-sims)[:k]
+        return [(int(rows[i]), float(sims[i])) for i in top]
+
+
+def cluster_vectors(vectors: np.ndarray, threshold: float = 0.5) -> list[list[int]]:
+    """
+    以相似度門檻做連通分群（單一連結）
+
+    相似度 >= threshold 的文章視為相連，回傳所有連通分量。
+
+    Args:
+        vectors: (n, dim) 單位向量
+        threshold: 餘弦相似度門檻
+
+    Returns:
+        分群結果（每群為列索引列表），依群大小遞減
+    """
+    n = len(vectors)
+    if n == 0:
+        return []
+
+    # 分塊計算相似度，只保留超過門檻的邊（不建立 n x n 的鄰接矩陣）
+    block = max(1, CLUSTER_BLOCK_ELEMENTS // n)
+    sources, targets = [], []
+    for start in range(0, n, block):
+        rows, cols = np.nonzero((vectors[start:start + block] @ vectors.T) >= threshold)
+        rows += start
+        upper = cols > rows
+        sources.append(rows[upper])
+        targets.append(cols[upper])
+    src = np.concatenate(sources)
+    dst = np.concatenate(targets)
+
+    # 向量化標籤傳播：每輪沿邊取較小的標籤並做指標跳躍，直到收斂
+    labels = np.arange(n)
+    while True:
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, src, labels[dst])
+        np.minimum.at(new_labels, dst, labels[src])
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    clusters: dict[int, list[int]] = {}
+    for index, label in enumerate(labels):
+        clusters.setdefault(int(label), []).append(index)
+    return sorted(clusters.values(), key=len, reverse=True)
+
+
+def _read_article_text(article: dict) -> str:
+    """讀取文章標題與正文開頭作為向量化輸入"""
+    text = article["title"]
+    content_path = article.get("content_path")
+    if content_path and Path(content_path).exists():
+        body = strip_frontmatter(Path(content_path).read_text(encoding="utf-8"))
+        text = f"{text}\n{body[:MAX_TEXT_CHARS]}"
+    return text
+
+
+class ArticleEmbeddings:
+    """文章向量化流程：建立向量、查詢相關文章、每日事件分群"""
+
+    def __init__(self, data_dir: Path, embedder: Optional[Embedder] = None):
+        self.embedder = embedder or HashingEmbedder()
+        self.store = VectorStore(data_dir, self.embedder.name, self.embedder.dim)
+
+    async def embed_pending(self, batch_size: int = 64) -> int:
+        """
+        為尚未建立向量的文章建立向量
+
+        Returns:
+            int: 新增向量數量
+        """
+        pending = await get_unembedded_articles(self.embedder.name)
+        total = 0
+
+        for i in range(0, len(pending), batch_size):
+            batch = pending[i:i + batch_size]
+            vectors = self.embedder.embed([_read_article_text(a) for a in batch])
+            rows = self.store.append(vectors)
+            await save_embedding_rows(
+                self.embedder.name,
+                [(article["url"], row) for article, row in zip(batch, rows)]
+            )
+            total += len(batch)
+
+        return total
+
+    async def cluster_day(self, day: str, threshold: float = 0.5) -> list[list[dict]]:
+        """
+        將某日文章分群為新聞事件
+
+        Args:
+            day: 抓取日期 (YYYY-MM-DD)
+            threshold: 餘弦相似度門檻
+
+        Returns:
+            每個事件的文章列表，依事件大小遞減
+        """
+        articles = await get_embedded_articles(self.embedder.name, day=day)
+        if not articles:
+            return []
+
+        matrix = self.store.matrix()
+        vectors = np.asarray(matrix[[a["row"] for a in articles]])
+        clusters = cluster_vectors(vectors, threshold=threshold)
+        return [[articles[i] for i in cluster] for cluster in clusters]
+
+    async def find_related(self, url: str, k: int = 5) -> list[tuple[dict, float]]:
+        """
+        以 LSH 索引找出與指定文章最相關的文章
+
+        Returns:
+            [(article, similarity), ...]
+        """
+        articles = await get_embedded_articles(self.embedder.name)
+        by_row = {a["row"]: a for a in articles}
+        target = next((a for a in articles if a["url"] == url), None)
+        if target is None:
+            return []
+
+        matrix = self.store.matrix()
+        vector = np.asarray(matrix[target["row"]])
+
+        if len(matrix) <= EXACT_SEARCH_LIMIT:
+            sims = np.asarray(matrix) @ vector
+            sims[target["row"]] = -np.inf
+            top = np.argsort(-sims)[:k + 1]
+            results = [(int(row), float(sims[row])) for row in top if np.isfinite(sims[row])]
+        else:
+            # 桶編號已隨向量一起儲存，查詢只需比對整數並計算候選列的相似度
+            index = self.store.lsh.build(matrix, codes=self.store.codes())
+            results = index.query(vector, k=k + 1, exclude=target["row"])
+
+        return [(by_row[row], sim) for row, sim in results if row in by_row][:k]
@@ -1,13 +1,23 @@
-"""主控中心 - 整合所有模組的入口點"""
+"""主控中心 - 整合所有模組的入口點
+
+爬蟲（crawl4ai / Playwright / feedparser）、摘要與向量模組（numpy）都在對應的
+子命令內才匯入，讓 `--status` 這類輕量指令不必載入重量級依賴。
+"""
 
 import argparse
 import asyncio
 import sys
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-from .database import init_db, get_article_count
-from .scrapers import TLDRAIScraper, TheDecoderScraper, HuggingFaceBlogScraper
-from .summarizer import process_pending_summaries
+from .database import (
+    init_db,
+    get_article_count,
+    get_source_stats,
+    get_daily_stats,
+    rebuild_article_stats,
+)
 
 # 專案根目錄
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -24,6 +34,9 @@ async def sync_articles() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     (DATA_DIR / "articles").mkdir(exist_ok=True)
 
+    # 延遲匯入：只有同步時才需要載入 crawl4ai / Playwright / feedparser
+    from .scrapers import TLDRAIScraper, TheDecoderScraper, HuggingFaceBlogScraper
+
     # 初始化資料庫
     await init_db()
 
@@ -59,16 +72,107 @@ async def sync_articles() -> None:
     print("=" * 50)
 
 
-async def run_summarize() -> None:
+async def run_summarize(
+    since: Optional[str],
+    until: Optional[str],
+    source: Optional[str],
+    concurrency: int,
+    checkpoint_every: int,
+    resume: bool
+) -> None:
     """執行摘要處理"""
     print("=" * 50)
     print("AI Pulse Monitor - 摘要處理")
     print("=" * 50)
 
+    from .summarizer import process_pending_summaries
+
     # 初始化資料庫（確保表存在）
     await init_db()
 
-    await process_pending_summaries()
+    await process_pending_summaries(
+        since=since,
+        until=until,
+        source=source,
+        concurrency=concurrency,
+        checkpoint_every=checkpoint_every,
+        resume=resume
+    )
+
+
+async def run_split_items() -> None:
+    """為既有 TLDR 電子報補建單則新聞"""
+    from .tldr_items import backfill_tldr_items
+
+    await init_db()
+    count = await backfill_tldr_items()
+    print(f"[TLDR AI] 補建 {count} 則單則新聞")
+
+
+async def run_fetch_items(limit: int) -> None:
+    """抓取 TLDR 單則新聞佇列中的原文"""
+    from .scrapers import TLDRAIScraper
+
+    await init_db()
+    scraper = TLDRAIScraper(DATA_DIR)
+    count = await scraper.fetch_queued_items(limit=limit)
+    print(f"[TLDR AI] 成功抓取 {count} 則原文")
+
+
+async def run_embed(embedder: str) -> None:
+    """為尚未建立向量的文章建立向量"""
+    from .embeddings import ArticleEmbeddings, get_embedder
+
+    await init_db()
+
+    embeddings = ArticleEmbeddings(DATA_DIR, get_embedder(embedder))
+    count = await embeddings.embed_pending()
+    print(f"[Embeddings] 新增 {count} 篇文章向量（模型: {embeddings.embedder.name}）")
+
+
+async def run_cluster(day: str, threshold: float, embedder: str) -> None:
+    """將指定日期的文章分群為新聞事件"""
+    from .embeddings import ArticleEmbeddings, get_embedder
+
+    await init_db()
+
+    embeddings = ArticleEmbeddings(DATA_DIR, get_embedder(embedder))
+    await embeddings.embed_pending()
+    clusters = await embeddings.cluster_day(day, threshold=threshold)
+
+    print("=" * 50)
+    print(f"AI Pulse Monitor - {day} 新聞事件分群")
+    print("=" * 50)
+
+    if not clusters:
+        print("  當日沒有文章")
+        return
+
+    for i, cluster in enumerate(clusters, 1):
+        sources = sorted({a["source"] for a in cluster})
+        print(f"\n[事件 {i}] {len(cluster)} 篇（{', '.join(sources)}）")
+        for article in cluster:
+            print(f"  - {article['title']}")
+    print("=" * 50)
+
+
+async def run_related(url: str, embedder: str) -> None:
+    """列出與指定文章最相關的文章"""
+    from .embeddings import ArticleEmbeddings, get_embedder
+
+    await init_db()
+
+    embeddings = ArticleEmbeddings(DATA_DIR, get_embedder(embedder))
+    await embeddings.embed_pending()
+    related = await embeddings.find_related(url)
+
+    if not related:
+        print("找不到相關文章（文章不存在或尚無相似文章）")
+        return
+
+    print(f"與 {url} 相關的文章：")
+    for article, similarity in related:
+        print(f"  {similarity:.2f}  {article['title']} ({article['source']})")
 
 
 async def show_status() -> None:
@@ -82,9 +186,41 @@ async def show_status() -> None:
     print(f"  資料庫總計: {stats['total']} 篇文章")
     print(f"  已摘要: {stats['summarized']} 篇")
     print(f"  待摘要: {stats['pending']} 篇")
+
+    # 各來源統計（讀取 article_stats，不掃描 articles 表）
+    source_stats = await get_source_stats(days=7)
+    if source_stats:
+        print(f"\n{'─' * 40}")
+        print("各來源統計（近 7 日新增）")
+        print("─" * 40)
+        for row in source_stats:
+            print(
+                f"  {row['source']}: {row['total']} 篇"
+                f"（已摘要 {row['summarized']}，近 7 日 +{row['recent']}）"
+            )
+
+    daily_stats = await get_daily_stats(days=7)
+    if daily_stats:
+        daily_totals: dict[str, int] = {}
+        for row in daily_stats:
+            daily_totals[row["day"]] = daily_totals.get(row["day"], 0) + row["total"]
+        print(f"\n{'─' * 40}")
+        print("每日新增")
+        print("─" * 40)
+        for day, count in daily_totals.items():
+            print(f"  {day}: {count} 篇")
+
     print("=" * 50)
 
 
+async def run_rebuild_stats() -> None:
+    """依 articles 表重建 article_stats（統計與實際文章數不一致時使用）"""
+    await init_db()
+    await rebuild_article_stats()
+    stats = await get_article_count()
+    print(f"統計表已重建：共 {stats['total']} 篇文章（已摘要 {stats['summarized']} 篇）")
+
+
 def main() -> None:
     """CLI 主入口"""
     parser = argparse.ArgumentParser(
@@ -101,7 +237,7 @@ def main() -> None:
     parser.add_argument(
         "--summarize",
         action="store_true",
-        help="處理待摘要的文章（預留端口）"
+        help="處理待摘要的文章（預留端口），可搭配 --since/--until/--source"
     )
 
     parser.add_argument(
@@ -110,10 +246,112 @@ def main() -> None:
         help="顯示系統狀態"
     )
 
+    parser.add_argument(
+        "--rebuild-stats",
+        action="store_true",
+        help="依 articles 表重建統計表（手動修改資料庫後使用）"
+    )
+
+    parser.add_argument(
+        "--since",
+        metavar="YYYY-MM-DD",
+        help="摘要範圍起始日期（含）"
+    )
+
+    parser.add_argument(
+        "--until",
+        metavar="YYYY-MM-DD",
+        help="摘要範圍結束日期（含）"
+    )
+
+    parser.add_argument(
+        "--source",
+        help="只摘要特定來源（tldr_ai / the_decoder / huggingface_blog）"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="並行摘要數量（預設 4）"
+    )
+
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=20,
+        help="每處理幾篇寫入一次進度檢查點（預設 20）"
+    )
+
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="忽略上次的檢查點，從頭開始摘要"
+    )
+
+    parser.add_argument(
+        "--split-items",
+        action="store_true",
+        help="將既有 TLDR 電子報拆分為單則新聞"
+    )
+
+    parser.add_argument(
+        "--fetch-items",
+        action="store_true",
+        help="抓取 TLDR 單則新聞佇列中的原文"
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="--fetch-items 每次最多抓取幾則（預設 20）"
+    )
+
+    parser.add_argument(
+        "--embed",
+        action="store_true",
+        help="為文章建立向量"
+    )
+
+    parser.add_argument(
+        "--cluster",
+        action="store_true",
+        help="將指定日期的文章分群為新聞事件"
+    )
+
+    parser.add_argument(
+        "--related",
+        metavar="URL",
+        help="列出與指定文章最相關的文章"
+    )
+
+    parser.add_argument(
+        "--date",
+        default=datetime.now().strftime("%Y-%m-%d"),
+        help="分群日期 YYYY-MM-DD（預設今日）"
+    )
+
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="分群相似度門檻（預設 0.5）"
+    )
+
+    parser.add_argument(
+        "--embedder",
+        default="hashing",
+        help="向量模型：hashing（預設）、hashing:<維度> 或 st:<sentence-transformers 模型>"
+    )
+
     args = parser.parse_args()
 
     # 預設顯示幫助
-    if not any([args.sync, args.summarize, args.status]):
+    if not any([
+        args.sync, args.summarize, args.status, args.rebuild_stats, args.split_items,
+        args.fetch_items, args.embed, args.cluster, args.related
+    ]):
         parser.print_help()
         sys.exit(0)
 
@@ -121,9 +359,28 @@ def main() -> None:
         if args.sync:
             asyncio.run(sync_articles())
         elif args.summarize:
-            asyncio.run(run_summarize())
+            asyncio.run(run_summarize(
+                since=args.since,
+                until=args.until,
+                source=args.source,
+                concurrency=args.concurrency,
+                checkpoint_every=args.checkpoint_every,
+                resume=not args.restart
+            ))
         elif args.status:
             asyncio.run(show_status())
+        elif args.rebuild_stats:
+            asyncio.run(run_rebuild_stats())
+        elif args.split_items:
+            asyncio.run(run_split_items())
+        elif args.fetch_items:
+            asyncio.run(run_fetch_items(args.limit))
+        elif args.embed:
+            asyncio.run(run_embed(args.embedder))
+        elif args.cluster:
+            asyncio.run(run_cluster(args.date, args.threshold, args.embedder))
+        elif args.related:
+            asyncio.run(run_related(args.related, args.embedder))
     except KeyboardInterrupt:
         print("\n操作已取消")
         sys.exit(0)
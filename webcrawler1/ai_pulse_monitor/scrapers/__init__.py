@@ -1,7 +1,28 @@
-"""抓取引擎層 - 整合所有網站爬蟲"""
+"""抓取引擎層 - 整合所有網站爬蟲
 
-from .tldr_ai import TLDRAIScraper
-from .the_decoder import TheDecoderScraper
-from .huggingface_blog import HuggingFaceBlogScraper
+爬蟲類別在第一次存取時才匯入（PEP 562 模組 __getattr__），
+匯入單一爬蟲子模組時不會連帶載入其他爬蟲與 crawl4ai。
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tldr_ai import TLDRAIScraper
+    from .the_decoder import TheDecoderScraper
+    from .huggingface_blog import HuggingFaceBlogScraper
+
+_SCRAPER_MODULES = {
+    "TLDRAIScraper": ".tldr_ai",
+    "TheDecoderScraper": ".the_decoder",
+    "HuggingFaceBlogScraper": ".huggingface_blog",
+}
 
 __all__ = ["TLDRAIScraper", "TheDecoderScraper", "HuggingFaceBlogScraper"]
+
+
+def __getattr__(name: str):
+    if name in _SCRAPER_MODULES:
+        module = import_module(_SCRAPER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,7 +9,8 @@ from urllib.parse import urljoin
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 
-from ..database import insert_article
+from ..database import insert_article, get_queued_tldr_items, mark_tldr_item_fetched
+from ..tldr_items import split_issue
 from ..utils import clean_markdown
 
 
@@ -133,14 +134,79 @@ class TLDRAIScraper:
         content_path = await self._save_markdown(title, url, result.markdown)
 
         # 寫入資料庫
-        return await insert_article(
+        inserted = await insert_article(
             url=url,
             title=title,
             source=self.SOURCE_NAME,
             content_path=str(content_path) if content_path else None
         )
 
-    async def _save_markdown(self, title: str, url: str, content: str) -> Optional[Path]:
+        # 拆分電子報中的單則新聞（外部連結排入待抓取佇列）
+        if inserted and content_path:
+            item_count = await split_issue(url, content_path.read_text(encoding="utf-8"))
+            print(f"[TLDR AI] 拆分出 {item_count} 則新聞: {title}")
+
+        return inserted
+
+    async def fetch_queued_items(self, limit: int = 20) -> int:
+        """
+        抓取佇列中單則新聞的原文
+
+        Args:
+            limit: 本次最多抓取幾則
+
+        Returns:
+            int: 成功抓取的數量
+        """
+        queued = await get_queued_tldr_items(limit)
+        if not queued:
+            print("[TLDR AI] 沒有待抓取的單則新聞")
+            return 0
+
+        print(f"[TLDR AI] 抓取 {len(queued)} 則單則新聞原文")
+        items_dir = self.data_dir / "items"
+        items_dir.mkdir(parents=True, exist_ok=True)
+
+        fetched = 0
+        browser_config = BrowserConfig(headless=True)
+        item_config = CrawlerRunConfig(
+            word_count_threshold=50,
+            wait_until="domcontentloaded",
+            page_timeout=30000,
+            excluded_selector="nav, header, footer, .sidebar, script, style"
+        )
+
+        async with AsyncWebCrawler(config=browser_config) as crawler:
+            for item in queued:
+                try:
+                    result = await crawler.arun(url=item["link"], config=item_config)
+                    if not result.success:
+                        await mark_tldr_item_fetched(item["link"], "failed")
+                        continue
+
+                    content_path = await self._save_markdown(
+                        item["headline"], item["link"], result.markdown, directory=items_dir
+                    )
+                    await mark_tldr_item_fetched(
+                        item["link"],
+                        "fetched",
+                        str(content_path) if content_path else None
+                    )
+                    fetched += 1
+                    print(f"[TLDR AI] 抓取原文: {item['headline']}")
+                except Exception as e:
+                    await mark_tldr_item_fetched(item["link"], "failed")
+                    print(f"[TLDR AI] 原文抓取失敗 {item['headline']}: {e}")
+
+        return fetched
+
+    async def _save_markdown(
+        self,
+        title: str,
+        url: str,
+        content: str,
+        directory: Optional[Path] = None
+    ) -> Optional[Path]:
         """儲存 Markdown 內容到檔案"""
         if not content:
             return None
@@ -165,7 +231,7 @@ date: {datetime.now().strftime("%Y-%m-%d")}
         safe_title = re.sub(r'[<>:"/\\|?*]', '', title)[:50]
         date_str = datetime.now().strftime("%Y%m%d")
         filename = f"{date_str}_{safe_title}.md"
-        filepath = self.data_dir / filename
+        filepath = (directory or self.data_dir) / filename
 
         filepath.write_text(final_content, encoding="utf-8")
         return filepath
@@ -1,9 +1,17 @@
 """摘要端口預留 - AI 摘要功能模組"""
 
+import asyncio
 from pathlib import Path
 from typing import Optional
 
-from .database import get_pending_summaries, mark_as_summarized
+from .database import (
+    DB_PATH,
+    iter_pending_summaries,
+    mark_as_summarized,
+    get_summarize_checkpoint,
+    save_summarize_checkpoint,
+    clear_summarize_checkpoint,
+)
 
 
 class Summarizer:
@@ -51,26 +59,14 @@ class Summarizer:
         return None
 
 
-async def process_pending_summaries() -> int:
-    """
-    處理所有待摘要的文章
-
-    掃描資料庫中 is_summarized=0 的資料，並準備進行摘要處理。
-
-    Returns:
-        int: 處理的文章數量
-    """
-    pending_articles = await get_pending_summaries()
-
-    if not pending_articles:
-        print("[Summarizer] 沒有待處理的文章")
-        return 0
-
-    print(f"[Summarizer] 發現 {len(pending_articles)} 篇待摘要文章")
+def _job_id(since: Optional[str], until: Optional[str], source: Optional[str]) -> str:
+    """以篩選條件組成工作識別碼，相同條件的工作共用同一個檢查點"""
+    return f"{since or '*'}|{until or '*'}|{source or '*'}"
 
-    processed_count = 0
 
-    for article in pending_articles:
+async def _process_article(summarizer: Summarizer, article: dict, semaphore: asyncio.Semaphore) -> bool:
+    """處理單篇文章摘要，回傳是否已處理"""
+    async with semaphore:
         title = article["title"]
         url = article["url"]
         content_path = article["content_path"]
@@ -84,11 +80,82 @@ async def process_pending_summaries() -> int:
 
         # 模擬摘要完成（實際串接 API 後取消註解下方程式碼）
         # summary = await summarizer.summarize_article(content_path)
-        # if summary:
-        #     await mark_as_summarized(url)
-        #     processed_count += 1
+        # if not summary:
+        #     return False
+        # await mark_as_summarized(url)
+
+        return True
+
 
-        processed_count += 1
+async def process_pending_summaries(
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    source: Optional[str] = None,
+    concurrency: int = 4,
+    checkpoint_every: int = 20,
+    resume: bool = True
+) -> int:
+    """
+    處理待摘要的文章
+
+    依建立時間分批串流讀取 is_summarized=0 的資料，每批以 concurrency 個工作並行摘要，
+    整批完成後寫入檢查點。中斷後以相同條件重新執行會從檢查點續跑，不會重複處理
+    （也不會重複計費）已完成的批次。
+
+    Args:
+        since: 起始日期 YYYY-MM-DD（含）
+        until: 結束日期 YYYY-MM-DD（含）
+        source: 只處理特定來源
+        concurrency: 並行摘要數量
+        checkpoint_every: 每處理幾篇寫入一次檢查點
+        resume: 是否從上次的檢查點續跑
+
+    Returns:
+        int: 本次處理的文章數量
+    """
+    job_id = _job_id(since, until, source)
+    summarizer = Summarizer(DB_PATH.parent)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    after = None
+    previously_processed = 0
+    checkpoint = await get_summarize_checkpoint(job_id) if resume else None
+    if checkpoint:
+        after = (checkpoint["last_created_at"], checkpoint["last_url"])
+        previously_processed = checkpoint["processed"]
+        print(
+            f"[Summarizer] 從檢查點續跑（已完成 {previously_processed} 篇，"
+            f"上次處理到 {checkpoint['last_created_at']}）"
+        )
+
+    processed_count = 0
+
+    async for batch in iter_pending_summaries(
+        since=since,
+        until=until,
+        source=source,
+        after=after,
+        batch_size=checkpoint_every
+    ):
+        results = await asyncio.gather(
+            *(_process_article(summarizer, article, semaphore) for article in batch)
+        )
+        processed_count += sum(results)
+
+        # 整批完成後才推進檢查點，中斷時最多重跑未完成的這一批
+        last = batch[-1]
+        await save_summarize_checkpoint(
+            job_id,
+            last["created_at"],
+            last["url"],
+            previously_processed + processed_count
+        )
+
+    await clear_summarize_checkpoint(job_id)
+
+    if processed_count == 0 and not checkpoint:
+        print("[Summarizer] 沒有待處理的文章")
+        return 0
 
     print(f"\n[Summarizer] 共處理 {processed_count} 篇文章（摘要端口尚未串接）")
     return processed_count
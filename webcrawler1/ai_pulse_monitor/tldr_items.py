@@ -0,0 +1,118 @@
+"""TLDR 電子報拆分 - 將每期電子報拆成單則新聞"""
+
+import re
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .database import insert_tldr_items, get_tldr_issues_without_items
+from .utils import strip_frontmatter
+
+# 單則新聞標題行：可有標題符號或粗體，整行只有一個外部連結
+# 例：### [Some Headline (3 minute read)](https://example.com/post?utm_source=tldrai)
+ITEM_LINK_PATTERN = re.compile(
+    r'^\s*(?:#{1,6}\s*)?\[\s*(?:\*\*)?(?P<headline>[^\]]+?)(?:\*\*)?\s*\]\((?P<link>https?://[^)\s]+)\)\s*$'
+)
+READ_TIME_PATTERN = re.compile(r'\s*\((?:\d+\s+minute\s+read|GitHub Repo|Website)\)\s*$', re.IGNORECASE)
+SPONSOR_PATTERN = re.compile(r'\(Sponsor\)', re.IGNORECASE)
+
+# 指向 TLDR 自身的連結（訂閱、廣告、分享）不是新聞
+INTERNAL_HOSTS = ("tldr.tech", "www.tldr.tech", "a.tldrnewsletter.com")
+
+
+def _clean_link(link: str) -> str:
+    """移除追蹤參數（utm_*），讓同一篇原文在不同期數中能去重"""
+    parts = urlsplit(link)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if not k.startswith("utm_")]
+    return urlunsplit(parts._replace(query=urlencode(query), fragment=""))
+
+
+def parse_tldr_items(content: str) -> list[dict]:
+    """
+    從 TLDR 電子報 Markdown 拆出單則新聞
+
+    Args:
+        content: 電子報 Markdown（可含 Frontmatter）
+
+    Returns:
+        [{"headline", "link", "blurb"}, ...]，依出現順序
+    """
+    items: list[dict] = []
+    current: Optional[dict] = None
+    blurb_lines: list[str] = []
+
+    def flush() -> None:
+        if current is not None:
+            current["blurb"] = " ".join(blurb_lines).strip()
+            items.append(current)
+
+    for line in strip_frontmatter(content).split('\n'):
+        match = ITEM_LINK_PATTERN.match(line)
+        if match:
+            link = match.group("link")
+            if urlsplit(link).hostname in INTERNAL_HOSTS:
+                continue
+
+            flush()
+            blurb_lines = []
+            headline = match.group("headline").strip()
+            if SPONSOR_PATTERN.search(headline):
+                current = None
+                continue
+            current = {
+                "headline": READ_TIME_PATTERN.sub("", headline),
+                "link": _clean_link(link),
+            }
+            continue
+
+        if current is None:
+            continue
+
+        # 遇到其他標題代表本則結束（例如區段標題 "Headlines & Launches"）
+        if line.startswith('#'):
+            flush()
+            current = None
+            blurb_lines = []
+            continue
+
+        if line.strip():
+            blurb_lines.append(line.strip())
+
+    flush()
+
+    # 同一期中重複的連結只保留第一次出現
+    seen = set()
+    unique_items = []
+    for item in items:
+        if item["link"] not in seen:
+            seen.add(item["link"])
+            unique_items.append(item)
+    return unique_items
+
+
+async def split_issue(issue_url: str, content: str) -> int:
+    """
+    拆分單期電子報並寫入 tldr_items
+
+    沒有拆出任何新聞時也會記錄為已拆分，--split-items 不再重複解析。
+
+    Returns:
+        int: 新增的單則新聞數量
+    """
+    return await insert_tldr_items(issue_url, parse_tldr_items(content))
+
+
+async def backfill_tldr_items() -> int:
+    """
+    為尚未拆分的既有電子報補建單則新聞
+
+    Returns:
+        int: 新增的單則新聞數量
+    """
+    total = 0
+    for issue in await get_tldr_issues_without_items():
+        path = Path(issue["content_path"])
+        if not path.exists():
+            continue
+        total += await split_issue(issue["url"], path.read_text(encoding="utf-8"))
+    return total
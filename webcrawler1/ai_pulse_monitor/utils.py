@@ -121,3 +121,20 @@ def clean_markdown(content: str) -> str:
     result = re.sub(r'\n{3,}', '\n\n', result)
 
     return result.strip()
+
+
+def strip_frontmatter(content: str) -> str:
+    """
+    移除文章開頭的 YAML Frontmatter
+
+    Args:
+        content: 含 Frontmatter 的 Markdown 內容
+
+    Returns:
+        正文內容
+    """
+    if content.startswith('---\n'):
+        end = content.find('\n---', 4)
+        if end != -1:
+            return content[end + 4:].lstrip('\n')
+    return content
@@ -0,0 +1,36 @@
+"""Tests for the startup benchmark"""
+
+import sqlite3
+
+from ai_pulse_monitor import benchmark
+
+
+def test_status_benchmark_runs_against_a_copy(tmp_path):
+    """測試 --status 量測在資料庫副本上執行，不會遷移原本的資料庫"""
+    source = tmp_path / "data" / "articles.db"
+    source.parent.mkdir()
+    with sqlite3.connect(source) as conn:
+        conn.execute("""
+            CREATE TABLE articles (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                source TEXT NOT NULL,
+                content_path TEXT,
+                is_summarized INTEGER DEFAULT 0,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    copy_dir = tmp_path / "copy"
+    copy_dir.mkdir()
+    db_copy = benchmark.copy_database(source, copy_dir)
+    timings = benchmark.measure_command(["--status"], repeat=1, db_path=db_copy)
+
+    assert len(timings) == 1
+
+    def tables(path) -> set[str]:
+        with sqlite3.connect(path) as conn:
+            return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+    assert tables(source) == {"articles"}
+    assert "article_stats" in tables(db_copy)
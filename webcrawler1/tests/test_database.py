@@ -0,0 +1,133 @@
+"""Tests for the article_stats triggers and backfill"""
+
+import asyncio
+import sys
+
+import aiosqlite
+import pytest
+
+from ai_pulse_monitor import database, main
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "articles.db"
+    monkeypatch.setattr(database, "DB_PATH", path)
+    return path
+
+
+async def read_stats(path) -> dict[tuple[str, str], tuple[int, int]]:
+    async with aiosqlite.connect(path) as db:
+        async with db.execute(
+            "SELECT source, day, total, summarized FROM article_stats WHERE total > 0"
+        ) as cursor:
+            rows = await cursor.fetchall()
+    return {(source, day): (total, summarized) for source, day, total, summarized in rows}
+
+
+async def rebuilt_stats(path) -> dict[tuple[str, str], tuple[int, int]]:
+    async with aiosqlite.connect(path) as db:
+        await database._rebuild_stats(db)
+        await db.commit()
+    return await read_stats(path)
+
+
+def test_triggers_track_insert_update_and_delete(db_path):
+    """測試 INSERT / UPDATE / DELETE 觸發器維護的統計與重新計算的結果一致"""
+
+    async def run():
+        await database.init_db()
+        async with aiosqlite.connect(db_path) as db:
+            await db.executemany(
+                "INSERT INTO articles (url, title, source, created_at) VALUES (?, ?, ?, ?)",
+                [
+                    ("https://a/1", "a1", "hf_papers", "2025-06-01T08:00:00"),
+                    ("https://a/2", "a2", "hf_papers", "2025-06-01T09:00:00"),
+                    ("https://b/1", "b1", "tldr_ai", "2025-06-02T10:00:00"),
+                ],
+            )
+            await db.commit()
+        await database.mark_as_summarized("https://a/1")
+        inserted = await read_stats(db_path)
+
+        async with aiosqlite.connect(db_path) as db:
+            # 改來源與日期會從舊的 (source, day) 移到新的
+            await db.execute(
+                "UPDATE articles SET source = 'tldr_ai', created_at = '2025-06-02T11:00:00' "
+                "WHERE url = 'https://a/1'"
+            )
+            await db.execute("DELETE FROM articles WHERE url = 'https://a/2'")
+            await db.commit()
+        changed = await read_stats(db_path)
+        count = await database.get_article_count()
+        return inserted, changed, count, await rebuilt_stats(db_path)
+
+    inserted, changed, count, rebuilt = asyncio.run(run())
+
+    assert inserted == {
+        ("hf_papers", "2025-06-01"): (2, 1),
+        ("tldr_ai", "2025-06-02"): (1, 0),
+    }
+    assert changed == {("tldr_ai", "2025-06-02"): (2, 1)}
+    assert count == {"total": 2, "summarized": 1, "pending": 1}
+    assert changed == rebuilt
+
+
+def test_init_db_backfills_stats_for_existing_database(db_path):
+    """測試沒有統計表的舊資料庫在 init_db() 時回填 article_stats"""
+
+    async def run():
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("""
+                CREATE TABLE articles (
+                    url TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    content_path TEXT,
+                    is_summarized INTEGER DEFAULT 0,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            await db.executemany(
+                "INSERT INTO articles (url, title, source, is_summarized, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    ("https://a/1", "a1", "hf_papers", 1, "2025-05-30T08:00:00"),
+                    ("https://a/2", "a2", "hf_papers", 0, "2025-05-30T09:00:00"),
+                    ("https://b/1", "b1", "tldr_ai", 0, "2025-05-31T10:00:00"),
+                ],
+            )
+            await db.commit()
+
+        await database.init_db()
+        backfilled = await read_stats(db_path)
+        # 再次 init_db 不會重複回填
+        await database.init_db()
+        return backfilled, await read_stats(db_path)
+
+    backfilled, again = asyncio.run(run())
+
+    assert backfilled == {
+        ("hf_papers", "2025-05-30"): (2, 1),
+        ("tldr_ai", "2025-05-31"): (1, 0),
+    }
+    assert again == backfilled
+
+
+def test_rebuild_stats_flag_repairs_drifted_stats(db_path, monkeypatch, capsys):
+    """測試 --rebuild-stats 依 articles 表修復與實際不一致的統計"""
+
+    async def setup():
+        await database.init_db()
+        await database.insert_article("https://a/1", "a1", "hf_papers")
+        await database.insert_article("https://a/2", "a2", "hf_papers")
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("UPDATE article_stats SET total = 99, summarized = 7")
+            await db.commit()
+
+    asyncio.run(setup())
+    monkeypatch.setattr(sys, "argv", ["ai-pulse", "--rebuild-stats"])
+    main.main()
+
+    assert asyncio.run(database.get_article_count()) == {"total": 2, "summarized": 0, "pending": 2}
+    assert "共 2 篇文章" in capsys.readouterr().out
@@ -0,0 +1,110 @@
+"""Tests for article embeddings, the LSH index and event clustering"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from ai_pulse_monitor import database, embeddings
+from ai_pulse_monitor.embeddings import (
+    ArticleEmbeddings,
+    LSHIndex,
+    VectorStore,
+    cluster_vectors,
+    get_embedder,
+)
+
+TITLES = {
+    "https://example.com/gpt-5": "OpenAI releases GPT-5 model with improved reasoning",
+    "https://example.com/gpt-5-again": "OpenAI releases GPT-5 model with better reasoning",
+    "https://example.com/vectordb": "Vector database adds hybrid search support",
+    "https://example.com/humanoid": "Robotics startup raises funding for humanoid robots",
+}
+
+
+def random_vectors(n: int, dim: int, seed: int) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_cluster_vectors_groups_near_duplicate_titles():
+    """測試標題幾乎相同的文章分在同一群，其餘文章各自成群"""
+    vectors = get_embedder("hashing").embed(list(TITLES.values()))
+
+    clusters = cluster_vectors(vectors, threshold=0.5)
+
+    assert clusters[0] == [0, 1]
+    assert sorted(clusters[1:]) == [[2], [3]]
+
+
+def test_vector_store_codes_stay_aligned_across_appends_and_reopen(tmp_path):
+    """測試多次 append 與重新開啟後，桶編號檔仍與向量矩陣逐列對應"""
+    dim = 16
+    vectors = random_vectors(10, dim, seed=0)
+
+    store = VectorStore(tmp_path, "test", dim, lsh=LSHIndex(dim))
+    assert store.append(vectors[:3]) == [0, 1, 2]
+    assert store.append(vectors[3:7]) == [3, 4, 5, 6]
+
+    reopened = VectorStore(tmp_path, "test", dim, lsh=LSHIndex(dim))
+    assert reopened.append(vectors[7:]) == [7, 8, 9]
+
+    expected = reopened.lsh.codes(vectors)
+    np.testing.assert_array_equal(reopened.codes(), expected)
+
+    # 舊資料沒有桶編號檔時，第一次使用整批補齊（分塊計算結果相同）
+    reopened.codes_path.unlink()
+    reopened._sync_codes(chunk_size=4)
+    np.testing.assert_array_equal(reopened.codes(), expected)
+
+
+def test_lsh_candidates_and_query():
+    """測試候選列包含相同向量、query 排除指定列並依相似度遞減排序"""
+    dim = 16
+    vectors = random_vectors(50, dim, seed=1)
+    index = LSHIndex(dim, n_bits=4)
+
+    with pytest.raises(RuntimeError):
+        index.query(vectors[0])
+
+    index.build(vectors)
+    assert 7 in index.candidates(vectors[7])
+
+    results = index.query(vectors[7], k=3, exclude=7)
+    rows = [row for row, _ in results]
+    sims = [sim for _, sim in results]
+    assert 7 not in rows
+    assert len(results) <= 3
+    assert sims == sorted(sims, reverse=True)
+    np.testing.assert_allclose(sims, vectors[rows] @ vectors[7], rtol=1e-5)
+
+
+def test_find_related_excludes_target_and_matches_exact_search(tmp_path, monkeypatch):
+    """測試相關文章不含查詢的文章本身，且 LSH 與精確搜尋的第一名相同"""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "articles.db")
+    target = "https://example.com/gpt-5"
+
+    async def run() -> tuple[list, list]:
+        await database.init_db()
+        for url, title in TITLES.items():
+            await database.insert_article(url, title, "the_decoder")
+
+        related = ArticleEmbeddings(tmp_path, get_embedder("hashing"))
+        # 少量位元讓小語料中的近似重複必定落在同一桶
+        related.store = VectorStore(
+            tmp_path, related.embedder.name, related.embedder.dim,
+            lsh=LSHIndex(related.embedder.dim, n_bits=4),
+        )
+        assert await related.embed_pending() == len(TITLES)
+
+        exact = await related.find_related(target, k=3)
+        monkeypatch.setattr(embeddings, "EXACT_SEARCH_LIMIT", 0)
+        approximate = await related.find_related(target, k=3)
+        return exact, approximate
+
+    exact, approximate = asyncio.run(run())
+
+    for results in (exact, approximate):
+        assert target not in [article["url"] for article, _ in results]
+        assert results[0][0]["url"] == "https://example.com/gpt-5-again"
+    assert exact[0][1] == pytest.approx(approximate[0][1])
@@ -0,0 +1,129 @@
+"""Tests for streaming pending summaries and resuming from the checkpoint"""
+
+import asyncio
+
+import aiosqlite
+import pytest
+
+from ai_pulse_monitor import database, summarizer
+
+# (url, source, created_at, is_summarized)；x/1 與 x/2 建立時間相同，用來驗證 keyset 以 url 決定先後
+ARTICLES = [
+    ("https://x/1", "tldr_ai", "2025-06-01T08:00:00", 0),
+    ("https://x/2", "the_decoder", "2025-06-01T08:00:00", 0),
+    ("https://x/3", "tldr_ai", "2025-06-01T09:00:00", 1),
+    ("https://x/4", "tldr_ai", "2025-06-02T10:00:00", 0),
+    ("https://x/5", "the_decoder", "2025-06-02T23:59:59", 0),
+    ("https://x/6", "tldr_ai", "2025-06-03T00:00:00", 0),
+    ("https://x/7", "tldr_ai", "2025-06-03T12:00:00", 0),
+]
+PENDING = [url for url, _, _, summarized in ARTICLES if not summarized]
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "articles.db"
+    monkeypatch.setattr(database, "DB_PATH", path)
+    monkeypatch.setattr(summarizer, "DB_PATH", path)
+
+    async def seed():
+        await database.init_db()
+        async with aiosqlite.connect(path) as db:
+            await db.executemany(
+                "INSERT INTO articles (url, title, source, created_at, is_summarized) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(url, url, source, created_at, summarized)
+                 for url, source, created_at, summarized in ARTICLES],
+            )
+            await db.commit()
+
+    asyncio.run(seed())
+    return path
+
+
+async def collect(**kwargs) -> list[list[str]]:
+    return [
+        [article["url"] for article in batch]
+        async for batch in database.iter_pending_summaries(batch_size=2, **kwargs)
+    ]
+
+
+def test_iter_pending_summaries_pages_and_filters(db_path):
+    """測試依 (created_at, url) 分批讀取，以及 --since / --until / --source 篩選"""
+
+    async def run() -> dict[str, list[list[str]]]:
+        return {
+            "all": await collect(),
+            "after": await collect(after=("2025-06-01T08:00:00", "https://x/1")),
+            "day": await collect(since="2025-06-02", until="2025-06-02"),
+            "source": await collect(source="tldr_ai"),
+            "combined": await collect(since="2025-06-02", until="2025-06-03", source="tldr_ai"),
+        }
+
+    result = asyncio.run(run())
+
+    assert result["all"] == [
+        ["https://x/1", "https://x/2"],
+        ["https://x/4", "https://x/5"],
+        ["https://x/6", "https://x/7"],
+    ]
+    assert result["after"][0] == ["https://x/2", "https://x/4"]
+    assert result["day"] == [["https://x/4", "https://x/5"]]
+    assert result["source"] == [["https://x/1", "https://x/4"], ["https://x/6", "https://x/7"]]
+    assert result["combined"] == [["https://x/4", "https://x/6"], ["https://x/7"]]
+
+
+def test_resume_after_interruption_does_not_summarize_twice(db_path, monkeypatch):
+    """測試第二批中斷後保留第一批的檢查點，續跑時不會重複摘要任何文章"""
+    summarized: list[str] = []
+    fail_on = {"https://x/5"}
+
+    async def fake_process(_summarizer, article, semaphore) -> bool:
+        async with semaphore:
+            if article["url"] in fail_on:
+                fail_on.discard(article["url"])
+                raise RuntimeError("模擬摘要 API 中斷")
+            summarized.append(article["url"])
+            await database.mark_as_summarized(article["url"])
+            return True
+
+    monkeypatch.setattr(summarizer, "_process_article", fake_process)
+    job_id = summarizer._job_id(None, None, None)
+
+    async def run() -> tuple[dict, int, dict | None]:
+        with pytest.raises(RuntimeError):
+            await summarizer.process_pending_summaries(concurrency=1, checkpoint_every=2)
+        checkpoint = await database.get_summarize_checkpoint(job_id)
+        resumed = await summarizer.process_pending_summaries(concurrency=1, checkpoint_every=2)
+        return checkpoint, resumed, await database.get_summarize_checkpoint(job_id)
+
+    checkpoint, resumed, leftover = asyncio.run(run())
+
+    # 只有完整跑完的第一批推進了檢查點
+    assert (checkpoint["last_url"], checkpoint["processed"]) == ("https://x/2", 2)
+    assert resumed == 3
+    assert summarized == PENDING
+    assert leftover is None
+
+
+def test_restart_ignores_checkpoint(db_path, monkeypatch):
+    """測試 --restart（resume=False）忽略檢查點，從頭處理所有待摘要文章"""
+    processed: list[str] = []
+
+    async def fake_process(_summarizer, article, semaphore) -> bool:
+        processed.append(article["url"])
+        return True
+
+    monkeypatch.setattr(summarizer, "_process_article", fake_process)
+    job_id = summarizer._job_id(None, None, None)
+
+    async def run(resume: bool) -> int:
+        await database.save_summarize_checkpoint(job_id, "2025-06-01T08:00:00", "https://x/2", 2)
+        return await summarizer.process_pending_summaries(checkpoint_every=2, resume=resume)
+
+    assert asyncio.run(run(resume=True)) == 4
+    assert processed == PENDING[2:]
+
+    processed.clear()
+    assert asyncio.run(run(resume=False)) == len(PENDING)
+    assert processed == PENDING
@@ -0,0 +1,88 @@
+"""Tests for splitting TLDR AI issues into items"""
+
+import asyncio
+from pathlib import Path
+
+import aiosqlite
+
+from ai_pulse_monitor import database, tldr_items
+from ai_pulse_monitor.tldr_items import backfill_tldr_items, parse_tldr_items, split_issue
+
+ISSUE = (Path(__file__).parent / "fixtures" / "tldr_ai_issue.md").read_text(encoding="utf-8")
+ISSUE_URL = "https://tldr.tech/ai/2025-06-02"
+
+
+def test_parse_tldr_items():
+    """測試拆出單則新聞：去除閱讀時間與 utm 參數，略過 Sponsor、內部連結與重複連結"""
+    items = parse_tldr_items(ISSUE)
+
+    assert [item["headline"] for item in items] == [
+        "New Open Model Tops Coding Benchmarks",
+        "Vector Database Adds Hybrid Search",
+        "Why Long Context Is Hard",
+    ]
+    assert [item["link"] for item in items] == [
+        "https://example.com/model?ref=news",
+        "https://github.com/example/vectordb",
+        "https://blog.example.com/long-context",
+    ]
+    assert items[0]["blurb"] == (
+        "A new open-weights model beats larger proprietary models on several coding benchmarks."
+    )
+
+
+def test_split_issue_dedupes_links_across_issues(tmp_path, monkeypatch):
+    """測試寫入 tldr_items 後，同一則新聞在下一期出現時不重複新增"""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "articles.db")
+
+    async def run() -> tuple[int, int, list[tuple]]:
+        await database.init_db()
+        await database.insert_article(ISSUE_URL, "TLDR AI 2025-06-02", "tldr_ai")
+        first = await split_issue(ISSUE_URL, ISSUE)
+        again = await split_issue("https://tldr.tech/ai/2025-06-03", ISSUE)
+        async with aiosqlite.connect(database.DB_PATH) as db:
+            async with db.execute(
+                "SELECT position, fetch_status, issue_url FROM tldr_items ORDER BY position"
+            ) as cursor:
+                rows = await cursor.fetchall()
+        return first, again, rows
+
+    first, again, rows = asyncio.run(run())
+
+    assert (first, again) == (3, 0)
+    assert rows == [(i, "queued", ISSUE_URL) for i in range(3)]
+
+
+def test_backfill_skips_issues_already_split(tmp_path, monkeypatch):
+    """測試每則新聞都與前一期重複的電子報拆分一次後，--split-items 不再重新解析"""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "articles.db")
+    repeat_url = "https://tldr.tech/ai/2025-06-03"
+    paths = {}
+    for url in (ISSUE_URL, repeat_url):
+        paths[url] = tmp_path / f"{url.rsplit('/', 1)[-1]}.md"
+        paths[url].write_text(ISSUE, encoding="utf-8")
+
+    reparsed = []
+    original_parse = tldr_items.parse_tldr_items
+
+    def recording_parse(content: str) -> list[dict]:
+        reparsed.append(content)
+        return original_parse(content)
+
+    async def run() -> tuple[int, list[dict], int]:
+        await database.init_db()
+        for url, path in paths.items():
+            await database.insert_article(url, url, "tldr_ai", str(path))
+        first = await backfill_tldr_items()
+        reparsed.clear()
+        monkeypatch.setattr(tldr_items, "parse_tldr_items", recording_parse)
+        pending = await database.get_tldr_issues_without_items()
+        second = await backfill_tldr_items()
+        return first, pending, second
+
+    first, pending, second = asyncio.run(run())
+
+    assert first == 3
+    assert pending == []
+    assert second == 0
+    assert reparsed == []